@@ -1,54 +1,434 @@
-from flask import Flask, render_template, request, redirect
+from flask import Flask, render_template, request, redirect, g, jsonify, abort, session
 import sqlite3
+import functools
+import gzip
 import os
+import queue
+import sys
+import time
+import zlib
+
+# Gemeinsames Paket ticket_common liegt in der Repo‑Wurzel
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
+
+from ticket_common.query_log import ProfiledConnection, QueryLog  # noqa: E402
+from werkzeug.security import check_password_hash, generate_password_hash
 
 app = Flask(__name__)
+# Ohne TICKET_SECRET_KEY gelten Logins nur bis zum Neustart (und nur in einem Prozess)
+app.secret_key = os.environ.get("TICKET_SECRET_KEY") or os.urandom(24)
 DB_PATH = "data/tickets.db"
+# Laufzeiten je Statement/Route; Schwelle fürs Slow‑Log per Umgebungsvariable
+QUERY_LOG = QueryLog(slow_ms=float(os.environ.get("TICKET_DB_SLOW_QUERY_MS", 100)))
+
+# Verbindungen je Worker‑Prozess wiederverwenden; höchstens so viele bleiben offen
+POOL_SIZE = int(os.environ.get("TICKET_DB_POOL_SIZE", 8))
+BUSY_TIMEOUT_MS = int(os.environ.get("TICKET_DB_BUSY_TIMEOUT_MS", 5000))
+_pool = queue.LifoQueue()
+
+def connect():
+    conn = sqlite3.connect(DB_PATH, factory=ProfiledConnection, check_same_thread=False)
+    conn.query_log = QUERY_LOG
+    conn.row_factory = sqlite3.Row
+    # Einmal pro Verbindung statt pro Request; WAL selbst setzt init_db() dauerhaft
+    conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    return conn
+
+def get_db():
+    """Verbindung für diesen Request (App‑Kontext); teardown gibt sie zurück."""
+    if "db" not in g:
+        try:
+            g.db = _pool.get_nowait()
+        except queue.Empty:
+            g.db = connect()
+    return g.db
+
+@app.teardown_appcontext
+def release_db(exc):
+    conn = g.pop("db", None)
+    if conn is None:
+        return
+    if conn.in_transaction:
+        conn.rollback()
+    if _pool.qsize() < POOL_SIZE:
+        _pool.put(conn)
+    else:
+        conn.close()
+
+@app.before_request
+def start_timer():
+    g.started = time.perf_counter()
+
+@app.after_request
+def record_route(response):
+    if request.url_rule is not None and "started" in g:
+        QUERY_LOG.record("route", f"{request.method} {request.url_rule.rule}", time.perf_counter() - g.started)
+    return response
 
 def init_db():
     if not os.path.exists("data"):
         os.mkdir("data")
     conn = sqlite3.connect(DB_PATH)
+    # WAL: Leser blockieren Schreiber nicht mehr; bleibt in der Datei gespeichert
+    conn.execute("PRAGMA journal_mode = WAL")
     c = conn.cursor()
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS users (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT NOT NULL UNIQUE,
+            password TEXT NOT NULL,
+            role TEXT NOT NULL CHECK(role IN ('admin', 'support', 'user'))
+        )
+    """)
     c.execute("""
         CREATE TABLE IF NOT EXISTS tickets (
             id INTEGER PRIMARY KEY,
             title TEXT,
+            description TEXT,
             category TEXT,
             priority TEXT,
             status TEXT,
-            comment TEXT
+            comment TEXT,
+            user_id INTEGER REFERENCES users(id)
         )
     """)
+    # Ältere Datenbanken: Spalten aus init_db.py nachziehen
+    columns = {row[1] for row in c.execute("PRAGMA table_info(tickets)")}
+    for name, decl in (("description", "TEXT"), ("user_id", "INTEGER REFERENCES users(id)")):
+        if name not in columns:
+            c.execute(f"ALTER TABLE tickets ADD COLUMN {name} {decl}")
+    # Eigene Tickets eines Anwenders, neueste zuerst
+    c.execute("CREATE INDEX IF NOT EXISTS idx_tickets_user ON tickets(user_id)")
+    # Filter der JSON‑API; die Sortierung nach id liefert der Index gleich mit
+    c.execute("CREATE INDEX IF NOT EXISTS idx_tickets_status ON tickets(status)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_tickets_priority ON tickets(priority)")
+    # Änderungszähler für ETags; epoch unterscheidet neu angelegte Datenbanken
+    c.executescript("""
+        CREATE TABLE IF NOT EXISTS table_versions (
+            name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0,
+            epoch TEXT NOT NULL DEFAULT (lower(hex(randomblob(4))))
+        );
+        INSERT OR IGNORE INTO table_versions (name) VALUES ('tickets');
+        CREATE TRIGGER IF NOT EXISTS tickets_version_ai AFTER INSERT ON tickets BEGIN
+            UPDATE table_versions SET version = version + 1 WHERE name = 'tickets';
+        END;
+        CREATE TRIGGER IF NOT EXISTS tickets_version_au AFTER UPDATE ON tickets BEGIN
+            UPDATE table_versions SET version = version + 1 WHERE name = 'tickets';
+        END;
+        CREATE TRIGGER IF NOT EXISTS tickets_version_ad AFTER DELETE ON tickets BEGIN
+            UPDATE table_versions SET version = version + 1 WHERE name = 'tickets';
+        END;
+    """)
+    # Zähler je Anwender/Status/Priorität/Kategorie für die Dashboards, per Trigger
+    # gepflegt – die Dashboards lesen nie die ganze Ticket‑Tabelle
+    key = "COALESCE({0}.user_id, 0), COALESCE({0}.status, ''), COALESCE({0}.priority, ''), COALESCE({0}.category, '')"
+    match = (
+        "user_id = COALESCE({0}.user_id, 0) AND status = COALESCE({0}.status, '') "
+        "AND priority = COALESCE({0}.priority, '') AND category = COALESCE({0}.category, '')"
+    )
+    created = not c.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'ticket_counts'"
+    ).fetchone()
+    c.executescript(f"""
+        CREATE TABLE IF NOT EXISTS ticket_counts (
+            user_id INTEGER NOT NULL,
+            status TEXT NOT NULL,
+            priority TEXT NOT NULL,
+            category TEXT NOT NULL,
+            n INTEGER NOT NULL,
+            PRIMARY KEY (user_id, status, priority, category)
+        ) WITHOUT ROWID;
+        CREATE TRIGGER IF NOT EXISTS ticket_counts_ai AFTER INSERT ON tickets BEGIN
+            INSERT INTO ticket_counts VALUES ({key.format("new")}, 1)
+            ON CONFLICT DO UPDATE SET n = n + 1;
+        END;
+        CREATE TRIGGER IF NOT EXISTS ticket_counts_ad AFTER DELETE ON tickets BEGIN
+            UPDATE ticket_counts SET n = n - 1 WHERE {match.format("old")};
+        END;
+        CREATE TRIGGER IF NOT EXISTS ticket_counts_au
+        AFTER UPDATE OF user_id, status, priority, category ON tickets BEGIN
+            UPDATE ticket_counts SET n = n - 1 WHERE {match.format("old")};
+            INSERT INTO ticket_counts VALUES ({key.format("new")}, 1)
+            ON CONFLICT DO UPDATE SET n = n + 1;
+        END;
+    """)
+    if created:
+        c.execute(f"""
+            INSERT INTO ticket_counts
+            SELECT {key.format("tickets")}, COUNT(*) FROM tickets GROUP BY 1, 2, 3, 4
+        """)
     conn.commit()
     conn.close()
 
+def add_user(conn, username, password, role):
+    conn.execute(
+        "INSERT INTO users (username, password, role) VALUES (?, ?, ?)",
+        (username, generate_password_hash(password), role),
+    )
+
 @app.route("/")
 def index():
-    conn = sqlite3.connect(DB_PATH)
-    tickets = conn.execute("SELECT * FROM tickets").fetchall()
-    conn.close()
+    tickets = get_db().execute("SELECT * FROM tickets").fetchall()
     return render_template("index.html", tickets=tickets)
 
 @app.route("/create", methods=["POST"])
 def create():
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_db()
     conn.execute(
         "INSERT INTO tickets (title, category, priority, status) VALUES (?, ?, ?, 'Neu')",
         (request.form["title"], request.form["category"], request.form["priority"])
     )
     conn.commit()
-    conn.close()
     return redirect("/")
 
 @app.route("/update/<int:id>")
 def update(id):
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_db()
     conn.execute("UPDATE tickets SET status='Erledigt' WHERE id=?", (id,))
     conn.commit()
-    conn.close()
     return redirect("/")
 
+# ---- Login ----
+def login_required(*roles):
+    """Nur angemeldete Nutzer (mit einer der ``roles``, falls angegeben)."""
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            if "user_id" not in session:
+                return redirect("/login")
+            if roles and session["role"] not in roles:
+                abort(403)
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
+
+@app.route("/login", methods=["GET", "POST"])
+def login():
+    if request.method == "POST":
+        user = get_db().execute(
+            "SELECT id, username, password, role FROM users WHERE username = ?",
+            (request.form.get("username", ""),),
+        ).fetchone()
+        if user and check_password_hash(user["password"], request.form.get("password", "")):
+            session.clear()
+            session.update(user_id=user["id"], username=user["username"], role=user["role"])
+            return redirect("/dashboard")
+        return render_template("login.html", error="Falscher Benutzername oder Passwort."), 401
+    return render_template("login.html")
+
+@app.route("/logout")
+def logout():
+    session.clear()
+    return redirect("/login")
+
+# ---- Dashboards ----
+DASHBOARD_PAGE_SIZE = 25
+OPEN_STATUSES = ("Neu", "In Bearbeitung")
+
+def dashboard_counts(conn, user_id=None):
+    """Kennzahlen je Status/Priorität/Kategorie (und offene Tickets je Anwender)
+    in einer Abfrage über ``ticket_counts`` – unabhängig von der Tabellengröße."""
+    own = "WHERE user_id = :user" if user_id is not None else ""
+    parts = [
+        f"SELECT '{dim}' AS dim, {dim} AS label, SUM(n) AS n FROM ticket_counts {own} GROUP BY {dim}"
+        for dim in ("status", "priority", "category")
+    ]
+    if user_id is None:
+        parts.append(
+            "SELECT 'queue' AS dim, COALESCE(users.username, '–') AS label, SUM(n) AS n "
+            "FROM ticket_counts LEFT JOIN users ON users.id = ticket_counts.user_id "
+            "WHERE status != 'Erledigt' GROUP BY ticket_counts.user_id"
+        )
+    counts = {"status": [], "priority": [], "category": [], "queue": []}
+    for row in conn.execute(" UNION ALL ".join(parts) + " ORDER BY 1, 3 DESC", {"user": user_id}):
+        if row["n"]:
+            counts[row["dim"]].append((row["label"] or "–", row["n"]))
+    return counts
+
+def ticket_page(conn, column=None, values=()):
+    """Eine Seite Tickets, neueste zuerst (Keyset über ``?after=<id>``).
+
+    Mit ``column``/``values`` je Wert eine eigene Teilabfrage über den Index
+    (column, id) – kein Sortieren aller Treffer, auch bei großem Rückstand.
+    """
+    after = request.args.get("after", type=int)
+    fields = "id, title, description, category, priority, status, comment"
+    limit = DASHBOARD_PAGE_SIZE + 1
+    keyset = " AND id < :after" if after is not None else ""
+    params = {"after": after, "limit": limit}
+    if column is None:
+        where = " WHERE id < :after" if after is not None else ""
+        sql = f"SELECT {fields} FROM tickets{where} ORDER BY id DESC LIMIT :limit"
+    else:
+        parts = []
+        for i, value in enumerate(values):
+            params[f"v{i}"] = value
+            parts.append(
+                f"SELECT * FROM (SELECT {fields} FROM tickets WHERE {column} = :v{i}{keyset} "
+                "ORDER BY id DESC LIMIT :limit)"
+            )
+        sql = " UNION ALL ".join(parts) + " ORDER BY id DESC LIMIT :limit"
+    rows = conn.execute(sql, params).fetchall()
+    next_after = rows[DASHBOARD_PAGE_SIZE - 1]["id"] if len(rows) > DASHBOARD_PAGE_SIZE else None
+    return rows[:DASHBOARD_PAGE_SIZE], next_after
+
+@app.route("/dashboard")
+@login_required()
+def dashboard():
+    conn = get_db()
+    role = session["role"]
+    if role == "user":
+        counts = dashboard_counts(conn, session["user_id"])
+        tickets, next_after = ticket_page(conn, "user_id", (session["user_id"],))
+        return render_template("dashboard_user.html", counts=counts, tickets=tickets, next_after=next_after)
+    counts = dashboard_counts(conn)
+    if role == "support":
+        tickets, next_after = ticket_page(conn, "status", OPEN_STATUSES)
+        return render_template("dashboard_support.html", counts=counts, tickets=tickets, next_after=next_after)
+    users = conn.execute("SELECT id, username, role FROM users ORDER BY username").fetchall()
+    tickets, next_after = ticket_page(conn)
+    return render_template(
+        "dashboard_admin.html", counts=counts, users=users, tickets=tickets, next_after=next_after
+    )
+
+@app.route("/create_ticket", methods=["POST"])
+@login_required("user", "admin")
+def create_ticket():
+    title = request.form.get("title", "").strip()
+    if not title:
+        abort(400)
+    conn = get_db()
+    conn.execute(
+        """
+        INSERT INTO tickets (title, description, category, priority, status, user_id)
+        VALUES (?, ?, ?, ?, 'Neu', ?)
+        """,
+        (
+            title,
+            request.form.get("description", ""),
+            request.form.get("category", ""),
+            request.form.get("priority", "Niedrig"),
+            session["user_id"],
+        ),
+    )
+    conn.commit()
+    return redirect("/dashboard")
+
+@app.route("/update_ticket/<int:id>", methods=["POST"])
+@login_required("support", "admin")
+def update_ticket(id):
+    status = request.form.get("status")
+    if status not in (*OPEN_STATUSES, "Erledigt"):
+        abort(400)
+    conn = get_db()
+    conn.execute(
+        "UPDATE tickets SET status = ?, comment = COALESCE(NULLIF(?, ''), comment) WHERE id = ?",
+        (status, request.form.get("comment", ""), id),
+    )
+    conn.commit()
+    return redirect("/dashboard")
+
+# ---- JSON‑API ----
+API_FIELDS = ("id", "title", "description", "category", "priority", "status", "comment", "user_id")
+API_FILTERS = ("status", "priority")
+API_PAGE_SIZE = 50
+API_MAX_PAGE_SIZE = 500
+# Kleinere Antworten lohnen das Komprimieren nicht
+GZIP_MIN_BYTES = 1024
+
+def api_error(message, status=400):
+    return jsonify({"error": message}), status
+
+def table_version(conn, name):
+    row = conn.execute("SELECT version, epoch FROM table_versions WHERE name = ?", (name,)).fetchone()
+    return f"{row['epoch']}-{row['version']}"
+
+def compressed(response):
+    """Antwort mit gzip packen, wenn der Client es annimmt und es sich lohnt."""
+    response.headers.add("Vary", "Accept-Encoding")
+    if "gzip" not in request.headers.get("Accept-Encoding", "") or len(response.data) < GZIP_MIN_BYTES:
+        return response
+    response.set_data(gzip.compress(response.data, compresslevel=5))
+    response.headers["Content-Encoding"] = "gzip"
+    return response
+
+@app.route("/api/tickets")
+def api_tickets():
+    """Tickets als JSON, neueste zuerst, seitenweise per ``after=<id>``.
+
+    Parameter: ``fields=id,title,…``, ``status``/``priority`` (mehrfach oder
+    kommagetrennt), ``limit`` (max. ``API_MAX_PAGE_SIZE``), ``after``. Das ETag
+    hängt am Änderungszähler der Tabelle: ohne Änderung kostet ``If-None-Match``
+    eine Schlüssel‑Abfrage und liefert 304.
+    """
+    fields = [f for f in request.args.get("fields", ",".join(API_FIELDS)).split(",") if f]
+    unknown = set(fields) - set(API_FIELDS)
+    if unknown:
+        return api_error(f"Unbekannte Felder: {', '.join(sorted(unknown))}")
+    if "id" not in fields:
+        # id ist der Cursor der nächsten Seite
+        fields.insert(0, "id")
+    try:
+        limit = int(request.args.get("limit", API_PAGE_SIZE))
+        after = int(request.args["after"]) if request.args.get("after") else None
+    except ValueError:
+        return api_error("limit und after müssen Zahlen sein")
+    if not 1 <= limit <= API_MAX_PAGE_SIZE:
+        return api_error(f"limit muss zwischen 1 und {API_MAX_PAGE_SIZE} liegen")
+
+    conn = get_db()
+    # Version vor den Daten lesen: im Zweifel ein Abruf zu viel, nie ein veraltetes 304
+    args = sorted((k, v) for k, v in request.args.items(multi=True))
+    etag = f"{table_version(conn, 'tickets')}-{zlib.crc32(repr(args).encode()):08x}"
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+        response.set_etag(etag, weak=True)
+        return response
+
+    where, params = [], []
+    for name in API_FILTERS:
+        values = [v for arg in request.args.getlist(name) for v in arg.split(",") if v]
+        if values:
+            where.append(f"{name} IN ({', '.join('?' * len(values))})")
+            params += values
+    if after is not None:
+        where.append("id < ?")
+        params.append(after)
+    sql = f"SELECT {', '.join(fields)} FROM tickets"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " ORDER BY id DESC LIMIT ?"
+    # Eine Zeile mehr lesen, um zu wissen, ob es eine nächste Seite gibt
+    rows = conn.execute(sql, (*params, limit + 1)).fetchall()
+    tickets = [dict(row) for row in rows[:limit]]
+    next_after = tickets[-1]["id"] if len(rows) > limit else None
+
+    response = jsonify({"tickets": tickets, "next": next_after})
+    response.set_etag(etag, weak=True)
+    response.headers["Cache-Control"] = "no-cache"
+    return compressed(response)
+
+def stats_allowed():
+    # Slow‑Log enthält SQL samt Parametern (Titel, Beschreibungen): nur für Admins
+    # oder lokal, außer TICKET_QUERY_STATS_REMOTE=1
+    if session.get("role") == "admin" or os.environ.get("TICKET_QUERY_STATS_REMOTE") == "1":
+        return True
+    return request.remote_addr in ("127.0.0.1", "::1")
+
+@app.route("/admin/queries", methods=["GET", "POST"])
+def query_stats():
+    # Perzentile je Statement/Route und Slow‑Log; POST mit reset=1 leert die Messwerte
+    if not stats_allowed():
+        abort(403)
+    snapshot = QUERY_LOG.snapshot()
+    if request.method == "POST" and request.form.get("reset"):
+        QUERY_LOG.reset()
+    return jsonify(snapshot)
+
 if __name__ == "__main__":
     init_db()
     app.run(host="0.0.0.0", port=5000)
@@ -1,29 +1,11 @@
 import sqlite3
 
-db = sqlite3.connect("tickets.db")
-cur = db.cursor()
+from app import DB_PATH, add_user, init_db
 
-cur.execute("""
-CREATE TABLE users (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    username TEXT,
-    password TEXT,
-    role TEXT
-)
-""")
+# Schema wie app.py (data/tickets.db), dazu die Start‑Konten
+init_db()
 
-cur.execute("""
-CREATE TABLE tickets (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    title TEXT,
-    description TEXT,
-    category TEXT,
-    priority TEXT,
-    status TEXT,
-    comment TEXT,
-    user_id INTEGER
-)
-""")
+db = sqlite3.connect(DB_PATH)
 
 users = [
     ("admin", "admin", "admin"),
@@ -31,7 +13,9 @@ users = [
     ("user", "user", "user")
 ]
 
-cur.executemany("INSERT INTO users VALUES (NULL, ?, ?, ?)", users)
+for username, password, role in users:
+    if not db.execute("SELECT 1 FROM users WHERE username = ?", (username,)).fetchone():
+        add_user(db, username, password, role)
 
 db.commit()
 db.close()
@@ -1,25 +1,31 @@
 # -*- coding: utf-8 -*-
 """Ticket‑System für Schacht GmbH – mit Kanban‑Board und minimaler Streamlit‑API."""
 
-import datetime
-import hashlib
+import json
 import os
-import sqlite3
+import time
+
 import streamlit as st
 
+import render_profiler
+from dispatch import CATEGORIES, get_dispatcher
+from jobs import JobQueue, Worker
+from render_profiler import section
+from reporting import BUCKET_SECONDS, WINDOWS, Reports
+from ticket_store import (
+    PERCENTILES,
+    PermissionEvaluator,
+    TicketDatabase,
+    TicketStoreError,
+)
+
+# Live‑Aktualisierung des Boards in Sekunden (0 = nur bei Interaktion)
+BOARD_LIVE_SECONDS = float(os.environ.get("TICKET_BOARD_LIVE_SECONDS", "5"))
 
 # -------------------------------------------------
 # Seite‑Konfiguration und CSS
 # -------------------------------------------------
-st.set_page_config(
-    page_title="Schacht GmbH Ticket‑System",
-    page_icon="♟️",
-    layout="wide",
-    initial_sidebar_state="expanded",
-)
-
-st.markdown(
-    """
+CSS = """
 <style>
     body { color: white; background-color: #1E1E1E; font-family: 'Arial', sans-serif; }
     .stTextInput input { background-color: #333; color: white; border-radius: 4px; padding: 8px; border: 1px solid #444; }
@@ -104,25 +110,23 @@ st.markdown(
     }
     .stExpanderContent { background-color: inherit; }
 </style>
-""",
-    unsafe_allow_html=True,
-)
+"""
+
+
+def _configure_page() -> None:
+    """Seiten‑Konfiguration und CSS – erst in main(), damit der Import keine Seiteneffekte hat."""
+    st.set_page_config(
+        page_title="Schacht GmbH Ticket‑System",
+        page_icon="♟️",
+        layout="wide",
+        initial_sidebar_state="expanded",
+    )
+    st.markdown(CSS, unsafe_allow_html=True)
+
 
 # -------------------------------------------------
 # Hilfs‑Funktionen
 # -------------------------------------------------
-def get_sentiment(text: str) -> str:
-    """Entscheidet per einfacher Wortliste, ob ein Ticket positiv, negativ oder neutral klingt."""
-    positive = ["glücklich", "super", "gut", "freut", "freude", "erfreut", "positiv"]
-    negative = ["böse", "schlecht", "problem", "fehler", "frust", "negativ", "möglicherweise"]
-    lowered = text.lower()
-    if any(w in lowered for w in positive):
-        return "😊"
-    if any(w in lowered for w in negative):
-        return "😡"
-    return "😐"
-
-
 def _status_badge_html(status: str) -> str:
     return f'<span class="status-badge {status.replace(" ", "-")}">{status}</span>'
 
@@ -131,372 +135,6 @@ def _priority_badge_html(priority: str) -> str:
     return f'<span class="priority-badge {priority.lower()}">{priority}</span>'
 
 
-# -------------------------------------------------
-# SQLite‑Wrapper‑Klasse
-# -------------------------------------------------
-class TicketDatabase:
-    def __init__(self, db_path: str = "data/tickets.db"):
-        self.db_path = db_path
-        db_dir = os.path.dirname(self.db_path)
-        if db_dir and not os.path.isdir(db_dir):
-            os.makedirs(db_dir, exist_ok=True)
-
-        try:
-            self.conn = sqlite3.connect(self.db_path)
-            self.conn.row_factory = sqlite3.Row
-            self.cursor = self.conn.cursor()
-            self.cursor.execute("PRAGMA foreign_keys = ON")
-            self._create_schema()
-        except sqlite3.Error as e:
-            st.error(f"Konnte Datenbank nicht öffnen: {e}")
-            raise
-
-    def close(self):
-        """Datenbank sauber schließen."""
-        try:
-            self.conn.close()
-        except Exception:
-            pass
-
-    # ---- Schema ----
-    def _create_schema(self):
-        """Tabellen créer und ggf. fehlende Spalten ergänzen."""
-        # Users
-        self.cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS users (
-                username TEXT PRIMARY KEY,
-                password_hash TEXT NOT NULL,
-                role TEXT NOT NULL CHECK(role IN ('Anwender', 'Support', 'Administrator'))
-            )
-            """
-        )
-
-        # Tickets
-        self.cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS tickets (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                title TEXT NOT NULL,
-                description TEXT,
-                priority TEXT NOT NULL CHECK(priority IN ('Niedrig', 'Mittel', 'Hoch')),
-                category TEXT NOT NULL CHECK(category IN ('Bug', 'Feature', 'Support')),
-                status TEXT NOT NULL CHECK(status IN ('Neu', 'In Bearbeitung', 'Erledigt')),
-                created_at DATETIME NOT NULL,
-                updated_at DATETIME NOT NULL,
-                created_by TEXT NOT NULL,
-                last_updated_by TEXT,
-                feedback TEXT,
-                support_feedback TEXT,
-                internal_notes TEXT DEFAULT NULL,
-                sentiment TEXT DEFAULT NULL,
-                assigned_to TEXT,
-                FOREIGN KEY (created_by) REFERENCES users(username),
-                FOREIGN KEY (last_updated_by) REFERENCES users(username),
-                FOREIGN KEY (assigned_to) REFERENCES users(username)
-            )
-            """
-        )
-        self.conn.commit()
-
-        # Add extra columns only if they do not yet exist
-        for col in ("support_feedback", "internal_notes", "sentiment"):
-            self.cursor.execute(
-                "SELECT * FROM pragma_table_info('tickets') WHERE name = ?", (col,)
-            )
-            if not self.cursor.fetchone():
-                self.cursor.execute(f"ALTER TABLE tickets ADD COLUMN {col} TEXT DEFAULT NULL")
-                self.conn.commit()
-
-        # Ensure default admin user exists
-        self.cursor.execute("SELECT username FROM users WHERE username = ?", ("admin",))
-        if not self.cursor.fetchone():
-            self.cursor.execute(
-                "INSERT INTO users (username, password_hash, role) VALUES (?, ?, ?)",
-                ("admin", hashlib.sha256(b"admin123").hexdigest(), "Administrator"),
-            )
-            self.conn.commit()
-
-    # ---- CRUD ----
-    def add_user(self, username: str, password: str, role: str) -> bool:
-        if not username.strip() or not password.strip():
-            st.error("Benutzername und Passwort dürfen nicht leer sein.")
-            return False
-        pwd_hash = hashlib.sha256(password.encode()).hexdigest()
-        try:
-            self.cursor.execute(
-                "INSERT INTO users (username, password_hash, role) VALUES (?, ?, ?)",
-                (username, pwd_hash, role),
-            )
-            self.conn.commit()
-            return True
-        except sqlite3.IntegrityError:
-            st.error("Benutzer existiert bereits.")
-            return False
-        except sqlite3.Error as e:
-            st.error(f"Datenbankfehler (Benutzer anlegen): {e}")
-            return False
-
-    def check_user(self, username: str, password: str) -> str | None:
-        if not username.strip() or not password.strip():
-            return None
-        pwd_hash = hashlib.sha256(password.encode()).hexdigest()
-        try:
-            self.cursor.execute(
-                "SELECT role FROM users WHERE username = ? AND password_hash = ?",
-                (username, pwd_hash),
-            )
-            row = self.cursor.fetchone()
-            return row["role"] if row else None
-        except sqlite3.Error as e:
-            st.error(f"Datenbankfehler (Benutzer prüfen): {e}")
-            return None
-
-    def remove_user(self, username: str) -> bool:
-        """Löschen nur, wenn die Person nicht mehr in Tickets vorkommt. """
-        self.cursor.execute(
-            """
-            SELECT COUNT(*) FROM tickets 
-            WHERE created_by = ? 
-               OR last_updated_by = ? 
-               OR assigned_to = ?
-            """,
-            (username, username, username),
-        )
-        if self.cursor.fetchone()[0] > 0:
-            st.error("Benutzer ist an einem Ticket gebunden und kann nicht gelöscht werden.")
-            return False
-        try:
-            self.cursor.execute("DELETE FROM users WHERE username = ?", (username,))
-            self.conn.commit()
-            return True
-        except sqlite3.Error as e:
-            st.error(f"Datenbankfehler (Benutzer löschen): {e}")
-            return False
-
-    def add_ticket(
-        self,
-        title: str,
-        description: str,
-        priority: str,
-        category: str,
-        created_by: str,
-    ) -> int | None:
-        if not title.strip():
-            st.error("Titel darf nicht leer sein.")
-            return None
-        full_text = f"{title} {description}".strip()
-        sentiment = get_sentiment(full_text)
-        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        try:
-            self.cursor.execute(
-                """
-                INSERT INTO tickets (
-                    title, description, priority, category, status,
-                    created_at, updated_at, created_by,
-                    support_feedback, internal_notes, sentiment
-                ) VALUES (?, ?, ?, ?, 'Neu', ?, ?, ?, ?, NULL, ?)
-                """,
-                (
-                    title,
-                    description,
-                    priority,
-                    category,
-                    now,
-                    now,
-                    created_by,
-                    None,
-                    sentiment,
-                ),
-            )
-            self.conn.commit()
-            return self.cursor.lastrowid
-        except sqlite3.Error as e:
-            st.error(f"Datenbankfehler (Ticket anlegen): {e}")
-            return None
-
-    # ---- Abfragen ----
-    def _build_ticket_query(
-        self,
-        search: str | None,
-        priorities: list[str] | None,
-        statuses: list[str] | None,
-        created_by: str | None,
-        assigned_to: str | None,
-    ) -> tuple[str, list]:
-        base = "SELECT * FROM tickets"
-        conditions = []
-        params: list = []
-
-        if search:
-            term = f"%{search.strip().lower()}%"
-            conditions.append("(LOWER(title) LIKE ? OR LOWER(description) LIKE ?)")
-            params.extend([term, term])
-
-        if priorities:
-            placeholders = ", ".join(["?"] * len(priorities))
-            conditions.append(f"priority IN ({placeholders})")
-            params.extend(priorities)
-
-        if statuses:
-            placeholders = ", ".join(["?"] * len(statuses))
-            conditions.append(f"status IN ({placeholders})")
-            params.extend(statuses)
-
-        if created_by:
-            conditions.append("created_by = ?")
-            params.append(created_by)
-
-        if assigned_to:
-            conditions.append("assigned_to = ?")
-            params.append(assigned_to)
-
-        if conditions:
-            base += " WHERE " + " AND ".join(conditions)
-
-        base += " ORDER BY updated_at DESC"
-        return base, params
-
-    def get_tickets(
-        self,
-        search: str | None = None,
-        priorities: list[str] | None = None,
-        statuses: list[str] | None = None,
-        created_by: str | None = None,
-        assigned_to: str | None = None,
-    ) -> list[dict]:
-        query, params = self._build_ticket_query(search, priorities, statuses, created_by, assigned_to)
-        try:
-            self.cursor.execute(query, tuple(params))
-            rows = self.cursor.fetchall()
-            return [dict(row) for row in rows]
-        except sqlite3.Error as e:
-            st.error(f"Datenbankfehler (Ticket‑Abfrage): {e}")
-            return []
-
-    def get_ticket_by_id(self, ticket_id: int) -> dict | None:
-        try:
-            self.cursor.execute("SELECT * FROM tickets WHERE id = ?", (ticket_id,))
-            row = self.cursor.fetchone()
-            return dict(row) if row else None
-        except sqlite3.Error as e:
-            st.error(f"Datenbankfehler (Ticket‑Abfrage ID={ticket_id}): {e}")
-            return None
-
-    def _get_user_role(self, username: str) -> str | None:
-        try:
-            self.cursor.execute("SELECT role FROM users WHERE username = ?", (username,))
-            row = self.cursor.fetchone()
-            return row["role"] if row else None
-        except sqlite3.Error as e:
-            st.error(f"Datenbankfehler (Rollen‑Abfrage): {e}")
-            return None
-
-    def _has_permission(self, ticket_id: int, username: str) -> bool:
-        """Erlaubt Administrator alles, Support alle offenen Tickets, Anwender nur Sicht‑Berechtigung."""
-        role = self._get_user_role(username)
-        if not role:
-            return False
-        ticket = self.get_ticket_by_id(ticket_id)
-        if not ticket:
-            return False
-        if role == "Administrator":
-            return True
-        if role == "Support" and ticket["status"] != "Erledigt":
-            return True
-        # Anwender dürfen nur einsehen (keine Änderungen)
-        return False
-
-    # ---- Update / Delete ----
-    def update_status(
-        self,
-        ticket_id: int,
-        new_status: str,
-        support_feedback: str | None,
-        internal_notes: str | None,
-        updated_by: str,
-    ) -> bool:
-        if not self._has_permission(ticket_id, updated_by):
-            st.error("Keine Berechtigung, den Status zu ändern.")
-            return False
-        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        try:
-            self.cursor.execute(
-                """
-                UPDATE tickets
-                SET status = ?, updated_at = ?, last_updated_by = ?, support_feedback = ?, internal_notes = ?
-                WHERE id = ?
-                """,
-                (
-                    new_status,
-                    now,
-                    updated_by,
-                    support_feedback,
-                    internal_notes,
-                    ticket_id,
-                ),
-            )
-            self.conn.commit()
-            return self.cursor.rowcount > 0
-        except sqlite3.Error as e:
-            st.error(f"Datenbankfehler (Status‑Update): {e}")
-            return False
-
-    def delete_ticket(self, ticket_id: int, deleted_by: str) -> bool:
-        if not self._has_permission(ticket_id, deleted_by):
-            st.error("Keine Berechtigung, das Ticket zu löschen.")
-            return False
-        try:
-            self.cursor.execute("DELETE FROM tickets WHERE id = ?", (ticket_id,))
-            self.conn.commit()
-            return self.cursor.rowcount > 0
-        except sqlite3.Error as e:
-            st.error(f"Datenbankfehler (Ticket‑Löschen): {e}")
-            return False
-
-    def get_users(self) -> list[dict]:
-        try:
-            self.cursor.execute("SELECT username, role FROM users")
-            rows = self.cursor.fetchall()
-            return [{"username": r["username"], "role": r["role"]} for r in rows]
-        except sqlite3.Error as e:
-            st.error(f"Datenbankfehler (Nutzerliste): {e}")
-            return []
-
-    # ---- Reporting ----
-    def get_open_ticket_count(self) -> int:
-        try:
-            self.cursor.execute(
-                "SELECT COUNT(*) FROM tickets WHERE status IN ('Neu', 'In Bearbeitung')"
-            )
-            return self.cursor.fetchone()[0]
-        except sqlite3.Error as e:
-            st.error(f"Datenbankfehler (Offene Tickets zählen): {e}")
-            return 0
-
-    def get_average_processing_time(self) -> str:
-        try:
-            self.cursor.execute(
-                """
-                SELECT (strftime('%s', updated_at) - strftime('%s', created_at)) AS duration
-                FROM tickets
-                WHERE status = 'Erledigt' AND updated_at IS NOT NULL AND created_at IS NOT NULL
-                """
-            )
-            rows = self.cursor.fetchall()
-            if not rows:
-                return "Keine Daten"
-            total_sec = sum(r["duration"] for r in rows)
-            avg_sec = total_sec / len(rows)
-            h = int(avg_sec // 3600)
-            m = int((avg_sec % 3600) // 60)
-            s = int(avg_sec % 60)
-            return f"{h}h {m}m {s}s"
-        except sqlite3.Error as e:
-            st.error(f"Datenbankfehler (Durchschnittliche Bearbeitungszeit): {e}")
-            return "Fehler"
-
-
 # -------------------------------------------------
 # UI‑Funktionen
 # -------------------------------------------------
@@ -521,180 +159,391 @@ def create_ticket_page(db: TicketDatabase) -> None:
             if not title.strip():
                 st.error("Titel darf nicht leer sein.")
                 return
-            ticket_id = db.add_ticket(
-                title=title,
-                description=description,
-                priority=priority,
-                category=category,
-                created_by=st.session_state.username,
+            try:
+                ticket_id = db.add_ticket(
+                    title=title,
+                    description=description,
+                    priority=priority,
+                    category=category,
+                    created_by=st.session_state.username,
+                )
+            except TicketStoreError as e:
+                st.error(f"Ticket konnte nicht erstellt werden: {e}")
+                return
+            st.success(f"Ticket #{ticket_id} erfolgreich erstellt! 🎉")
+            if db.auto_dispatch and not db.defer_enrichment:
+                # Ohne Worker direkt zuweisen; ein Fehler dabei lässt das Ticket unzugewiesen
+                try:
+                    get_dispatcher(db.pool.db_path).assign(ticket_id)
+                except TicketStoreError as e:
+                    st.warning(f"Ticket konnte nicht automatisch zugewiesen werden: {e}")
+
+
+def _render_ticket_card(db: TicketDatabase, ticket: dict, perms: PermissionEvaluator) -> None:
+    """Eine Karte: Expander‑Kopf immer, Details und Formular erst beim Aufklappen."""
+    sentiment = ticket.get("sentiment", "") or ""
+    label = f"Ticket #{ticket['id']} ({ticket['priority']}) {sentiment}"
+    card = st.expander(label, key=f"card_{ticket['id']}", on_change="rerun")
+    if not card.open:
+        return
+
+    with card:
+        st.subheader(ticket["title"])
+        # Badges und Infos in einem einzigen Markdown‑Element
+        st.markdown(
+            f"**Priorität:** {_priority_badge_html(ticket['priority'])}  \n"
+            f"**Status:** {_status_badge_html(ticket['status'])}  \n"
+            f"**Kategorie:** {ticket['category']}  \n"
+            f"**Erstellt am:** {ticket['created_at']}  \n"
+            f"**Zuletzt aktualisiert:** {ticket['updated_at'] or 'Nie'}",
+            unsafe_allow_html=True,
+        )
+        st.write("**Beschreibung:**", ticket["description"] or "Keine Beschreibung")
+        st.write("**Support‑Rückmeldung:**", ticket.get("support_feedback") or "Keine")
+        st.write("**Interne Notizen:**", ticket.get("internal_notes") or "Keine")
+        _render_history(db, ticket["id"])
+
+        # ---- Status‑Update‑Formular (nur wenn berechtigt) ----
+        if not perms.can_edit(ticket):
+            return
+        cur_status = ticket["status"]
+        role = perms.role
+
+        # Welche Status‑Optionen dürfen angezeigt werden?
+        if role == "Administrator":
+            opts = ["Neu", "In Bearbeitung", "Erledigt"]
+        elif role == "Support":
+            opts = ["In Bearbeitung", "Erledigt"]
+        else:  # Anwender
+            opts = [cur_status]
+
+        # Falls die aktuelle Status‑Option nicht mehr erlaubt ist, vorne einreihen
+        if cur_status not in opts:
+            opts.insert(0, cur_status)
+
+        with st.form(f"status_update_{ticket['id']}", clear_on_submit=True):
+            new_status = st.selectbox(
+                "Status",
+                opts,
+                index=opts.index(cur_status),
+                key=f"status_sel_{ticket['id']}",
+                label_visibility="hidden",
             )
-            if ticket_id:
-                st.success(f"Ticket #{ticket_id} erfolgreich erstellt! 🎉")
-            else:
-                st.error("Ticket konnte nicht erstellt werden.")
+            # Support‑Feedback immer zeigen
+            feedback = st.text_area(
+                "Support‑Rückmeldung",
+                value=ticket.get("support_feedback", ""),
+                key=f"feedback_{ticket['id']}",
+                height=70,
+            )
+            # Interne Notizen nur für Support/ADMIN
+            notes = (
+                st.text_area(
+                    "Interne Notizen",
+                    value=ticket.get("internal_notes", ""),
+                    key=f"notes_{ticket['id']}",
+                    height=70,
+                )
+                if role in {"Support", "Administrator"}
+                else None
+            )
+            submit_btn = st.form_submit_button("Änderungen speichern")
+            if submit_btn:
+                try:
+                    db.update_status(
+                        ticket_id=ticket["id"],
+                        new_status=new_status,
+                        support_feedback=feedback,
+                        internal_notes=notes,
+                        updated_by=perms.username,
+                        permissions=perms,
+                    )
+                except TicketStoreError as e:
+                    st.error(f"Der Status konnte nicht aktualisiert werden: {e}")
+                    return
+                msg = (
+                    f"Status von Ticket #{ticket['id']} auf **{new_status}** geändert."
+                    if new_status != cur_status
+                    else f"Ticket #{ticket['id']} gespeichert."
+                )
+                st.success(msg)
+
+
+def _render_history(db: TicketDatabase, ticket_id: int) -> None:
+    """Statusverlauf aus der Ereignis‑Historie, eine Zeile je Änderung."""
+    lines = []
+    for event in db.get_ticket_history(ticket_id):
+        if event["from_status"] is None:
+            what = f"angelegt ({event['to_status']})"
+        elif event["to_status"] is None:
+            what = "gelöscht"
+        elif event["from_status"] != event["to_status"]:
+            what = f"{event['from_status']} → {event['to_status']}"
+        else:
+            what = "Rückmeldung/Notizen geändert"
+        lines.append(f"{event['at']} · {what} · {event['actor'] or '–'}")
+    if lines:
+        st.caption("**Verlauf:**  \n" + "  \n".join(lines))
+
+
+def _load_more(status: str) -> None:
+    st.session_state.setdefault("board_more", set()).add(status)
+
+
+def _board_order(ticket: dict) -> tuple:
+    return (ticket["updated_at"], ticket["id"])
+
+
+def _load_column(db: TicketDatabase, status: str, filters: dict, pages: int = 1) -> dict:
+    tickets, cursor = [], None
+    for _ in range(pages):
+        page, cursor = db.get_tickets_page(status, after=cursor, **filters)
+        tickets.extend(page)
+        if cursor is None:
+            break
+    return {"tickets": tickets, "cursor": cursor, "pages": pages}
+
+
+def _load_board(db: TicketDatabase, key: tuple, filters: dict, status_filter: list, pages: dict) -> dict:
+    # Sequenz vor dem Laden merken: Änderungen währenddessen kommen beim nächsten Lauf erneut.
+    # changes_since verwirft dabei auch veraltete Cache‑Einträge (Schreiber anderer Prozesse).
+    seq = db.changes_since(db.latest_change_seq())["seq"]
+    return {
+        "key": key,
+        "seq": seq,
+        "counts": db.count_tickets_by_status(statuses=status_filter, **filters),
+        "columns": {
+            status: _load_column(db, status, filters, pages.get(status, 1)) for status in status_filter
+        },
+    }
+
+
+def _apply_changes(db: TicketDatabase, board: dict, changes: list[dict], filters: dict, status_filter: list) -> None:
+    """Nur die geänderten Tickets neu holen und in die geladenen Spalten einsortieren."""
+    ids = {change["ticket_id"] for change in changes}
+    fresh = db.get_tickets_by_ids(ids)
+    for column in board["columns"].values():
+        column["tickets"] = [t for t in column["tickets"] if t["id"] not in ids]
+    for ticket in fresh.values():
+        column = board["columns"].get(ticket["status"])
+        if column is None or (filters["priorities"] and ticket["priority"] not in filters["priorities"]):
+            continue
+        # Nur innerhalb des geladenen Fensters; ältere Tickets kommen über "Mehr laden"
+        if column["cursor"] is None or _board_order(ticket) > tuple(column["cursor"]):
+            column["tickets"].append(ticket)
+            column["tickets"].sort(key=_board_order, reverse=True)
+    board["counts"] = db.count_tickets_by_status(statuses=status_filter, **filters)
+
+
+def _sync_board(db: TicketDatabase, filters: dict, status_filter: list) -> dict:
+    """Board‑Stand der Sitzung holen und nur um die Änderungen seit dem letzten Lauf ergänzen."""
+    key = (filters["search"], tuple(filters["priorities"]), tuple(status_filter))
+    board = st.session_state.get("board")
+    more = st.session_state.pop("board_more", set())
+    if board is None or board["key"] != key:
+        board = st.session_state.board = _load_board(db, key, filters, status_filter, {})
+        return board
+
+    feed = db.changes_since(board["seq"])
+    # Bei einer Suche bestimmt bm25 die Reihenfolge – dann lieber neu laden
+    if feed["reset"] or (feed["changes"] and filters["search"]):
+        pages = {status: column["pages"] for status, column in board["columns"].items()}
+        board = st.session_state.board = _load_board(db, key, filters, status_filter, pages)
+    elif feed["changes"]:
+        _apply_changes(db, board, feed["changes"], filters, status_filter)
+        board["seq"] = feed["seq"]
+
+    for status in more & board["columns"].keys():
+        column = board["columns"][status]
+        if column["cursor"] is not None:
+            page, column["cursor"] = db.get_tickets_page(status, after=tuple(column["cursor"]), **filters)
+            column["tickets"].extend(page)
+            column["pages"] += 1
+    return board
+
+
+def render_column(
+    db: TicketDatabase,
+    status: str,
+    count: int,
+    column: dict | None,
+    perms: PermissionEvaluator,
+) -> None:
+    """Kopf mit Anzahl, dann die geladenen Karten der Spalte und ggf. "Mehr laden"."""
+    with st.container(border=True):
+        st.markdown(f'<h3 style="text-align:center; color:#007bff; border-bottom:2px solid #007bff; padding-bottom:5px;">{status} ({count})</h3>', unsafe_allow_html=True)
+
+        if not count or column is None:
+            st.caption(f"Keine Tickets in '{status}'")
+            return
+
+        for ticket in column["tickets"]:
+            with section("card"):
+                _render_ticket_card(db, ticket, perms)
+
+        if column["cursor"] is not None:
+            st.button(
+                "Mehr laden",
+                key=f"more_{status}",
+                on_click=_load_more,
+                args=(status,),
+                width="stretch",
+            )
+
+
+def _more_mine() -> None:
+    st.session_state.my_pages += 1
+
+
+def my_tickets_page(db: TicketDatabase, perms: PermissionEvaluator) -> None:
+    """Persönliche Sicht: Anwender ihre eigenen Tickets, Support die eigene Queue plus Unzugewiesene."""
+    counts = db.count_my_tickets(perms)
+    if perms.role == "Anwender":
+        st.title("Meine Tickets 🙋")
+        col1, col2 = st.columns(2)
+        col1.metric("Eigene Tickets", counts["own"])
+        col2.metric("Davon offen", counts["open"])
+        total = counts["own"]
+    else:
+        st.title("Meine Queue 🎧")
+        col1, col2 = st.columns(2)
+        col1.metric("Mir zugewiesen (offen)", counts["assigned"])
+        col2.metric("Nicht zugewiesen (offen)", counts["unassigned"])
+        total = counts["assigned"] + counts["unassigned"]
+    if not total:
+        st.info("Keine Tickets in deiner Sicht.")
+        return
+
+    # Seitenstand gilt pro Benutzer (Wechsel des Logins setzt ihn zurück)
+    if st.session_state.get("my_pages_user") != perms.username:
+        st.session_state.my_pages_user = perms.username
+        st.session_state.my_pages = 1
+
+    cursor = None
+    for _ in range(st.session_state.my_pages):
+        tickets, cursor = db.get_my_tickets_page(perms, after=cursor)
+        for ticket in tickets:
+            if perms.role != "Anwender" and not ticket["assigned_to"]:
+                st.caption(f"#{ticket['id']} · nicht zugewiesen · {ticket['status']}")
+            _render_ticket_card(db, ticket, perms)
+        if cursor is None:
+            break
+    if cursor is not None:
+        st.button("Mehr laden", key="more_mine", on_click=_more_mine, width="stretch")
 
 
 def list_tickets_page(db: TicketDatabase) -> None:
-    """Übersicht mit Kanban‑Board."""
+    """Übersicht mit Kanban‑Board; mit aktivem Render‑Profil samt Zeitaufteilung."""
+    profiling = st.session_state.get("render_profile", False)
+    if profiling:
+        render_profiler.start()
+    try:
+        _render_board(db)
+    finally:
+        profile = render_profiler.stop() if profiling else None
+    if profile is not None:
+        _show_render_profile(profile.report())
+
+
+def _show_render_profile(report: dict) -> None:
+    """Aktuelles Profil und Verlauf der letzten Reruns (Skalierung mit der Kartenzahl)."""
+    cards = report["sections"].get("card", {}).get("calls", 0)
+    history = st.session_state.setdefault("render_profiles", [])
+    history.append(
+        {
+            "Karten": cards,
+            "Gesamt ms": report["wall_ms"],
+            **{f"{name} ms": value["ms"] for name, value in report["sections"].items()},
+            "Widgets": report["widgets"],
+            "Payload KB": round(report["payload_bytes"] / 1024, 1),
+        }
+    )
+    del history[:-30]
+
+    with st.expander(f"Render‑Profil: {report['wall_ms']:.0f} ms, {report['widgets']} Widgets", expanded=True):
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Rerun gesamt", f"{report['wall_ms']:.0f} ms")
+        col2.metric("Widgets", report["widgets"])
+        col3.metric("Payload", f"{report['payload_bytes'] / 1024:.1f} KB")
+        st.dataframe(
+            [{"Abschnitt": name, "ms (exklusiv)": v["ms"], "Aufrufe": v["calls"]} for name, v in report["sections"].items()]
+            + [{"Abschnitt": "übrig", "ms (exklusiv)": report["other_ms"], "Aufrufe": None}],
+            width="stretch",
+            hide_index=True,
+        )
+        st.caption("Elemente: " + ", ".join(f"{name} × {n}" for name, n in report["elements"].items()))
+        st.markdown("**Letzte Reruns**")
+        st.dataframe(list(reversed(history)), width="stretch", hide_index=True)
+        st.download_button(
+            "Verlauf als JSON",
+            data=json.dumps({"last": report, "history": history}, indent=2, ensure_ascii=False),
+            file_name="render_profile.json",
+            mime="application/json",
+        )
+
+
+def _render_board(db: TicketDatabase) -> None:
     st.title("Ticket‑Übersicht 📄")
 
     # ---- Filter ----
-    search = st.text_input("Suche…", key="search")
-    prio_filter = st.multiselect(
-        "Priorität filtern",
-        options=["Niedrig", "Mittel", "Hoch"],
-        default=["Niedrig", "Mittel", "Hoch"],
-        key="prio_filter",
-    )
-    # Status‑Filter hängt von Rolle ab
-    allowed_statuses = (
-        ["Neu", "In Bearbeitung"]
-        if st.session_state.role == "Support"
-        else ["Neu", "In Bearbeitung", "Erledigt"]
-    )
-    status_filter = st.multiselect(
-        "Status filtern",
-        options=["Neu", "In Bearbeitung", "Erledigt"],
-        default=allowed_statuses,
-        key="status_filter",
-    )
+    with section("filters"):
+        search = st.text_input("Suche…", key="search")
+        prio_filter = st.multiselect(
+            "Priorität filtern",
+            options=["Niedrig", "Mittel", "Hoch"],
+            default=["Niedrig", "Mittel", "Hoch"],
+            key="prio_filter",
+        )
+        # Status‑Filter hängt von Rolle ab
+        allowed_statuses = (
+            ["Neu", "In Bearbeitung"]
+            if st.session_state.role == "Support"
+            else ["Neu", "In Bearbeitung", "Erledigt"]
+        )
+        status_filter = st.multiselect(
+            "Status filtern",
+            options=["Neu", "In Bearbeitung", "Erledigt"],
+            default=allowed_statuses,
+            key="status_filter",
+        )
 
-    # ---- Daten abfragen ----
-    tickets = db.get_tickets(
-        search=search,
-        priorities=prio_filter,
-        statuses=status_filter,
-    )
-    if not tickets:
+    _live_board(db, {"search": search, "priorities": prio_filter}, status_filter)
+
+
+@st.fragment(run_every=BOARD_LIVE_SECONDS or None)
+def _live_board(db: TicketDatabase, filters: dict, status_filter: list) -> None:
+    """Spalten des Boards; läuft alle ``BOARD_LIVE_SECONDS`` allein neu und holt nur Änderungen."""
+    try:
+        _board_columns(db, filters, status_filter)
+    finally:
+        # Fragment‑Reruns laufen in eigenem Thread ohne main(): Verbindung selbst zurückgeben
+        db.close()
+
+
+def _board_columns(db: TicketDatabase, filters: dict, status_filter: list) -> None:
+    with section("query"):
+        board = _sync_board(db, filters, status_filter)
+    counts = board["counts"]
+    if not sum(counts.values()):
         st.info("Keine Tickets gefunden – erstelle eines mittels *Neues Ticket*! 🎯")
         return
 
-    # ---- Einteilen in Spalten ----
-    tickets_by_status = {"Neu": [], "In Bearbeitung": [], "Erledigt": []}
-    for t in tickets:
-        tickets_by_status[t["status"]].append(t)
+    # Fragment‑Reruns laufen ohne render_app(): Rolle hier selbst auflösen, einmal für alle Karten
+    perms = _permissions(db)
 
     # ---- Kanban‑Layout (Flex‑Board) ----
     st.markdown('<div class="kanban-board">', unsafe_allow_html=True)
     with st.container():
-        col_new, col_in, col_done = st.columns(3, gap="large")
-
-        # ---- Hilfsfunktion für eine einzelne Spalte ----
-     # ---- Hilfsfunktion für eine einzelne Spalte ----
-        def render_column(status: str, tickets: list[dict]) -> None:
-            """Rendert Header und Cards sauber innerhalb eines Streamlit-Containers."""
-            
-            # Wir nutzen den nativen st.container mit Border anstatt manuellem HTML-DIV
-            with st.container(border=True):
-                # Header direkt über Streamlit-Markdown (zentriert & blau)
-                st.markdown(f'<h3 style="text-align:center; color:#007bff; border-bottom:2px solid #007bff; padding-bottom:5px;">{status}</h3>', unsafe_allow_html=True)
-
-                if not tickets:
-                    # Kleiner Text statt fetter blauer Kachel (verhindert das "Kachel-Problem")
-                    st.caption(f"Keine Tickets in '{status}'")
-                    return
-
-                # Jedes Ticket = Expander
-                for ticket in tickets:
-                    sentiment = ticket.get("sentiment", "") or ""
-                    label = f"Ticket #{ticket['id']} ({ticket['priority']}) {sentiment}"
-                    
-                    with st.expander(label, expanded=False):
-                        st.subheader(ticket["title"])
-                        # Hier folgen deine restlichen st.write und st.form Befehle...
-
-                    # Badges
-                    st.write(
-                        "**Priorität:**",
-                        _priority_badge_html(ticket["priority"]),
-                        unsafe_allow_html=True,
-                    )
-                    st.write(
-                        "**Status:**",
-                        _status_badge_html(ticket["status"]),
-                        unsafe_allow_html=True,
-                    )
-
-                    # Weitere Infos
-                    st.write("**Beschreibung:**", ticket["description"] or "Keine Beschreibung")
-                    st.write("**Kategorie:**", ticket["category"])
-                    st.write("**Erstellt am:**", ticket["created_at"])
-                    st.write("**Zuletzt aktualisiert:**", ticket["updated_at"] or "Nie")
-                    st.write("**Support‑Rückmeldung:**", ticket.get("support_feedback", "Keine"))
-                    st.write("**Interne Notizen:**", ticket.get("internal_notes", "Keine"))
-
-                    # ---- Status‑Update‑Formular (nur wenn berechtigt) ----
-                    if db._has_permission(ticket["id"], st.session_state.username):
-                        cur_status = ticket["status"]
-                        role = st.session_state.role
-
-                        # Welche Status‑Optionen dürfen angezeigt werden?
-                        if role == "Administrator":
-                            opts = ["Neu", "In Bearbeitung", "Erledigt"]
-                        elif role == "Support":
-                            opts = ["In Bearbeitung", "Erledigt"]
-                        else:  # Anwender
-                            opts = [cur_status]
-
-                        # Falls die aktuelle Status‑Option nicht mehr erlaubt ist, vorne einreihen
-                        if cur_status not in opts:
-                            opts.insert(0, cur_status)
-
-                        with st.form(f"status_update_{ticket['id']}", clear_on_submit=True):
-                            new_status = st.selectbox(
-                                "Status",
-                                opts,
-                                index=opts.index(cur_status),
-                                key=f"status_sel_{ticket['id']}",
-                                label_visibility="hidden",
-                            )
-                            # Support‑Feedback immer zeigen
-                            feedback = st.text_area(
-                                "Support‑Rückmeldung",
-                                value=ticket.get("support_feedback", ""),
-                                key=f"feedback_{ticket['id']}",
-                                height=70,
-                            )
-                            # Interne Notizen nur für Support/ADMIN
-                            notes = (
-                                st.text_area(
-                                    "Interne Notizen",
-                                    value=ticket.get("internal_notes", ""),
-                                    key=f"notes_{ticket['id']}",
-                                    height=70,
-                                )
-                                if role in {"Support", "Administrator"}
-                                else None
-                            )
-                            submit_btn = st.form_submit_button("Änderungen speichern")
-                            if submit_btn:
-                                ok = db.update_status(
-                                    ticket_id=ticket["id"],
-                                    new_status=new_status,
-                                    support_feedback=feedback,
-                                    internal_notes=notes,
-                                    updated_by=st.session_state.username,
-                                )
-                                if ok:
-                                    msg = (
-                                        f"Status von Ticket #{ticket['id']} auf **{new_status}** geändert."
-                                        if new_status != cur_status
-                                        else f"Ticket #{ticket['id']} gespeichert."
-                                    )
-                                    st.success(msg)
-                                else:
-                                    st.error("Der Status konnte nicht aktualisiert werden.")
-                    # ---- Ende Formular ----
-            # Spalten‑Wrapper schließen
-            st.markdown('</div>', unsafe_allow_html=True)
-
-        # ---- Einzelne Spalten rendern ----
-        with col_new:
-            render_column("Neu", tickets_by_status["Neu"])
-        with col_in:
-            render_column("In Bearbeitung", tickets_by_status["In Bearbeitung"])
-        with col_done:
-            render_column("Erledigt", tickets_by_status["Erledigt"])
+        columns = st.columns(3, gap="large")
+        for col, status in zip(columns, ["Neu", "In Bearbeitung", "Erledigt"]):
+            with col, section("column"):
+                render_column(
+                    db,
+                    status,
+                    counts.get(status, 0) if status in status_filter else 0,
+                    board["columns"].get(status),
+                    perms,
+                )
 
     # Board‑Wrapper schließen
     st.markdown('</div>', unsafe_allow_html=True)
@@ -720,10 +569,10 @@ def user_management_page(db: TicketDatabase) -> None:
         )
         submit_new = st.form_submit_button("Benutzer anlegen")
         if submit_new:
-            if user_name.strip() and user_pwd.strip():
+            try:
                 db.add_user(user_name, user_pwd, user_role)
-            else:
-                st.error("Benutzername und Passwort dürfen nicht leer sein.")
+            except TicketStoreError as e:
+                st.error(str(e))
 
     # ---- Aktuelle Nutzer listieren ----
     st.subheader("Aktive Nutzer")
@@ -733,7 +582,7 @@ def user_management_page(db: TicketDatabase) -> None:
         return
 
     # Tabellarische Ansicht (lesbar, aber nicht editierbar)
-    st.dataframe(users, use_container_width=True, hide_index=True)
+    st.dataframe(users, width="stretch", hide_index=True)
 
     # ---- Nutzer löschen (Button pro Zeilen‑Entry) ----
     for user in users:
@@ -744,10 +593,11 @@ def user_management_page(db: TicketDatabase) -> None:
             st.write(f"({user['role']})")
         with col_btn:
             if st.button(f"✕ Löschen", key=f"del_user_{user['username']}"):
-                if db.remove_user(user["username"]):
+                try:
+                    db.remove_user(user["username"])
                     st.success(f"Benutzer '{user['username']}' gelöscht.")
-                else:
-                    st.error("Benutzer konnte nicht gelöscht werden.")
+                except TicketStoreError as e:
+                    st.error(f"Benutzer konnte nicht gelöscht werden: {e}")
                 # No explicit rerun needed – die Button‑Interaktion löst automatisch einen fresh Run aus
 
 
@@ -765,23 +615,282 @@ def admin_dashboard_page(db: TicketDatabase) -> None:
         st.caption(avg)
     else:
         st.metric("Durchschnittliche Bearbeitungszeit", avg)
+
+    # Kennzahlen je Dimension (aus ticket_aggregates, kein Tabellen‑Scan)
+    st.subheader("Kennzahlen")
+    titles = {"priority": "Priorität", "category": "Kategorie", "assignee": "Bearbeiter"}
+    for tab, dimension in zip(st.tabs(list(titles.values())), titles):
+        with tab:
+            rows = [
+                {
+                    titles[dimension]: r["label"] or "(nicht zugewiesen)",
+                    "Gesamt": r["ticket_count"],
+                    "Offen": r["open_count"],
+                    "Erledigt": r["done_count"],
+                    "Ø Bearbeitung (h)": round(r["avg_seconds"] / 3600, 1) if r["avg_seconds"] is not None else None,
+                }
+                for r in db.get_ticket_breakdown(dimension)
+            ]
+            if rows:
+                st.dataframe(rows, width="stretch", hide_index=True)
+            else:
+                st.caption("Keine Daten")
+
+    _render_reports(db)
+
+    _render_dispatch(db)
+
+    # Verbindungs‑Pool und Schreib‑Contention
+    with st.expander("Datenbank‑Verbindungen"):
+        st.json(db.pool.stats())
+
+    # Lese‑Cache (Trefferquote zum Dimensionieren von TICKET_DB_CACHE_ENTRIES)
+    with st.expander("Abfrage‑Cache"):
+        st.json(db.pool.cache.stats())
+
+    # Sentiment‑Lexikon: nach Änderungen alle Tickets neu bewerten
+    with st.expander("Sentiment‑Lexikon", expanded=db.sentiment_outdated()):
+        st.caption(
+            f"Lexikon‑Version {db.sentiment.version}: "
+            + ", ".join(f"{label} {len(words)} Wörter" for label, words in db.sentiment.lexicon.items())
+        )
+        if db.defer_enrichment and st.button("Neubewertung einreihen"):
+            JobQueue(db).enqueue("sentiment.rescore", key=f"sentiment.rescore:{db.sentiment.version}")
+            st.info("Neubewertung läuft im Hintergrund (siehe „Hintergrund‑Jobs“).")
+        elif not db.defer_enrichment and st.button("Alle Tickets neu bewerten"):
+            bar = st.progress(0.0)
+            total = max(sum(r["ticket_count"] for r in db.get_ticket_breakdown("status")), 1)
+            report = db.rescore_sentiment(
+                progress=lambda r: bar.progress(min(r["rows"] / total, 1.0), text=f"{r['rows']:,} Tickets")
+            )
+            st.success(f"{report['rows']:,} Tickets bewertet, {report['changed']:,} geändert ({report['seconds']:.1f}s).")
+        if db.sentiment_outdated():
+            st.warning("Bestehende Tickets wurden mit einem anderen Lexikon bewertet.")
+
+    # Warteschlange der Hintergrund‑Jobs
+    queue = JobQueue(db)
+    job_stats = queue.stats()
+    with st.expander(f"Hintergrund‑Jobs ({job_stats['queued']} wartend, {job_stats['failed']} fehlgeschlagen)"):
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Wartend", job_stats["queued"])
+        col2.metric("Laufend", job_stats["running"])
+        col3.metric("Latenz p50", f"{job_stats['latency_p50_s'] or 0:.2f} s")
+        col4.metric("Latenz p95", f"{job_stats['latency_p95_s'] or 0:.2f} s")
+        worker = get_worker()
+        st.caption(
+            f"Worker im Prozess: {worker.alive} Threads" if worker else "Kein Worker im Prozess (TICKET_JOBS_WORKER)."
+        )
+        if job_stats["by_kind"]:
+            st.dataframe(
+                [{"Art": kind, **values} for kind, values in job_stats["by_kind"].items()],
+                width="stretch",
+                hide_index=True,
+            )
+        failures = queue.recent_failures()
+        if failures:
+            st.dataframe(failures, width="stretch", hide_index=True)
+            if st.button("Fehlgeschlagene erneut versuchen"):
+                st.success(f"{queue.retry_failed()} Jobs erneut eingereiht.")
+
+
+def _render_dispatch(db: TicketDatabase) -> None:
+    """Last je Support‑Nutzer, Kategorien und Massen‑Zuweisung."""
+    dispatcher = get_dispatcher(db.pool.db_path)
+    dispatcher.sync()
+    counts = db.count_my_tickets(PermissionEvaluator("", "Support"))
+    with st.expander(f"Zuweisung ({counts['unassigned']} offene Tickets ohne Bearbeiter)"):
+        agents = dispatcher.stats()
+        if not agents:
+            st.caption("Keine Support‑Nutzer vorhanden.")
+            return
+        st.dataframe(agents, width="stretch", hide_index=True)
+        st.caption(
+            "Last = Summe der Prioritätsgewichte offener Tickets. Neue Tickets "
+            + ("werden automatisch zugewiesen." if db.auto_dispatch else "bleiben unzugewiesen (TICKET_AUTO_DISPATCH=0).")
+        )
+
+        col1, col2 = st.columns(2)
+        if col1.button("Unzugewiesene verteilen", disabled=not counts["unassigned"]):
+            st.success(f"{dispatcher.dispatch_unassigned():,} Tickets zugewiesen.")
+        if col2.button("Rückstand neu verteilen"):
+            report = dispatcher.rebalance()
+            st.success(f"{report['moved']:,} von {report['tickets']:,} neuen Tickets verschoben.")
+
+        with st.form("support_skills"):
+            agent = st.selectbox("Support‑Nutzer", [a["Bearbeiter"] for a in agents])
+            categories = st.multiselect("Kategorien (leer = alle)", CATEGORIES)
+            if st.form_submit_button("Kategorien speichern"):
+                try:
+                    dispatcher.set_skills(agent, categories)
+                    st.success(f"Kategorien für {agent} gespeichert.")
+                except TicketStoreError as e:
+                    st.error(str(e))
+
+
+def _hours(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds / 3600, 1)
+
+
+def _load_report(db: TicketDatabase, load, days: int) -> dict:
+    """Auswertung aus dem Cache; abgelaufene Buckets frischt der Worker auf, sonst sofort."""
+    with st.spinner("Auswertung wird berechnet …"):
+        report = load(days)
+        if report["stale"]:
+            if db.defer_enrichment:
+                JobQueue(db).enqueue("reports.refresh", key=f"reports.refresh:{int(time.time() // BUCKET_SECONDS)}")
+            else:
+                report = load(days, refresh=True)
+    return report
+
+
+def _render_reports(db: TicketDatabase) -> None:
+    """Lösungszeit‑Perzentile, Verweildauer je Status und Tages‑Trends (siehe ``reporting``)."""
+    reports = Reports(db)
+    st.subheader("Lösungszeiten")
+    days = st.selectbox(
+        "Zeitraum",
+        WINDOWS,
+        index=WINDOWS.index(90),
+        format_func=lambda d: f"Letzte {d} Tage" if d else "Gesamt",
+        key="report_days",
+    )
+    resolution = _load_report(db, reports.resolution, days)
+    stamp = time.strftime("%d.%m. %H:%M", time.gmtime(resolution["computed_at"]))
+    st.caption(f"Stand {stamp}" + (" – wird im Hintergrund aktualisiert" if resolution["stale"] else ""))
+
+    titles = {"priority": "Priorität", "category": "Kategorie", "assignee": "Bearbeiter"}
+    for tab, dimension in zip(st.tabs(list(titles.values())), titles):
+        with tab:
+            rows = [
+                {
+                    titles[dimension]: r["label"] or "(nicht zugewiesen)",
+                    "Erledigt": r["count"],
+                    "Ø (h)": _hours(r["avg_seconds"]),
+                    **{f"p{pct} (h)": _hours(r[f"p{pct}"]) for pct in PERCENTILES},
+                }
+                for r in resolution["value"][dimension]
+            ]
+            if rows:
+                st.dataframe(rows, width="stretch", hide_index=True)
+            else:
+                st.caption("Keine erledigten Tickets im Zeitraum")
+
+    durations = _load_report(db, reports.time_in_status, days)["value"]
+    if durations:
+        st.markdown("**Verweildauer je Status**")
+        st.dataframe(
+            [
+                {
+                    "Status": r["status"],
+                    "Wechsel": r["count"],
+                    "Ø (h)": _hours(r["avg_seconds"]),
+                    **{f"p{pct} (h)": _hours(r[f"p{pct}"]) for pct in PERCENTILES},
+                }
+                for r in durations
+            ],
+            width="stretch",
+            hide_index=True,
+        )
+
+    trends = reports.trends(30)
+    if any(r["created"] or r["closed"] for r in trends):
+        st.markdown("**Angelegt/erledigt je Tag (30 Tage)**")
+        st.bar_chart(trends, x="day", y=["created", "closed"], stack=False)
+
+
+def query_stats_page(db: TicketDatabase) -> None:
+    """Laufzeiten je SQL‑Statement und Methode, Slow‑Log mit Query‑Plan."""
+    st.title("Abfrage‑Statistik ⏱️")
+    log = db.pool.query_log
+    if not log.enabled:
+        st.info("Messung ist aus (TICKET_DB_QUERY_SAMPLES=0).")
+        return
+    st.caption(
+        f"Slow‑Log ab {log.slow_ms:g} ms (TICKET_DB_SLOW_QUERY_MS). "
+        "„method“ ist die Gesamtzeit einer TicketDatabase‑Methode inkl. Dict‑Aufbau und Cache."
+    )
+
+    col1, col2 = st.columns(2)
+    col1.download_button(
+        "Als JSON herunterladen",
+        data=json.dumps(log.snapshot(), indent=2, ensure_ascii=False),
+        file_name="query_stats.json",
+        mime="application/json",
+    )
+    if col2.button("Zurücksetzen"):
+        log.reset()
+        st.rerun()
+
+    kinds = st.multiselect("Art", ["sql", "method"], default=["sql", "method"])
+    rows = [r for r in log.stats() if r["kind"] in kinds]
+    if rows:
+        st.dataframe(rows, width="stretch", hide_index=True)
+    else:
+        st.caption("Noch keine Messwerte")
+
+    st.subheader("Langsame Statements")
+    slow = log.slow()
+    if not slow:
+        st.caption("Keine")
+    for entry in slow[:50]:
+        with st.expander(f"{entry['at']} · {entry['ms']} ms · {entry['rows']} Zeilen · {entry['sql'][:80]}"):
+            st.code(entry["sql"], language="sql")
+            st.caption(f"Parameter: {entry['params']}")
+            if entry["plan"]:
+                st.code("\n".join(entry["plan"]), language="text")
 # -------------------------------------------------
 # Haupt‑Programm
 # -------------------------------------------------
+@st.cache_resource
+def get_worker() -> Worker | None:
+    """Job‑Worker im Streamlit‑Prozess; TICKET_JOBS_WORKER=external/off schaltet ihn ab."""
+    if os.environ.get("TICKET_JOBS_WORKER", "thread") != "thread":
+        return None
+    return Worker().start()
+
+
+@st.cache_resource
+def get_database() -> TicketDatabase:
+    """Eine TicketDatabase pro Prozess; Schema‑Setup läuft nur beim ersten Aufruf."""
+    db = TicketDatabase()
+    # Ohne Worker (weder Thread noch eigener Prozess) bleibt alles synchron
+    db.defer_enrichment = os.environ.get("TICKET_JOBS_WORKER", "thread") != "off"
+    db.auto_dispatch = os.environ.get("TICKET_AUTO_DISPATCH", "1") == "1"
+    return db
+
+
 def main() -> None:
+    _configure_page()
+
     # Session‑State initialisieren
     if "username" not in st.session_state:
         st.session_state.username = None
     if "role" not in st.session_state:
         st.session_state.role = None
 
-    # DB‑Verbindung öffnen
+    # DB aus dem prozessweiten Pool holen
     try:
-        db = TicketDatabase()
+        db = get_database()
+        get_worker()
     except Exception as exc:
         st.error(f"Konnte Datenbank nicht initialisieren: {exc}")
         st.stop()
 
+    try:
+        render_app(db)
+    finally:
+        # Verbindung auch bei st.rerun()/st.stop() an den Pool zurückgeben
+        db.close()
+
+
+def _permissions(db: TicketDatabase) -> PermissionEvaluator:
+    """Rechte des angemeldeten Nutzers; Rolle aus der users‑Tabelle, nicht aus dem Login."""
+    perms = db.permissions_for(st.session_state.username)
+    st.session_state.role = perms.role
+    return perms
+
+
+def render_app(db: TicketDatabase) -> None:
     # --------------------------- Login ---------------------------
     if not st.session_state.username:
         st.markdown('<div class="login-container">', unsafe_allow_html=True)
@@ -794,22 +903,30 @@ def main() -> None:
         login_pass = st.text_input("Passwort", type="password", key="login_pw_final")
 
         if st.button("Einloggen", key="login_btn_final"):
-            role = db.check_user(login_user, login_pass)
+            try:
+                role = db.check_user(login_user, login_pass)
+            except TicketStoreError as e:
+                st.error(str(e))
+                role = None
             if role:
                 st.session_state.username = login_user
                 st.session_state.role = role
                 st.success("Erfolgreich angemeldet! 🎉")
-                db.close()
                 st.rerun() # Seite neu laden
                 return
             else:
                 st.error("Falscher Benutzername oder Passwort.")
         
         st.markdown('</div>', unsafe_allow_html=True)
-        db.close()
         return
 
     # --------------------------- Logged-in UI ---------------------------
+    # Rolle einmal pro Rerun frisch laden: Rollenwechsel und Löschungen greifen sofort
+    perms = _permissions(db)
+    if perms.role is None:
+        st.session_state.username = None
+        st.rerun()
+
     st.sidebar.title("Menü 📂")
     st.sidebar.write(f"👤 {st.session_state.username} ({st.session_state.role})")
     
@@ -818,22 +935,36 @@ def main() -> None:
         st.session_state.role = None
         st.rerun()
 
+    # Render‑Profil: für Administratoren, mit TICKET_RENDER_PROFILE=1 für alle
+    if st.session_state.role == "Administrator" or os.environ.get("TICKET_RENDER_PROFILE") == "1":
+        st.sidebar.checkbox("Render‑Profil", key="render_profile")
+
     page_options = ["Ticket‑Übersicht", "Neues Ticket"]
+    if st.session_state.role in {"Anwender", "Support"}:
+        # Persönliche Sicht als Startseite
+        page_options.insert(0, "Meine Tickets")
     if st.session_state.role == "Administrator":
-        page_options += ["Benutzer Verwaltung", "Admin Dashboard"]
+        page_options += ["Benutzer Verwaltung", "Admin Dashboard", "Abfrage‑Statistik"]
     
     current_page = st.sidebar.radio("Seite wählen", page_options)
 
-    if current_page == "Ticket‑Übersicht":
-        list_tickets_page(db)
-    elif current_page == "Neues Ticket":
-        create_ticket_page(db)
-    elif current_page == "Benutzer Verwaltung":
-        user_management_page(db)
-    elif current_page == "Admin Dashboard":
-        admin_dashboard_page(db)
+    try:
+        if current_page == "Meine Tickets":
+            my_tickets_page(db, perms)
+        elif current_page == "Ticket‑Übersicht":
+            list_tickets_page(db)
+        elif current_page == "Neues Ticket":
+            create_ticket_page(db)
+        elif current_page == "Benutzer Verwaltung":
+            user_management_page(db)
+        elif current_page == "Admin Dashboard":
+            admin_dashboard_page(db)
+        elif current_page == "Abfrage‑Statistik":
+            query_stats_page(db)
+    except TicketStoreError as e:
+        # Lesefehler der Datenschicht – Seite abbrechen, Meldung zeigen
+        st.error(str(e))
 
-    db.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
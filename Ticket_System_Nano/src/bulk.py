@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""Bulk‑Import und ‑Export (CSV oder JSONL) sowie Sentiment‑Neubewertung für das Nano‑Ticket‑System.
+
+Beispiele:
+
+    python bulk.py import alt_tickets.csv --batch-size 5000 --create-users
+    python bulk.py export tickets.jsonl
+    python bulk.py export - --format csv > tickets.csv
+    python bulk.py rescore --lexicon lexikon.json
+
+Import‑Spalten: title, description, priority, category, status, created_at,
+updated_at, created_by, last_updated_by, support_feedback, internal_notes,
+assigned_to (siehe ``IMPORT_COLUMNS``). Fehlende Werte bekommen die Defaults
+von ``TicketDatabase.add_ticket``.
+"""
+
+import argparse
+import csv
+import json
+import sys
+
+from sentiment import SentimentEngine
+from ticket_store import DB_PATH, TicketDatabase
+
+
+def _detect_format(path: str, fmt: str | None) -> str:
+    if fmt:
+        return fmt
+    return "jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv"
+
+
+def _read_rows(fh, fmt: str):
+    """Zeilen einzeln lesen – die Datei wird nie komplett geladen."""
+    if fmt == "csv":
+        yield from csv.DictReader(fh)
+    else:
+        for line in fh:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _open(path: str, mode: str):
+    if path == "-":
+        return sys.stdin if "r" in mode else sys.stdout
+    return open(path, mode, encoding="utf-8", newline="")
+
+
+def cmd_import(args) -> None:
+    db = TicketDatabase(args.db)
+    fmt = _detect_format(args.file, args.format)
+
+    def progress(report: dict) -> None:
+        print(
+            f"\r{report['rows']:>10,} Tickets  {report['rows_per_sec']:>10,.0f} Zeilen/s",
+            end="",
+            file=sys.stderr,
+        )
+
+    with _open(args.file, "r") as fh:
+        report = db.import_tickets(
+            _read_rows(fh, fmt),
+            batch_size=args.batch_size,
+            create_users=args.create_users,
+            progress=progress,
+        )
+    print(file=sys.stderr)
+    print(
+        f"{report['rows']:,} Tickets in {report['batches']} Batches, "
+        f"{report['seconds']:.1f}s ({report['rows_per_sec']:,.0f} Zeilen/s)",
+        file=sys.stderr,
+    )
+    db.close()
+
+
+def cmd_export(args) -> None:
+    db = TicketDatabase(args.db)
+    fmt = _detect_format(args.file, args.format)
+    count = 0
+    with _open(args.file, "w") as fh:
+        writer = None
+        for ticket in db.export_tickets(batch_size=args.batch_size):
+            if fmt == "csv":
+                if writer is None:
+                    writer = csv.DictWriter(fh, fieldnames=list(ticket))
+                    writer.writeheader()
+                writer.writerow(ticket)
+            else:
+                fh.write(json.dumps(ticket, ensure_ascii=False) + "\n")
+            count += 1
+    print(f"{count:,} Tickets exportiert", file=sys.stderr)
+    db.close()
+
+
+def cmd_rescore(args) -> None:
+    engine = SentimentEngine.from_file(args.lexicon) if args.lexicon else None
+    db = TicketDatabase(args.db, sentiment=engine)
+
+    def progress(report: dict) -> None:
+        print(
+            f"\r{report['rows']:>10,} Tickets  {report['changed']:>10,} geändert  "
+            f"{report['rows_per_sec']:>10,.0f} Zeilen/s",
+            end="",
+            file=sys.stderr,
+        )
+
+    report = db.rescore_sentiment(batch_size=args.batch_size, progress=progress)
+    print(file=sys.stderr)
+    print(
+        f"{report['rows']:,} Tickets bewertet, {report['changed']:,} geändert, "
+        f"{report['seconds']:.1f}s (Lexikon {db.sentiment.version})",
+        file=sys.stderr,
+    )
+    db.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Tickets im Bulk importieren/exportieren.")
+    parser.add_argument("--db", default=DB_PATH, help=f"SQLite‑Datei (Standard: {DB_PATH})")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    imp = sub.add_parser("import", help="CSV/JSONL einspielen")
+    imp.add_argument("file", help="Quelldatei oder '-' für stdin")
+    imp.add_argument("--format", choices=["csv", "jsonl"])
+    imp.add_argument("--batch-size", type=int, default=5_000)
+    imp.add_argument(
+        "--create-users",
+        action="store_true",
+        help="Unbekannte Benutzer als gesperrte Anwender anlegen",
+    )
+    imp.set_defaults(func=cmd_import)
+
+    exp = sub.add_parser("export", help="Alle Tickets streamen")
+    exp.add_argument("file", help="Zieldatei oder '-' für stdout")
+    exp.add_argument("--format", choices=["csv", "jsonl"])
+    exp.add_argument("--batch-size", type=int, default=5_000)
+    exp.set_defaults(func=cmd_export)
+
+    res = sub.add_parser("rescore", help="Sentiment aller Tickets neu berechnen")
+    res.add_argument("--lexicon", help="Lexikon als JSON (Standard: TICKET_SENTIMENT_LEXICON bzw. eingebaut)")
+    res.add_argument("--batch-size", type=int, default=5_000)
+    res.set_defaults(func=cmd_rescore)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
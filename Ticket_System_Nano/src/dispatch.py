@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+"""Automatische Zuweisung von Tickets an Support‑Nutzer.
+
+Last eines Support‑Nutzers = Summe der Prioritätsgewichte seiner offenen
+Tickets (``PRIORITY_WEIGHTS``). ``Dispatcher`` hält diese Last im Speicher und
+je Kategorie einen Min‑Heap über die Nutzer, die sie bearbeiten
+(``support_skills``; ohne Eintrag: alle Kategorien). Veraltete Heap‑Einträge
+werden beim Herausnehmen verworfen – eine Zuweisung kostet O(log n) statt
+eines COUNT pro Nutzer.
+
+Der Index wird einmal aus der Datenbank aufgebaut und danach über den
+Änderungs‑Feed (``TicketDatabase.changes_since``) nachgeführt; so bleiben auch
+Änderungen anderer Prozesse und manuelle Zuweisungen berücksichtigt.
+"""
+
+import heapq
+import sqlite3
+import threading
+import time
+
+from ticket_store import DB_PATH, DatabaseError, TicketDatabase, ValidationError
+
+PRIORITY_WEIGHTS = {"Hoch": 3, "Mittel": 2, "Niedrig": 1}
+CATEGORIES = ("Bug", "Feature", "Support")
+# Vollständiger Neuaufbau spätestens nach so vielen Sekunden (neue Nutzer, Skills)
+REBUILD_INTERVAL = 300
+
+
+class Dispatcher:
+    """Lastindex über die Support‑Nutzer; thread‑sicher, eine Instanz pro Prozess."""
+
+    def __init__(self, db: TicketDatabase, weights: dict[str, int] | None = None):
+        self.db = db
+        self.weights = weights or PRIORITY_WEIGHTS
+        self._lock = threading.RLock()
+        self._seq: int | None = None
+        self._built_at = 0.0
+        self._load: dict[str, int] = {}
+        self._open: dict[str, int] = {}
+        self._skills: dict[str, set[str]] = {}
+        self._tickets: dict[int, tuple[str, int]] = {}  # offenes Ticket -> (Nutzer, Gewicht)
+        self._heaps: dict[str, list] = {}
+
+    # ---- Index ----
+    def rebuild(self) -> None:
+        """Index komplett aus der Datenbank aufbauen (ein Scan der offenen, zugewiesenen Tickets)."""
+        cur = self.db.cursor
+        with self._lock:
+            try:
+                # Sequenz zuerst: was danach geändert wird, holt sync() nach
+                seq = self.db.latest_change_seq()
+                cur.execute("SELECT username FROM users WHERE role = 'Support'")
+                agents = [row["username"] for row in cur.fetchall()]
+                cur.execute("SELECT username, category FROM support_skills")
+                skills: dict[str, set[str]] = {}
+                for row in cur.fetchall():
+                    skills.setdefault(row["username"], set()).add(row["category"])
+                cur.execute(
+                    """
+                    SELECT id, assigned_to, priority FROM tickets
+                    WHERE assigned_to IS NOT NULL AND status != 'Erledigt'
+                    """
+                )
+                rows = cur.fetchall()
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Datenbankfehler (Zuweisungs‑Index): {e}") from e
+
+            self._skills = {agent: skills.get(agent) or set(CATEGORIES) for agent in agents}
+            self._load = dict.fromkeys(agents, 0)
+            self._open = dict.fromkeys(agents, 0)
+            self._tickets = {}
+            for row in rows:
+                if row["assigned_to"] in self._load:
+                    self._add(row["id"], row["assigned_to"], self.weights[row["priority"]])
+            self._heaps = {category: [] for category in CATEGORIES}
+            for agent in agents:
+                self._push(agent)
+            self._seq = seq
+            self._built_at = time.monotonic()
+
+    def sync(self) -> None:
+        """Änderungen seit dem letzten Stand übernehmen (ohne Änderungen: eine Zeile lesen)."""
+        with self._lock:
+            if self._seq is None or time.monotonic() - self._built_at > REBUILD_INTERVAL:
+                self.rebuild()
+                return
+            feed = self.db.changes_since(self._seq)
+            if feed["reset"]:
+                self.rebuild()
+                return
+            if feed["changes"]:
+                fresh = self.db.get_tickets_by_ids(change["ticket_id"] for change in feed["changes"])
+                for change in feed["changes"]:
+                    self._apply(change["ticket_id"], fresh.get(change["ticket_id"]))
+            self._seq = feed["seq"]
+
+    def _add(self, ticket_id: int, agent: str, weight: int) -> None:
+        self._tickets[ticket_id] = (agent, weight)
+        self._load[agent] += weight
+        self._open[agent] += 1
+
+    def _apply(self, ticket_id: int, ticket: dict | None) -> None:
+        """Beitrag eines Tickets an seinen aktuellen Stand angleichen."""
+        old = self._tickets.pop(ticket_id, None)
+        if old is not None:
+            agent, weight = old
+            self._load[agent] -= weight
+            self._open[agent] -= 1
+            self._push(agent)
+        if ticket and ticket["status"] != "Erledigt" and ticket["assigned_to"] in self._load:
+            self._add(ticket_id, ticket["assigned_to"], self.weights[ticket["priority"]])
+            self._push(ticket["assigned_to"])
+
+    def _push(self, agent: str) -> None:
+        entry = (self._load[agent], self._open[agent], agent)
+        for category in self._skills[agent]:
+            heapq.heappush(self._heaps[category], entry)
+
+    def _pick(self, category: str) -> str | None:
+        """Nutzer mit der geringsten Last für ``category``; veraltete Einträge fliegen raus."""
+        heap = self._heaps.get(category, [])
+        while heap:
+            load, count, agent = heap[0]
+            if agent in self._load and (load, count) == (self._load[agent], self._open[agent]):
+                return agent
+            heapq.heappop(heap)
+        return None
+
+    # ---- Zuweisen ----
+    def assign(self, ticket_id: int) -> str | None:
+        """Offenes, unzugewiesenes Ticket dem am wenigsten belasteten passenden Nutzer geben.
+
+        Liefert den (neuen oder schon vorhandenen) Bearbeiter, ``None`` ohne passenden Nutzer.
+        """
+        with self._lock:
+            self.sync()
+            ticket = self.db.get_ticket_by_id(ticket_id)
+            if ticket is None or ticket["assigned_to"] or ticket["status"] == "Erledigt":
+                return ticket["assigned_to"] if ticket else None
+            agent = self._pick(ticket["category"])
+            if agent is None:
+                return None
+            try:
+                cur = self.db._write(
+                    "UPDATE tickets SET assigned_to = ? WHERE id = ? AND assigned_to IS NULL",
+                    (agent, ticket_id),
+                )
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Datenbankfehler (Zuweisung): {e}") from e
+            if not cur.rowcount:
+                return self.db.get_ticket_by_id(ticket_id)["assigned_to"]
+            self._apply(ticket_id, {**ticket, "assigned_to": agent})
+            return agent
+
+    def _plan(self, tickets, keep_current: bool) -> list[tuple[str, int]]:
+        """Zuweisungen für ``tickets`` (schwerste zuerst) im Index verbuchen; Änderungen zurück."""
+        moves = []
+        for ticket in sorted(tickets, key=lambda t: (-self.weights[t["priority"]], t["created_at"], t["id"])):
+            agent = self._pick(ticket["category"])
+            if agent is None:
+                continue
+            current = ticket["assigned_to"]
+            weight = self.weights[ticket["priority"]]
+            # Bisheriger Bearbeiter behält das Ticket, wenn er kaum mehr belastet ist
+            if keep_current and current in self._load and ticket["category"] in self._skills[current]:
+                if self._load[current] <= self._load[agent] + weight:
+                    agent = current
+            self._add(ticket["id"], agent, weight)
+            self._push(agent)
+            if agent != current:
+                moves.append((agent, ticket["id"]))
+        return moves
+
+    def _write_moves(self, rows: list[tuple], condition: str) -> int:
+        """``(Nutzer, Ticket‑ID, *Parameter von condition)`` in einer Transaktion schreiben."""
+
+        def work(cur: sqlite3.Cursor) -> int:
+            cur.executemany(f"UPDATE tickets SET assigned_to = ? WHERE id = ? AND {condition}", rows)
+            return cur.rowcount
+
+        try:
+            return self.db._write_transaction(work)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Zuweisung): {e}") from e
+
+    def dispatch_unassigned(self) -> int:
+        """Alle offenen, unzugewiesenen Tickets verteilen – eine Transaktion."""
+        with self._lock:
+            self.sync()
+            try:
+                self.db.cursor.execute(
+                    "SELECT id, priority, category, created_at, assigned_to FROM tickets "
+                    "WHERE assigned_to IS NULL AND status IN ('Neu', 'In Bearbeitung')"
+                )
+                tickets = [dict(row) for row in self.db.cursor.fetchall()]
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Datenbankfehler (Zuweisung): {e}") from e
+            moves = self._plan(tickets, keep_current=False)
+            written = self._write_moves(moves, "assigned_to IS NULL") if moves else 0
+            # Was inzwischen jemand anders zugewiesen hat, korrigiert der nächste Feed‑Abgleich
+            self.sync()
+            return written
+
+    def rebalance(self) -> dict:
+        """Rückstand (Status "Neu") gleichmäßig neu verteilen – eine Transaktion.
+
+        Tickets in Bearbeitung bleiben, wo sie sind, und zählen als Grundlast.
+        Verschoben wird nur, wo der bisherige Bearbeiter spürbar mehr Last hätte.
+        """
+        with self._lock:
+            self.rebuild()
+            try:
+                self.db.cursor.execute(
+                    "SELECT id, priority, category, created_at, assigned_to FROM tickets WHERE status = 'Neu'"
+                )
+                tickets = [dict(row) for row in self.db.cursor.fetchall()]
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Datenbankfehler (Neuverteilung): {e}") from e
+            for ticket in tickets:
+                if ticket["id"] in self._tickets:
+                    self._apply(ticket["id"], None)
+            moves = self._plan(tickets, keep_current=True)
+            previous = {t["id"]: t["assigned_to"] for t in tickets}
+            # Nur verschieben, wenn das Ticket seit dem Lesen unverändert ist
+            written = 0
+            if moves:
+                written = self._write_moves(
+                    [(agent, ticket_id, previous[ticket_id]) for agent, ticket_id in moves],
+                    "status = 'Neu' AND assigned_to IS ?",
+                )
+            self.rebuild()
+            return {"tickets": len(tickets), "moved": written, "agents": self.stats()}
+
+    # ---- Auskunft / Pflege ----
+    def stats(self) -> list[dict]:
+        with self._lock:
+            return [
+                {
+                    "Bearbeiter": agent,
+                    "Last": self._load[agent],
+                    "Offen": self._open[agent],
+                    "Kategorien": ", ".join(sorted(self._skills[agent])),
+                }
+                for agent in sorted(self._load)
+            ]
+
+    def set_skills(self, username: str, categories: list[str]) -> None:
+        """Kategorien eines Support‑Nutzers setzen (leer = alle)."""
+        unknown = set(categories) - set(CATEGORIES)
+        if unknown:
+            raise ValidationError(f"Unbekannte Kategorie: {', '.join(sorted(unknown))}")
+
+        def work(cur: sqlite3.Cursor) -> None:
+            cur.execute("DELETE FROM support_skills WHERE username = ?", (username,))
+            cur.executemany(
+                "INSERT INTO support_skills (username, category) VALUES (?, ?)",
+                [(username, category) for category in categories],
+            )
+
+        try:
+            self.db._write_transaction(work)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Kategorien speichern): {e}") from e
+        self.rebuild()
+
+
+_dispatchers: dict[str, Dispatcher] = {}
+_dispatchers_lock = threading.Lock()
+
+
+def get_dispatcher(db_path: str = DB_PATH) -> Dispatcher:
+    """Prozessweiter Dispatcher für ``db_path`` (ein Lastindex pro Datenbank)."""
+    with _dispatchers_lock:
+        dispatcher = _dispatchers.get(db_path)
+        if dispatcher is None:
+            dispatcher = _dispatchers[db_path] = Dispatcher(TicketDatabase(db_path))
+        return dispatcher
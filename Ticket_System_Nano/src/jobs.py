@@ -0,0 +1,387 @@
+# -*- coding: utf-8 -*-
+"""Hintergrund‑Jobs für das Nano‑Ticket‑System.
+
+Die Warteschlange ist die Tabelle ``jobs`` in derselben SQLite‑Datei; Jobs
+werden (wie in ``TicketDatabase.add_ticket``) in der Transaktion des
+auslösenden Schreibzugriffs eingereiht. ``Worker`` arbeitet sie mit einem
+kleinen Thread‑Pool ab – im Streamlit‑Prozess oder als eigener Prozess:
+
+    python jobs.py worker --threads 4
+    python jobs.py stats
+    python jobs.py retry-failed
+
+Jeder Job hat einen optionalen Idempotenz‑Schlüssel (zweites Einreihen ist ein
+No‑Op), wird bei Fehlern mit exponentiellem Backoff bis ``max_attempts``
+wiederholt und landet danach als ``failed`` in der Tabelle.
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+import threading
+import time
+import traceback
+
+from dispatch import get_dispatcher
+from reporting import BUCKET_SECONDS, Reports
+from ticket_store import CHANGE_RETENTION, DB_PATH, DatabaseError, TicketDatabase
+
+# Periodische Wartung: Art -> Intervall in Sekunden (Schlüssel pro Intervall)
+DEFAULT_SCHEDULE = {
+    "search.optimize": 24 * 3600,
+    "aggregates.refresh": 24 * 3600,
+    "jobs.purge": 3600,
+    "changes.prune": 3600,
+    "reports.refresh": BUCKET_SECONDS,
+}
+DONE_RETENTION = 7 * 24 * 3600  # erledigte Jobs so lange aufheben
+MAX_BACKOFF = 300.0
+
+
+# -------------------------------------------------
+# Handler
+# -------------------------------------------------
+HANDLERS = {}
+
+
+def handler(kind: str):
+    """Funktion ``fn(db, payload)`` als Handler für Jobs der Art ``kind`` registrieren."""
+
+    def register(fn):
+        HANDLERS[kind] = fn
+        return fn
+
+    return register
+
+
+@handler("sentiment")
+def _score_ticket(db: TicketDatabase, payload: dict) -> None:
+    ticket = db.get_ticket_by_id(payload["ticket_id"])
+    if ticket is None:
+        return  # inzwischen gelöscht
+    score = db.sentiment.score(f"{ticket['title']} {ticket['description'] or ''}".strip())
+    db._write("UPDATE tickets SET sentiment = ? WHERE id = ?", (score, ticket["id"]))
+
+
+@handler("dispatch")
+def _dispatch_ticket(db: TicketDatabase, payload: dict) -> None:
+    get_dispatcher(db.pool.db_path).assign(payload["ticket_id"])
+
+
+@handler("sentiment.rescore")
+def _rescore_all(db: TicketDatabase, payload: dict) -> None:
+    db.rescore_sentiment(batch_size=payload.get("batch_size", 5_000))
+
+
+@handler("aggregates.refresh")
+def _refresh_aggregates(db: TicketDatabase, payload: dict) -> None:
+    db.rebuild_aggregates()
+
+
+@handler("search.optimize")
+def _optimize_search(db: TicketDatabase, payload: dict) -> None:
+    def work(cur: sqlite3.Cursor) -> None:
+        if db.pool.fts_available:
+            # FTS5‑Segmente zusammenführen – hält die Suche nach vielen Updates schnell
+            cur.execute("INSERT INTO tickets_fts(tickets_fts) VALUES ('optimize')")
+        cur.execute("PRAGMA optimize")
+
+    db._write_transaction(work)
+
+
+@handler("jobs.purge")
+def _purge_jobs(db: TicketDatabase, payload: dict) -> None:
+    JobQueue(db).purge(payload.get("older_than", DONE_RETENTION))
+
+
+@handler("changes.prune")
+def _prune_changes(db: TicketDatabase, payload: dict) -> None:
+    db.prune_changes(payload.get("older_than", CHANGE_RETENTION))
+
+
+@handler("reports.refresh")
+def _refresh_reports(db: TicketDatabase, payload: dict) -> None:
+    Reports(db).refresh()
+
+
+# -------------------------------------------------
+# Warteschlange
+# -------------------------------------------------
+def _percentile(values: list[float], pct: float) -> float | None:
+    if not values:
+        return None
+    values = sorted(values)
+    return values[max(0, min(len(values) - 1, round(pct / 100 * len(values)) - 1))]
+
+
+class JobQueue:
+    """Einreihen, Abholen und Abschließen von Jobs über eine ``TicketDatabase``."""
+
+    def __init__(self, db: TicketDatabase):
+        self.db = db
+
+    def enqueue(
+        self,
+        kind: str,
+        payload: dict | None = None,
+        key: str | None = None,
+        delay: float = 0.0,
+        max_attempts: int = 5,
+    ) -> int | None:
+        """Job einreihen; ``None``, wenn ``key`` schon vergeben war."""
+        try:
+            return self.db._write_transaction(
+                lambda cur: self.db._enqueue_job(cur, kind, payload, key, delay, max_attempts)
+            )
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Job einreihen): {e}") from e
+
+    def claim(self) -> dict | None:
+        """Nächsten fälligen Job für diesen Worker reservieren (oder ``None``)."""
+        cur = self.db.cursor
+        while True:
+            now = time.time()
+            cur.execute(
+                "SELECT id FROM jobs WHERE status = 'queued' AND run_after <= ? ORDER BY run_after, id LIMIT 1",
+                (now,),
+            )
+            row = cur.fetchone()
+            if row is None:
+                return None
+
+            def work(c: sqlite3.Cursor) -> sqlite3.Row | None:
+                # status = 'queued' in der WHERE: ein anderer Worker war schneller → rowcount 0
+                c.execute(
+                    """
+                    UPDATE jobs SET status = 'running', attempts = attempts + 1, started_at = ?
+                    WHERE id = ? AND status = 'queued'
+                    """,
+                    (now, row["id"]),
+                )
+                if not c.rowcount:
+                    return None
+                c.execute("SELECT * FROM jobs WHERE id = ?", (row["id"],))
+                return c.fetchone()
+
+            job = self.db._write_transaction(work)
+            if job is not None:
+                return dict(job)
+
+    def complete(self, job_id: int) -> None:
+        self.db._write(
+            "UPDATE jobs SET status = 'done', finished_at = ?, last_error = NULL WHERE id = ?",
+            (time.time(), job_id),
+        )
+
+    def fail(self, job: dict, error: str) -> None:
+        """Erneut einreihen (Backoff) oder nach ``max_attempts`` endgültig als ``failed`` markieren."""
+        now = time.time()
+        if job["attempts"] >= job["max_attempts"]:
+            self.db._write(
+                "UPDATE jobs SET status = 'failed', finished_at = ?, last_error = ? WHERE id = ?",
+                (now, error, job["id"]),
+            )
+            return
+        delay = min(MAX_BACKOFF, 2 ** job["attempts"])
+        self.db._write(
+            "UPDATE jobs SET status = 'queued', run_after = ?, last_error = ? WHERE id = ?",
+            (now + delay, error, job["id"]),
+        )
+
+    def requeue_stale(self, lease: float) -> int:
+        """Jobs, die länger als ``lease`` laufen (abgestürzter Worker), wieder freigeben."""
+        cur = self.db._write(
+            "UPDATE jobs SET status = 'queued', last_error = 'Lease abgelaufen' "
+            "WHERE status = 'running' AND started_at < ?",
+            (time.time() - lease,),
+        )
+        return cur.rowcount
+
+    def retry_failed(self) -> int:
+        cur = self.db._write(
+            "UPDATE jobs SET status = 'queued', attempts = 0, run_after = ? WHERE status = 'failed'",
+            (time.time(),),
+        )
+        return cur.rowcount
+
+    def purge(self, older_than: float = DONE_RETENTION) -> int:
+        cur = self.db._write(
+            "DELETE FROM jobs WHERE status = 'done' AND finished_at < ?", (time.time() - older_than,)
+        )
+        return cur.rowcount
+
+    def stats(self, window: int = 500) -> dict:
+        """Warteschlangen‑Tiefe, Alter des ältesten Jobs und Latenzen der letzten ``window`` Jobs."""
+        cur = self.db.cursor
+        now = time.time()
+        cur.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status")
+        counts = {row["status"]: row["n"] for row in cur.fetchall()}
+        cur.execute("SELECT MIN(created_at) FROM jobs WHERE status = 'queued'")
+        oldest = cur.fetchone()[0]
+        cur.execute(
+            """
+            SELECT kind, finished_at - created_at AS latency, finished_at - started_at AS runtime
+            FROM jobs WHERE status = 'done' ORDER BY id DESC LIMIT ?
+            """,
+            (window,),
+        )
+        recent = cur.fetchall()
+        by_kind: dict[str, list] = {}
+        for row in recent:
+            by_kind.setdefault(row["kind"], []).append(row)
+
+        def summary(rows) -> dict:
+            latency = [r["latency"] for r in rows]
+            runtime = [r["runtime"] for r in rows]
+            return {
+                "jobs": len(rows),
+                "latency_p50_s": _round(_percentile(latency, 50)),
+                "latency_p95_s": _round(_percentile(latency, 95)),
+                "runtime_p95_s": _round(_percentile(runtime, 95)),
+            }
+
+        return {
+            "queued": counts.get("queued", 0),
+            "running": counts.get("running", 0),
+            "done": counts.get("done", 0),
+            "failed": counts.get("failed", 0),
+            "oldest_queued_s": _round(now - oldest) if oldest else None,
+            **summary(recent),
+            "by_kind": {kind: summary(rows) for kind, rows in sorted(by_kind.items())},
+        }
+
+    def recent_failures(self, limit: int = 20) -> list[dict]:
+        cur = self.db.cursor
+        cur.execute(
+            """
+            SELECT id, kind, payload, attempts, last_error, finished_at FROM jobs
+            WHERE status = 'failed' ORDER BY id DESC LIMIT ?
+            """,
+            (limit,),
+        )
+        return [dict(row) for row in cur.fetchall()]
+
+
+def _round(value: float | None) -> float | None:
+    return None if value is None else round(value, 3)
+
+
+# -------------------------------------------------
+# Worker
+# -------------------------------------------------
+class Worker:
+    """Thread‑Pool, der Jobs aus der Tabelle abholt und ausführt."""
+
+    def __init__(
+        self,
+        db_path: str = DB_PATH,
+        threads: int = 2,
+        poll_interval: float = 0.5,
+        lease: float = 600.0,
+        schedule: dict[str, float] | None = None,
+    ):
+        self.db_path = db_path
+        self.threads = threads
+        self.poll_interval = poll_interval
+        self.lease = lease
+        self.schedule = DEFAULT_SCHEDULE if schedule is None else schedule
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._next_maintenance = 0.0
+
+    def start(self) -> "Worker":
+        for i in range(self.threads):
+            thread = threading.Thread(target=self._run, args=(i,), name=f"ticket-jobs-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    @property
+    def alive(self) -> int:
+        return sum(t.is_alive() for t in self._threads)
+
+    def _maintenance(self, queue: JobQueue) -> None:
+        """Periodische Jobs einreihen und verwaiste Jobs freigeben (höchstens einmal pro Minute)."""
+        now = time.time()
+        if now < self._next_maintenance:
+            return
+        self._next_maintenance = now + 60
+        queue.requeue_stale(self.lease)
+        for kind, interval in self.schedule.items():
+            # Ein Schlüssel pro Intervall – mehrere Worker reihen trotzdem nur einmal ein
+            queue.enqueue(kind, key=f"{kind}:{int(now // interval)}")
+
+    def run_once(self, queue: JobQueue) -> bool:
+        """Einen Job abarbeiten; ``False``, wenn nichts fällig war."""
+        job = queue.claim()
+        if job is None:
+            return False
+        fn = HANDLERS.get(job["kind"])
+        try:
+            if fn is None:
+                raise LookupError(f"Kein Handler für Job‑Art '{job['kind']}'")
+            fn(queue.db, json.loads(job["payload"]))
+        except Exception:
+            queue.fail(job, traceback.format_exc(limit=5))
+        else:
+            queue.complete(job["id"])
+        return True
+
+    def _run(self, index: int) -> None:
+        db = TicketDatabase(self.db_path)
+        queue = JobQueue(db)
+        try:
+            while not self._stop.is_set():
+                try:
+                    if index == 0:
+                        self._maintenance(queue)
+                    if not self.run_once(queue):
+                        self._stop.wait(self.poll_interval)
+                except (sqlite3.Error, DatabaseError):
+                    # z. B. dauerhaft gesperrte Datenbank – später erneut versuchen
+                    self._stop.wait(self.poll_interval * 4)
+        finally:
+            db.close()
+
+
+# -------------------------------------------------
+# CLI
+# -------------------------------------------------
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Hintergrund‑Jobs des Ticket‑Systems.")
+    parser.add_argument("--db", default=DB_PATH, help=f"SQLite‑Datei (Standard: {DB_PATH})")
+    sub = parser.add_subparsers(dest="command", required=True)
+    run = sub.add_parser("worker", help="Jobs abarbeiten, bis Strg+C")
+    run.add_argument("--threads", type=int, default=2)
+    sub.add_parser("stats", help="Warteschlangen‑Kennzahlen als JSON")
+    sub.add_parser("retry-failed", help="Fehlgeschlagene Jobs erneut einreihen")
+    args = parser.parse_args(argv)
+
+    if args.command == "worker":
+        worker = Worker(args.db, threads=args.threads).start()
+        print(f"Worker mit {args.threads} Threads läuft (Strg+C beendet).", file=sys.stderr)
+        try:
+            while worker.alive:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            worker.stop()
+        return
+
+    db = TicketDatabase(args.db)
+    queue = JobQueue(db)
+    if args.command == "stats":
+        print(json.dumps(queue.stats(), indent=2))
+    else:
+        print(f"{queue.retry_failed()} Jobs erneut eingereiht", file=sys.stderr)
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
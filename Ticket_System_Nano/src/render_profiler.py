@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""Opt‑in Render‑Profil für einen Streamlit‑Rerun.
+
+``start()`` hängt sich an die Nachrichten‑Queue des laufenden Reruns und zählt
+gesendete Elemente und Bytes; ``section(name)`` misst Abschnitte (Abfragen,
+Spalten, Karten …) exklusiv, d. h. ohne die Zeit verschachtelter Abschnitte.
+Ohne aktives Profil ist ``section`` ein No‑Op.
+"""
+
+import contextlib
+import threading
+import time
+from collections import Counter
+
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+_active = threading.local()
+
+
+class RenderProfile:
+    """Messwerte eines Reruns; ``report()`` liefert sie als Dict."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.wall = 0.0
+        self.sections: dict[str, list] = {}  # name -> [exklusive Sekunden, Aufrufe]
+        self._stack: list[list] = []  # [name, start, Zeit der Kind‑Abschnitte]
+        self.elements: Counter = Counter()
+        self.messages = 0
+        self.payload_bytes = 0
+        self._ctx = None
+        self._original_enqueue = None
+
+    # ---- Abschnitte ----
+    def begin(self, name: str) -> None:
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def end(self) -> None:
+        name, started, children = self._stack.pop()
+        elapsed = time.perf_counter() - started
+        entry = self.sections.setdefault(name, [0.0, 0])
+        entry[0] += elapsed - children
+        entry[1] += 1
+        if self._stack:
+            self._stack[-1][2] += elapsed
+
+    # ---- Nachrichten an das Frontend ----
+    def _on_message(self, msg) -> None:
+        self.messages += 1
+        self.payload_bytes += msg.ByteSize()
+        if msg.WhichOneof("type") != "delta":
+            return
+        kind = msg.delta.WhichOneof("type")
+        if kind == "new_element":
+            self.elements[msg.delta.new_element.WhichOneof("type")] += 1
+        elif kind == "add_block":
+            self.elements[f"block:{msg.delta.add_block.WhichOneof('type') or 'vertical'}"] += 1
+
+    def _attach(self) -> None:
+        # Internes API von Streamlit – fehlt es, gibt es nur Zeiten
+        ctx = get_script_run_ctx()
+        original = getattr(ctx, "_enqueue", None)
+        if original is None:
+            return
+
+        def enqueue(msg):
+            self._on_message(msg)
+            original(msg)
+
+        self._ctx, self._original_enqueue = ctx, original
+        ctx._enqueue = enqueue
+
+    def _detach(self) -> None:
+        if self._ctx is not None:
+            self._ctx._enqueue = self._original_enqueue
+            self._ctx = None
+
+    def report(self) -> dict:
+        measured = sum(seconds for seconds, _ in self.sections.values())
+        return {
+            "wall_ms": round(self.wall * 1000, 2),
+            "sections": {
+                name: {"ms": round(seconds * 1000, 2), "calls": calls}
+                for name, (seconds, calls) in sorted(self.sections.items(), key=lambda kv: -kv[1][0])
+            },
+            "other_ms": round((self.wall - measured) * 1000, 2),
+            "widgets": sum(self.elements.values()),
+            "elements": dict(self.elements.most_common()),
+            "messages": self.messages,
+            "payload_bytes": self.payload_bytes,
+        }
+
+
+def start() -> RenderProfile:
+    """Profil für den aktuellen Rerun beginnen."""
+    profile = RenderProfile()
+    profile._attach()
+    _active.profile = profile
+    return profile
+
+
+def stop() -> RenderProfile | None:
+    """Aktives Profil beenden und zurückgeben (``None``, wenn keines lief)."""
+    profile = getattr(_active, "profile", None)
+    if profile is None:
+        return None
+    _active.profile = None
+    profile._detach()
+    while profile._stack:  # durch Ausnahmen offen gebliebene Abschnitte
+        profile.end()
+    profile.wall = time.perf_counter() - profile.started
+    return profile
+
+
+@contextlib.contextmanager
+def section(name: str):
+    """Abschnitt im aktiven Profil messen; ohne Profil ohne Wirkung."""
+    profile = getattr(_active, "profile", None)
+    if profile is None:
+        yield
+        return
+    profile.begin(name)
+    try:
+        yield
+    finally:
+        # st.stop()/st.rerun() können den Stack schon geleert haben
+        if profile._stack:
+            profile.end()
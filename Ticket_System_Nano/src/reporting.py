@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""Auswertungen für das Admin‑Dashboard: Lösungszeit‑Perzentile und Tages‑Trends.
+
+Gerechnet wird komplett in SQLite (Fensterfunktionen, GROUP BY über Indizes);
+in Python landen nur die aggregierten Zeilen, nie Ticket‑Dicts. Die Ergebnisse
+liegen je Zeit‑Bucket in ``report_cache``:
+
+* Trends je Tag – ein abgeschlossener Tag wird genau einmal berechnet,
+  nur der laufende Tag wird je Bucket erneuert;
+* Perzentile und Verweildauern – ein Eintrag je Stunde (``BUCKET_SECONDS``).
+
+Das Dashboard liest nur den Cache. Ist der Bucket abgelaufen, bekommt es den
+letzten Stand samt ``stale``‑Markierung; neu gerechnet wird im Hintergrund
+(Job ``reports.refresh``) oder, ohne Worker, beim Aufruf.
+"""
+
+import calendar
+import datetime
+import json
+import sqlite3
+import time
+
+from ticket_store import DatabaseError, TicketDatabase, ValidationError, percentile_columns
+
+# Dimension -> Ticket‑Spalte (wie AGGREGATE_DIMENSIONS, ohne Status)
+RESOLUTION_DIMENSIONS = {
+    "priority": "priority",
+    "category": "category",
+    "assignee": "assigned_to",
+}
+BUCKET_SECONDS = 3600
+DAY = 86400
+# Zeiträume im Dashboard (Tage zurück, 0 = alles)
+WINDOWS = (30, 90, 365, 0)
+
+
+def _local_epoch() -> int:
+    """Jetzt in der Zeitrechnung der Ticket‑Zeitstempel (lokal, als UTC gelesen)."""
+    return calendar.timegm(datetime.datetime.now().timetuple())
+
+
+def _format(epoch: int, fmt: str = "%Y-%m-%d %H:%M:%S") -> str:
+    return time.strftime(fmt, time.gmtime(epoch))
+
+
+def _since(days: int, now: int) -> str | None:
+    return _format(now - days * DAY) if days else None
+
+
+class Reports:
+    """Auswertungen über eine ``TicketDatabase``, gecacht je Zeit‑Bucket."""
+
+    def __init__(self, db: TicketDatabase, bucket_seconds: int = BUCKET_SECONDS, clock=_local_epoch):
+        self.db = db
+        self.bucket_seconds = bucket_seconds
+        self.clock = clock
+
+    # ---- Cache ----
+    def _latest(self, report: str) -> sqlite3.Row | None:
+        self.db.cursor.execute(
+            "SELECT bucket, value, computed_at FROM report_cache WHERE report = ? ORDER BY bucket DESC LIMIT 1",
+            (report,),
+        )
+        return self.db.cursor.fetchone()
+
+    def _store(self, report: str, bucket: int, value) -> None:
+        def work(cur: sqlite3.Cursor) -> None:
+            cur.execute(
+                """
+                INSERT INTO report_cache (report, bucket, value, computed_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT(report, bucket) DO UPDATE SET value = excluded.value, computed_at = excluded.computed_at
+                """,
+                (report, bucket, json.dumps(value), self.clock()),
+            )
+            cur.execute("DELETE FROM report_cache WHERE report = ? AND bucket < ?", (report, bucket))
+
+        self.db._write_transaction(work)
+
+    def _bucketed(self, report: str, compute, refresh: bool = False, allow_stale: bool = True) -> dict:
+        """``{"value", "computed_at", "stale"}`` aus dem Cache oder frisch berechnet."""
+        bucket = self.clock() // self.bucket_seconds * self.bucket_seconds
+        try:
+            row = None if refresh else self._latest(report)
+            if row is not None and (row["bucket"] == bucket or allow_stale):
+                return {
+                    "value": json.loads(row["value"]),
+                    "computed_at": row["computed_at"],
+                    "stale": row["bucket"] != bucket,
+                }
+            value = compute()
+            self._store(report, bucket, value)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Auswertung {report}): {e}") from e
+        return {"value": value, "computed_at": self.clock(), "stale": False}
+
+    def invalidate(self) -> None:
+        self.db._write("DELETE FROM report_cache")
+
+    # ---- Lösungszeit ----
+    def _compute_resolution(self, since: str | None) -> dict[str, list[dict]]:
+        # Ein Scan der erledigten Tickets (Index auf status, updated_at), dann je
+        # Dimension ROW_NUMBER/COUNT über derselben materialisierten Menge
+        where = " AND updated_at >= ?" if since else ""
+        ranked = " UNION ALL ".join(
+            f"""
+                SELECT '{dimension}' AS dimension, COALESCE({column}, '') AS label, seconds,
+                       ROW_NUMBER() OVER (PARTITION BY {column} ORDER BY seconds) AS rn,
+                       COUNT(*) OVER (PARTITION BY {column}) AS n
+                FROM closed"""
+            for dimension, column in RESOLUTION_DIMENSIONS.items()
+        )
+        columns = ", ".join(RESOLUTION_DIMENSIONS.values())
+        self.db.cursor.execute(
+            f"""
+            WITH closed AS MATERIALIZED (
+                SELECT {columns},
+                       strftime('%s', updated_at) - strftime('%s', created_at) AS seconds
+                FROM tickets
+                WHERE status = 'Erledigt'{where}
+            )
+            SELECT dimension, label, COUNT(*) AS count, AVG(seconds) AS avg_seconds,
+                   {percentile_columns("seconds", "rn", "n")}
+            FROM ({ranked})
+            GROUP BY dimension, label
+            ORDER BY dimension, label
+            """,
+            (since,) if since else (),
+        )
+        result: dict[str, list[dict]] = {dimension: [] for dimension in RESOLUTION_DIMENSIONS}
+        for row in self.db.cursor.fetchall():
+            result[row["dimension"]].append({k: row[k] for k in row.keys() if k != "dimension"})
+        return result
+
+    def resolution(self, days: int = 90, refresh: bool = False, allow_stale: bool = True) -> dict:
+        """Lösungszeit (Sekunden: Anzahl, Mittel, p50/p90/p99) je Priorität, Kategorie
+        und Bearbeiter für Tickets, die in den letzten ``days`` Tagen erledigt wurden."""
+        if days not in WINDOWS:
+            raise ValidationError(f"Unbekannter Zeitraum: {days}")
+        return self._bucketed(
+            f"resolution:{days}",
+            lambda: self._compute_resolution(_since(days, self.clock())),
+            refresh,
+            allow_stale,
+        )
+
+    def time_in_status(self, days: int = 90, refresh: bool = False, allow_stale: bool = True) -> dict:
+        """Verweildauer je Status aus der Historie (``TicketDatabase.time_in_status``)."""
+        if days not in WINDOWS:
+            raise ValidationError(f"Unbekannter Zeitraum: {days}")
+        return self._bucketed(
+            f"time_in_status:{days}",
+            lambda: self.db.time_in_status(since=_since(days, self.clock())),
+            refresh,
+            allow_stale,
+        )
+
+    # ---- Trends ----
+    def trends(self, days: int = 30) -> list[dict]:
+        """Angelegt/erledigt je Tag für die letzten ``days`` Tage (inkl. heute).
+
+        Abgeschlossene Tage kommen aus dem Cache; berechnet wird nur der Bereich
+        ab dem ersten fehlenden Tag – im Normalfall nur der laufende Bucket.
+        """
+        now = self.clock()
+        today = now // DAY * DAY
+        first = today - (days - 1) * DAY
+        try:
+            self.db.cursor.execute(
+                "SELECT bucket, value, computed_at FROM report_cache "
+                "WHERE report = 'trend' AND bucket >= ? ORDER BY bucket",
+                (first,),
+            )
+            cached = {row["bucket"]: row for row in self.db.cursor.fetchall()}
+            missing = [
+                day
+                for day in range(first, today + DAY, DAY)
+                if day not in cached
+                # Ein Tag ist endgültig, wenn nach seinem Ende berechnet; heute je Bucket
+                or (day == today and now - cached[day]["computed_at"] >= self.bucket_seconds)
+                or (day != today and cached[day]["computed_at"] < day + DAY)
+            ]
+            if missing:
+                self._compute_trends(missing[0], today + DAY)
+                self.db.cursor.execute(
+                    "SELECT bucket, value, computed_at FROM report_cache "
+                    "WHERE report = 'trend' AND bucket >= ? ORDER BY bucket",
+                    (first,),
+                )
+                cached = {row["bucket"]: row for row in self.db.cursor.fetchall()}
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Trends): {e}") from e
+        return [
+            {"day": _format(day, "%Y-%m-%d"), **json.loads(cached[day]["value"])}
+            for day in range(first, today + DAY, DAY)
+            if day in cached
+        ]
+
+    def _compute_trends(self, start: int, end: int) -> None:
+        rows = self.db.throughput_per_day(since=_format(start), until=_format(end))
+        by_day = {row["day"]: row for row in rows}
+        computed_at = self.clock()
+
+        def work(cur: sqlite3.Cursor) -> None:
+            values = []
+            for day in range(start, end, DAY):
+                row = by_day.get(_format(day, "%Y-%m-%d"), {})
+                values.append(
+                    ("trend", day, json.dumps({"created": row.get("created", 0), "closed": row.get("closed", 0)}), computed_at)
+                )
+            cur.executemany(
+                """
+                INSERT INTO report_cache (report, bucket, value, computed_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT(report, bucket) DO UPDATE SET value = excluded.value, computed_at = excluded.computed_at
+                """,
+                values,
+            )
+
+        self.db._write_transaction(work)
+
+    # ---- Hintergrund ----
+    def refresh(self, windows=WINDOWS) -> None:
+        """Alle Auswertungen für den aktuellen Bucket vorberechnen (Job ``reports.refresh``)."""
+        for days in windows:
+            self.resolution(days, refresh=True)
+            self.time_in_status(days, refresh=True)
+        self.trends()
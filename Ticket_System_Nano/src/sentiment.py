@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""Sentiment‑Bewertung der Tickets über ein vorkompiliertes Lexikon.
+
+Das Lexikon ordnet jedem Label (Emoji) eine Wortliste zu; die Reihenfolge der
+Labels ist die Priorität (das erste gefundene Label mit der höchsten
+Priorität gewinnt). Gesucht wird wie bisher nach Teilwörtern („Druckerproblem“
+enthält „problem“), aber mit *einem* regulären Ausdruck, der als Präfix‑Baum
+(Trie) aufgebaut ist – die Kosten wachsen kaum mit der Größe des Lexikons.
+
+Ein eigenes Lexikon kommt als JSON (``{"😊": ["super", …], "😡": […]}``) über
+``TICKET_SENTIMENT_LEXICON`` oder ``SentimentEngine.from_file``.
+"""
+
+import hashlib
+import json
+import os
+import re
+
+NEUTRAL = "😐"
+
+DEFAULT_LEXICON = {
+    "😊": ["glücklich", "super", "gut", "freut", "freude", "erfreut", "positiv"],
+    "😡": ["böse", "schlecht", "problem", "fehler", "frust", "negativ", "möglicherweise"],
+}
+
+
+def _trie_pattern(words) -> str:
+    """Wörter als Regex‑Präfix‑Baum: ``fehler|frust`` → ``f(?:ehler|rust)``."""
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        if "" in node:
+            # Wortende mit längeren Fortsetzungen: gierig die längste nehmen
+            return f"(?:{body})?"
+        return body
+
+    return build(trie)
+
+
+class SentimentEngine:
+    """Bewertet Texte anhand eines Lexikons; einmal kompiliert, beliebig oft nutzbar."""
+
+    def __init__(self, lexicon: dict[str, list[str]] | None = None, neutral: str = NEUTRAL):
+        lexicon = DEFAULT_LEXICON if lexicon is None else lexicon
+        self.neutral = neutral
+        self.lexicon = {
+            label: sorted({w.strip().lower() for w in words if w.strip()})
+            for label, words in lexicon.items()
+        }
+        self.labels = list(self.lexicon)
+        # Rang je Wort; steht ein Wort unter mehreren Labels, zählt das wichtigste
+        self._rank: dict[str, int] = {}
+        for rank, words in enumerate(self.lexicon.values()):
+            for word in words:
+                self._rank.setdefault(word, rank)
+        self._any = re.compile(_trie_pattern(self._rank)) if self._rank else None
+        # _better[r]: nur Wörter mit höherer Priorität als Rang r
+        self._better = []
+        for rank in range(len(self.labels)):
+            better = [w for w, r in self._rank.items() if r < rank]
+            self._better.append(re.compile(_trie_pattern(better)) if better else None)
+        self.version = hashlib.sha1(
+            json.dumps([neutral, list(self.lexicon.items())], ensure_ascii=False).encode("utf-8")
+        ).hexdigest()[:12]
+
+    @classmethod
+    def from_file(cls, path: str) -> "SentimentEngine":
+        with open(path, encoding="utf-8") as fh:
+            return cls(json.load(fh))
+
+    def extend(self, extra: dict[str, list[str]]) -> "SentimentEngine":
+        """Neue Engine mit zusätzlichen Wörtern (neue Labels kommen hinten an)."""
+        merged = {label: list(words) for label, words in self.lexicon.items()}
+        for label, words in extra.items():
+            merged.setdefault(label, []).extend(words)
+        return SentimentEngine(merged, self.neutral)
+
+    def score(self, text: str | None) -> str:
+        if not text or self._any is None:
+            return self.neutral
+        lowered = text.lower()
+        match = self._any.search(lowered)
+        if match is None:
+            return self.neutral
+        rank = self._rank[match.group()]
+        # Nur noch nach Wörtern mit höherer Priorität suchen, ab dem ersten Treffer
+        while rank and self._better[rank] is not None:
+            match = self._better[rank].search(lowered, match.start())
+            if match is None:
+                break
+            rank = self._rank[match.group()]
+        return self.labels[rank]
+
+    def score_many(self, texts) -> list[str]:
+        score = self.score
+        return [score(text) for text in texts]
+
+
+_engine: SentimentEngine | None = None
+
+
+def get_engine() -> SentimentEngine:
+    """Prozessweite Engine – Standard‑Lexikon oder ``TICKET_SENTIMENT_LEXICON``."""
+    global _engine
+    if _engine is None:
+        path = os.environ.get("TICKET_SENTIMENT_LEXICON")
+        _engine = SentimentEngine.from_file(path) if path else SentimentEngine()
+    return _engine
@@ -0,0 +1,1842 @@
+# -*- coding: utf-8 -*-
+"""Datenschicht des Ticket‑Systems – SQLite‑Speicher ohne Streamlit‑Abhängigkeit.
+
+Fehler werden als ``TicketStoreError`` (bzw. Unterklassen) geworfen; die
+Streamlit‑Oberfläche in ``app.py`` zeigt sie an. Das Modul lässt sich damit auch
+aus Workern, Importern und Benchmarks direkt verwenden.
+"""
+
+import dataclasses
+import datetime
+import functools
+import hashlib
+import json
+import os
+import random
+import re
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+from sentiment import SentimentEngine, get_engine
+
+# Gemeinsames Paket ticket_common liegt in der Repo‑Wurzel
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
+
+from ticket_common.query_log import ProfiledConnection, QueryLog  # noqa: E402
+
+
+# -------------------------------------------------
+# Fehler
+# -------------------------------------------------
+class TicketStoreError(Exception):
+    """Basis für alle Fehler der Datenschicht; die Meldung ist für Nutzer gedacht."""
+
+
+class ValidationError(TicketStoreError, ValueError):
+    """Ungültige Eingabe (leerer Titel, doppelter Benutzer …)."""
+
+
+class PermissionDenied(TicketStoreError):
+    """Die Rolle darf die Aktion auf diesem Ticket nicht ausführen."""
+
+
+class DatabaseError(TicketStoreError):
+    """SQLite‑Fehler, ergänzt um die betroffene Operation."""
+
+# -------------------------------------------------
+# Hilfs‑Funktionen
+# -------------------------------------------------
+def get_sentiment(text: str) -> str:
+    """Entscheidet per Lexikon (``sentiment.py``), ob ein Ticket positiv, negativ oder neutral klingt."""
+    return get_engine().score(text)
+
+
+# -------------------------------------------------
+# Verbindungs‑Pool
+# -------------------------------------------------
+DB_PATH = "data/tickets.db"
+
+
+@dataclasses.dataclass
+class StorageProfile:
+    """PRAGMA‑ und Retry‑Einstellungen für die SQLite‑Verbindungen.
+
+    Standard ist WAL mit ``synchronous=NORMAL``: Leser blockieren keine Schreiber
+    mehr und ein ``update_status`` hält nicht das ganze Board an. Alle Werte lassen
+    sich per Umgebungsvariable ``TICKET_DB_<FELD>`` überschreiben.
+    """
+
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    mmap_size: int = 256 * 1024 * 1024
+    cache_size: int = -64_000  # negativ = KiB
+    busy_timeout: int = 5_000  # ms
+    write_retries: int = 5
+    retry_backoff: float = 0.05  # s, verdoppelt sich pro Versuch
+    max_backoff: float = 1.0
+    cache_entries: int = 256  # Lese‑Cache (0 = aus)
+    cache_ttl: float = 30.0  # s
+    slow_query_ms: float = 100.0  # ab hier mit Query‑Plan ins Slow‑Log
+    query_samples: int = 1_024  # Messwerte je Statement (0 = Messung aus)
+
+    @classmethod
+    def from_env(cls) -> "StorageProfile":
+        values = {}
+        for field in dataclasses.fields(cls):
+            raw = os.environ.get(f"TICKET_DB_{field.name.upper()}")
+            if raw is not None:
+                values[field.name] = type(field.default)(raw)
+        return cls(**values)
+
+    def apply(self, conn: sqlite3.Connection) -> None:
+        conn.execute(f"PRAGMA journal_mode = {self.journal_mode}")
+        conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+        conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        conn.execute(f"PRAGMA cache_size = {int(self.cache_size)}")
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout)}")
+
+
+class LockStats:
+    """Zählt Sperr‑Konflikte beim Schreiben, damit Contention sichtbar wird."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.writes = 0
+        self.retries = 0
+        self.failures = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record(self, retries: int, waited: float, failed: bool = False) -> None:
+        with self._lock:
+            self.writes += 1
+            self.retries += retries
+            self.wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+            if failed:
+                self.failures += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "writes": self.writes,
+                "retries": self.retries,
+                "failures": self.failures,
+                "wait_seconds": round(self.wait_seconds, 4),
+                "max_wait_seconds": round(self.max_wait_seconds, 4),
+            }
+
+
+class ConnectionPool:
+    """Hält SQLite‑Verbindungen prozessweit offen und gibt sie pro Thread aus.
+
+    Streamlit startet für jeden Rerun einen eigenen Thread. Statt bei jedem Rerun
+    neu zu verbinden, bekommt der Thread eine freie Verbindung aus dem Pool und
+    gibt sie mit ``release()`` am Ende des Reruns wieder zurück.
+    """
+
+    def __init__(
+        self,
+        db_path: str = DB_PATH,
+        max_idle: int = 8,
+        profile: StorageProfile | None = None,
+    ):
+        self.db_path = db_path
+        self.max_idle = max_idle
+        self.profile = profile or StorageProfile.from_env()
+        self.lock_stats = LockStats()
+        self.cache = QueryCache(self.profile.cache_entries, self.profile.cache_ttl)
+        self.query_log = QueryLog(self.profile.slow_query_ms, self.profile.query_samples)
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir and not os.path.isdir(db_dir):
+            os.makedirs(db_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._schema_lock = threading.Lock()
+        self._local = threading.local()
+        self._idle: list[sqlite3.Connection] = []
+        self._schema_ready = False
+        self.fts_available = False
+        # Zuletzt gesehene Sequenz des Änderungs‑Feeds (siehe TicketDatabase.changes_since)
+        self.change_seq = 0
+        self.connects = 0
+        self.reuses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        # Verbindungen wandern zwischen Threads, werden aber nie gleichzeitig genutzt
+        if self.query_log.enabled:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, factory=ProfiledConnection)
+            conn.query_log = self.query_log
+        else:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON")
+        self.profile.apply(conn)
+        self.connects += 1
+        return conn
+
+    def acquire(self) -> sqlite3.Connection:
+        """Verbindung des aktuellen Threads – wiederverwendet, sonst aus dem Pool."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        with self._lock:
+            if self._idle:
+                conn = self._idle.pop()
+                self.reuses += 1
+        if conn is None:
+            conn = self._connect()
+        self._local.conn = conn
+        self._local.cursor = conn.cursor()
+        return conn
+
+    def cursor(self) -> sqlite3.Cursor:
+        self.acquire()
+        return self._local.cursor
+
+    def release(self) -> None:
+        """Verbindung des aktuellen Threads zurück in den Pool legen."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            return
+        self._local.conn = None
+        self._local.cursor = None
+        if conn.in_transaction:
+            conn.rollback()
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def ensure_schema(self, create_schema) -> None:
+        """Schema‑Setup genau einmal pro Prozess (und Datenbankdatei) ausführen."""
+        if self._schema_ready:
+            return
+        with self._schema_lock:
+            if self._schema_ready:
+                return
+            create_schema()
+            self._schema_ready = True
+
+    def close_all(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+        self.release()
+
+    def stats(self) -> dict:
+        return {
+            "connects": self.connects,
+            "reuses": self.reuses,
+            "idle": len(self._idle),
+            **self.lock_stats.snapshot(),
+        }
+
+
+class QueryCache:
+    """Begrenzter Lese‑Cache (TTL + LRU) vor den Ticket‑ und Report‑Abfragen.
+
+    Jeder Eintrag merkt sich die Schreib‑Generation, zu der er geladen wurde.
+    ``invalidate()`` erhöht die Generation nach jedem Commit – ältere Einträge
+    gelten damit sofort als veraltet. Schreibzugriffe anderer Prozesse sieht der
+    Cache erst nach Ablauf der TTL.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = 30.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.generation = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(name: str, args: tuple) -> tuple:
+        """Filter‑Argumente normalisieren: Listen ungeordnet, Texte ohne Leerraum.
+
+        Tupel (z. B. Keyset‑Cursor) behalten ihre Reihenfolge.
+        """
+
+        def norm(value):
+            if isinstance(value, (list, set)):
+                return tuple(sorted(norm(v) for v in value))
+            if isinstance(value, tuple):
+                return tuple(norm(v) for v in value)
+            if isinstance(value, str):
+                return value.strip()
+            return value
+
+        return (name,) + tuple(norm(a) for a in args)
+
+    def get(self, key: tuple):
+        """``(True, wert)`` bei gültigem Treffer, sonst ``(False, None)``."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                generation, expires, value = entry
+                if generation == self.generation and expires > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key: tuple, value, generation: int) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            if generation != self.generation:
+                # Während des Ladens wurde geschrieben – Ergebnis nicht cachen
+                return
+            self._entries[key] = (generation, time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self.generation += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "generation": self.generation,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+_pools: dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: str = DB_PATH) -> ConnectionPool:
+    """Liefert den prozessweiten Pool für ``db_path``."""
+    with _pools_lock:
+        pool = _pools.get(db_path)
+        if pool is None:
+            pool = _pools[db_path] = ConnectionPool(db_path)
+        return pool
+
+
+# -------------------------------------------------
+# Berechtigungen
+# -------------------------------------------------
+class PermissionEvaluator:
+    """Ticket‑Rechte eines Nutzers, entschieden aus Rolle und bereits geladenem Ticket.
+
+    Die Rolle wird einmal pro Request aufgelöst; danach kostet ``can_edit`` keine
+    Datenbankabfrage mehr. Regeln: Administrator darf alles, Support alle offenen
+    Tickets, Anwender nur einsehen.
+    """
+
+    def __init__(self, username: str, role: str | None):
+        self.username = username
+        self.role = role
+
+    @property
+    def may_edit_any(self) -> bool:
+        return self.role in {"Administrator", "Support"}
+
+    def can_edit(self, ticket: dict | None) -> bool:
+        if not ticket or not self.role:
+            return False
+        if self.role == "Administrator":
+            return True
+        if self.role == "Support" and ticket["status"] != "Erledigt":
+            return True
+        # Anwender dürfen nur einsehen (keine Änderungen)
+        return False
+
+    def sql_condition(self) -> str:
+        """Dieselbe Regel als WHERE‑Bedingung – prüft und schreibt in einem Statement."""
+        if self.role == "Administrator":
+            return "1"
+        if self.role == "Support":
+            return "status != 'Erledigt'"
+        return "0"
+
+
+# -------------------------------------------------
+# SQLite‑Wrapper‑Klasse
+# -------------------------------------------------
+# Sekundär‑Indizes passend zu den Board‑Filtern (_build_ticket_query) und Reports
+TICKET_INDEXES = {
+    # Board: status = ? ORDER BY updated_at DESC, id DESC (Keyset pro Spalte);
+    # Reports: COUNT/Durchschnitt je Status
+    # (rowid hängt implizit hinten an → Keyset auf (updated_at, id) ohne Sortierung)
+    "idx_tickets_status_updated": "tickets(status, updated_at)",
+    # Board ohne Status‑Filter / reine Sortierung
+    "idx_tickets_updated": "tickets(updated_at DESC)",
+    # "Meine Tickets" (Anwender) und Zuweisungs‑Queue (Support); aufsteigend, damit
+    # der Rückwärts‑Scan exakt (updated_at DESC, id DESC) liefert
+    "idx_tickets_created_by_updated_at": "tickets(created_by, updated_at)",
+    "idx_tickets_assigned_status_updated_at": "tickets(assigned_to, status, updated_at)",
+}
+
+# Früher angelegte Indizes, die durch TICKET_INDEXES ersetzt wurden
+OBSOLETE_INDEXES = (
+    "idx_tickets_status_priority_updated",
+    "idx_tickets_created_by_updated",
+    "idx_tickets_assigned_status_updated",
+)
+
+# Tickets pro "Mehr laden"-Schritt einer Kanban‑Spalte
+BOARD_PAGE_SIZE = 25
+
+# Änderungs‑Feed: so viele Einträge höchstens pro Abruf, so lange aufheben
+CHANGE_FEED_LIMIT = 500
+CHANGE_RETENTION = 24 * 3600
+
+# Dimensionen der Zusammenfassungs‑Tabelle ticket_aggregates → Ticket‑Spalte
+# (nicht zugewiesene Tickets landen unter dem Label '')
+AGGREGATE_DIMENSIONS = {
+    "status": "status",
+    "priority": "priority",
+    "category": "category",
+    "assignee": "assigned_to",
+    "creator": "created_by",
+}
+
+# Spalten, die der Bulk‑Import aus CSV/JSONL übernimmt
+IMPORT_COLUMNS = (
+    "title", "description", "priority", "category", "status",
+    "created_at", "updated_at", "created_by", "last_updated_by",
+    "support_feedback", "internal_notes", "assigned_to",
+)
+
+# Volltext‑Index (FTS5, external content) über die durchsuchbaren Ticket‑Felder
+FTS_COLUMNS = ("title", "description", "support_feedback", "internal_notes")
+# bm25‑Gewichte in Reihenfolge von FTS_COLUMNS – Treffer im Titel zählen am meisten
+FTS_WEIGHTS = (10.0, 4.0, 2.0, 1.0)
+
+
+def fts_match_expression(search: str) -> str | None:
+    """Suchtext in eine sichere FTS5‑Abfrage übersetzen (alle Wörter, Präfix‑Treffer)."""
+    tokens = re.findall(r"\w+", search.lower())
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+PERCENTILES = (50, 90, 99)
+
+
+def percentile_columns(value: str, rank: str, count: str, percentiles=PERCENTILES) -> str:
+    """SELECT‑Spalten ``p50``, ``p90`` … (Nearest‑Rank) für eine nach ``value``
+    durchnummerierte Menge (``rank`` = ROW_NUMBER, ``count`` = Gruppengröße)."""
+    return ", ".join(
+        f"MIN(CASE WHEN {rank} * 100 >= {pct} * {count} THEN {value} END) AS p{pct}"
+        for pct in percentiles
+    )
+
+
+def timed(method):
+    """Laufzeit einer ``TicketDatabase``‑Methode in ``pool.query_log`` erfassen.
+
+    Die Differenz zur SQL‑Zeit ist Dict‑Aufbau, Cache und Python‑Logik.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        log = self.pool.query_log
+        if not log.enabled:
+            return method(self, *args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            log.record("method", method.__name__, time.perf_counter() - started)
+
+    return wrapper
+
+
+class TicketDatabase:
+    """Zugriff auf Tickets und Benutzer; wirft ``TicketStoreError`` statt Meldungen anzuzeigen."""
+
+    def __init__(
+        self,
+        db_path: str = DB_PATH,
+        pool: ConnectionPool | None = None,
+        sentiment: SentimentEngine | None = None,
+    ):
+        self.db_path = db_path
+        self.pool = pool or get_pool(db_path)
+        self.sentiment = sentiment or get_engine()
+        # True, sobald ein jobs.Worker läuft: Anreicherung nach dem Commit statt im Request
+        self.defer_enrichment = False
+        # Neue Tickets automatisch zuweisen (dispatch.Dispatcher; mit Worker als Job)
+        self.auto_dispatch = False
+
+        try:
+            self.pool.ensure_schema(self._create_schema)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Konnte Datenbank nicht öffnen: {e}") from e
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        return self.pool.acquire()
+
+    @property
+    def cursor(self) -> sqlite3.Cursor:
+        return self.pool.cursor()
+
+    def close(self):
+        """Verbindung dieses Threads an den Pool zurückgeben."""
+        try:
+            self.pool.release()
+        except Exception:
+            pass
+
+    # ---- Schreiben mit Retry ----
+    @staticmethod
+    def _is_lock_error(exc: sqlite3.OperationalError) -> bool:
+        msg = str(exc).lower()
+        return "locked" in msg or "busy" in msg
+
+    def _write_transaction(self, work):
+        """``work(cursor)`` in einer Transaktion ausführen und committen.
+
+        Die Schreibsperre wird vorab mit ``BEGIN IMMEDIATE`` geholt; die Zeit
+        dafür (inkl. Warten im ``busy_timeout``) landet in ``pool.lock_stats``.
+        Bei ``database is locked`` wird zurückgerollt und mit begrenztem,
+        exponentiellem Backoff erneut versucht.
+        """
+        profile = self.pool.profile
+        conn = self.conn
+        retries = 0
+        waited = 0.0
+        while True:
+            started = time.perf_counter()
+            locked = False
+            try:
+                if not conn.in_transaction:
+                    self.cursor.execute("BEGIN IMMEDIATE")
+                locked = True
+                waited += time.perf_counter() - started
+                result = work(self.cursor)
+                conn.commit()
+                self.pool.cache.invalidate()
+                self.pool.lock_stats.record(retries, waited)
+                return result
+            except sqlite3.OperationalError as e:
+                if conn.in_transaction:
+                    conn.rollback()
+                if not self._is_lock_error(e):
+                    raise
+                if not locked:
+                    # Zeit, die SQLite selbst im busy_timeout gewartet hat
+                    waited += time.perf_counter() - started
+                if retries >= profile.write_retries:
+                    self.pool.lock_stats.record(retries, waited, failed=True)
+                    raise
+                delay = min(profile.max_backoff, profile.retry_backoff * 2 ** retries)
+                delay *= random.uniform(0.5, 1.0)
+                time.sleep(delay)
+                waited += delay
+                retries += 1
+            except sqlite3.Error:
+                if conn.in_transaction:
+                    conn.rollback()
+                raise
+
+    def _cached(self, name: str, args: tuple, load):
+        """Ergebnis von ``load()`` über ``pool.cache`` holen (Ergebnisse nicht verändern)."""
+        cache = self.pool.cache
+        key = cache.make_key(name, args)
+        hit, value = cache.get(key)
+        if hit:
+            return value
+        generation = cache.generation
+        value = load()
+        cache.put(key, value, generation)
+        return value
+
+    def _write(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        """Einzelnes Schreib‑Statement mit Retry; liefert den Cursor (rowcount/lastrowid)."""
+        return self._write_transaction(lambda cur: cur.execute(sql, params))
+
+    # ---- Schema ----
+    def _create_schema(self):
+        """Tabellen créer und ggf. fehlende Spalten ergänzen."""
+        # Users
+        self.cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS users (
+                username TEXT PRIMARY KEY,
+                password_hash TEXT NOT NULL,
+                role TEXT NOT NULL CHECK(role IN ('Anwender', 'Support', 'Administrator'))
+            )
+            """
+        )
+
+        # Tickets
+        self.cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS tickets (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                description TEXT,
+                priority TEXT NOT NULL CHECK(priority IN ('Niedrig', 'Mittel', 'Hoch')),
+                category TEXT NOT NULL CHECK(category IN ('Bug', 'Feature', 'Support')),
+                status TEXT NOT NULL CHECK(status IN ('Neu', 'In Bearbeitung', 'Erledigt')),
+                created_at DATETIME NOT NULL,
+                updated_at DATETIME NOT NULL,
+                created_by TEXT NOT NULL,
+                last_updated_by TEXT,
+                feedback TEXT,
+                support_feedback TEXT,
+                internal_notes TEXT DEFAULT NULL,
+                sentiment TEXT DEFAULT NULL,
+                assigned_to TEXT,
+                FOREIGN KEY (created_by) REFERENCES users(username),
+                FOREIGN KEY (last_updated_by) REFERENCES users(username),
+                FOREIGN KEY (assigned_to) REFERENCES users(username)
+            )
+            """
+        )
+        self.conn.commit()
+
+        # Add extra columns only if they do not yet exist
+        for col in ("support_feedback", "internal_notes", "sentiment"):
+            self.cursor.execute(
+                "SELECT * FROM pragma_table_info('tickets') WHERE name = ?", (col,)
+            )
+            if not self.cursor.fetchone():
+                self.cursor.execute(f"ALTER TABLE tickets ADD COLUMN {col} TEXT DEFAULT NULL")
+                self.conn.commit()
+
+        self._create_indexes()
+        self._create_search_index()
+        self._create_meta()
+        self._create_aggregates()
+        self._create_jobs()
+        self._create_change_feed()
+        self._create_events()
+        self._create_report_cache()
+        self._create_skills()
+
+        # Ensure default admin user exists
+        self.cursor.execute("SELECT username FROM users WHERE username = ?", ("admin",))
+        if not self.cursor.fetchone():
+            self.cursor.execute(
+                "INSERT INTO users (username, password_hash, role) VALUES (?, ?, ?)",
+                ("admin", hashlib.sha256(b"admin123").hexdigest(), "Administrator"),
+            )
+            self.conn.commit()
+
+    def _create_indexes(self):
+        """Indizes anlegen und Planer‑Statistiken aktuell halten."""
+        for name in OBSOLETE_INDEXES:
+            self.cursor.execute(f"DROP INDEX IF EXISTS {name}")
+        for name, target in TICKET_INDEXES.items():
+            self.cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+        self.conn.commit()
+        # Aktualisiert sqlite_stat1 nur dort, wo es sich lohnt (billig bei jedem Start)
+        self.cursor.execute("PRAGMA optimize")
+
+    def _create_search_index(self):
+        """FTS5‑Tabelle plus Trigger anlegen; ohne FTS5 bleibt die LIKE‑Suche aktiv."""
+        self.cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tickets_fts'"
+        )
+        exists = self.cursor.fetchone() is not None
+        cols = ", ".join(FTS_COLUMNS)
+        new_cols = ", ".join(f"new.{c}" for c in FTS_COLUMNS)
+        old_cols = ", ".join(f"old.{c}" for c in FTS_COLUMNS)
+        try:
+            self.cursor.execute(
+                f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS tickets_fts USING fts5(
+                    {cols},
+                    content='tickets', content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2'
+                )
+                """
+            )
+        except sqlite3.OperationalError:
+            # SQLite ohne FTS5 übersetzt
+            self.pool.fts_available = False
+            return
+
+        self.cursor.executescript(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS tickets_fts_ai AFTER INSERT ON tickets BEGIN
+                INSERT INTO tickets_fts(rowid, {cols}) VALUES (new.id, {new_cols});
+            END;
+            CREATE TRIGGER IF NOT EXISTS tickets_fts_ad AFTER DELETE ON tickets BEGIN
+                INSERT INTO tickets_fts(tickets_fts, rowid, {cols}) VALUES ('delete', old.id, {old_cols});
+            END;
+            CREATE TRIGGER IF NOT EXISTS tickets_fts_au AFTER UPDATE OF {cols} ON tickets BEGIN
+                INSERT INTO tickets_fts(tickets_fts, rowid, {cols}) VALUES ('delete', old.id, {old_cols});
+                INSERT INTO tickets_fts(rowid, {cols}) VALUES (new.id, {new_cols});
+            END;
+            """
+        )
+        if not exists:
+            # Bestehende Tickets einmalig indizieren
+            self.cursor.execute("INSERT INTO tickets_fts(tickets_fts) VALUES ('rebuild')")
+        self.conn.commit()
+        self.pool.fts_available = True
+
+    @staticmethod
+    def _aggregate_upsert(row: str, sign: int, dimension: str, column: str) -> str:
+        """Upsert, der ``row`` (new/old) mit Vorzeichen ``sign`` in eine Dimension einrechnet."""
+        label = f"COALESCE({row}.{column}, '')"
+        done = f"({row}.status = 'Erledigt')"
+        seconds = (
+            f"CASE WHEN {row}.status = 'Erledigt' "
+            f"THEN strftime('%s', {row}.updated_at) - strftime('%s', {row}.created_at) ELSE 0 END"
+        )
+        return f"""
+                INSERT INTO ticket_aggregates
+                    (dimension, label, ticket_count, open_count, done_count, done_seconds)
+                VALUES ('{dimension}', {label}, {sign}, {sign} * (1 - {done}), {sign} * {done}, {sign} * ({seconds}))
+                ON CONFLICT(dimension, label) DO UPDATE SET
+                    ticket_count = ticket_count + excluded.ticket_count,
+                    open_count = open_count + excluded.open_count,
+                    done_count = done_count + excluded.done_count,
+                    done_seconds = done_seconds + excluded.done_seconds;"""
+
+    def _create_aggregates(self):
+        """Zusammenfassungs‑Tabelle für das Admin‑Dashboard, per Trigger aktuell gehalten."""
+        self.cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'ticket_aggregates'"
+        )
+        exists = self.cursor.fetchone() is not None
+        signature = ",".join(f"{d}={c}" for d, c in AGGREGATE_DIMENSIONS.items())
+        if exists and self._get_meta("aggregate_dimensions") != signature:
+            # Dimensionen geändert: Trigger neu anlegen, Tabelle neu füllen
+            for suffix in ("ai", "ad", "au"):
+                self.cursor.execute(f"DROP TRIGGER IF EXISTS ticket_aggregates_{suffix}")
+            exists = False
+        self.cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS ticket_aggregates (
+                dimension TEXT NOT NULL,
+                label TEXT NOT NULL,
+                ticket_count INTEGER NOT NULL DEFAULT 0,
+                open_count INTEGER NOT NULL DEFAULT 0,
+                done_count INTEGER NOT NULL DEFAULT 0,
+                done_seconds INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (dimension, label)
+            ) WITHOUT ROWID
+            """
+        )
+
+        add_new = "".join(
+            self._aggregate_upsert("new", 1, d, c) for d, c in AGGREGATE_DIMENSIONS.items()
+        )
+        remove_old = "".join(
+            self._aggregate_upsert("old", -1, d, c) for d, c in AGGREGATE_DIMENSIONS.items()
+        )
+        self.cursor.executescript(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS ticket_aggregates_ai AFTER INSERT ON tickets BEGIN
+                {add_new}
+            END;
+            CREATE TRIGGER IF NOT EXISTS ticket_aggregates_ad AFTER DELETE ON tickets BEGIN
+                {remove_old}
+            END;
+            CREATE TRIGGER IF NOT EXISTS ticket_aggregates_au
+            AFTER UPDATE OF status, priority, category, assigned_to, created_by, created_at, updated_at ON tickets
+            BEGIN
+                {remove_old}
+                {add_new}
+            END;
+            """
+        )
+        if not exists:
+            self._fill_aggregates()
+            self._set_meta(self.cursor, "aggregate_dimensions", signature)
+        self.conn.commit()
+
+    def _fill_aggregates(self):
+        """ticket_aggregates einmalig aus der Ticket‑Tabelle berechnen (ein Scan je Dimension)."""
+        self.cursor.execute("DELETE FROM ticket_aggregates")
+        for dimension, column in AGGREGATE_DIMENSIONS.items():
+            self.cursor.execute(
+                f"""
+                INSERT INTO ticket_aggregates
+                    (dimension, label, ticket_count, open_count, done_count, done_seconds)
+                SELECT ?, COALESCE({column}, ''), COUNT(*),
+                       SUM(status != 'Erledigt'),
+                       SUM(status = 'Erledigt'),
+                       COALESCE(SUM(CASE WHEN status = 'Erledigt'
+                           THEN strftime('%s', updated_at) - strftime('%s', created_at) END), 0)
+                FROM tickets
+                GROUP BY 2
+                """,
+                (dimension,),
+            )
+
+    def _create_meta(self):
+        """Schlüssel/Wert‑Tabelle für Zustände der Datenschicht (z. B. Lexikon‑Version)."""
+        self.cursor.execute(
+            "CREATE TABLE IF NOT EXISTS store_meta (key TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID"
+        )
+        # Leere Datenbank: alle künftigen Tickets werden mit dem aktuellen Lexikon bewertet
+        if self._get_meta("sentiment_version") is None:
+            self.cursor.execute("SELECT 1 FROM tickets LIMIT 1")
+            if self.cursor.fetchone() is None:
+                self._set_meta(self.cursor, "sentiment_version", self.sentiment.version)
+        self.conn.commit()
+
+    def _create_jobs(self):
+        """Warteschlange für Hintergrund‑Jobs (abgearbeitet von ``jobs.Worker``)."""
+        self.cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL,
+                payload TEXT NOT NULL DEFAULT '{}',
+                idempotency_key TEXT UNIQUE,
+                status TEXT NOT NULL DEFAULT 'queued'
+                    CHECK(status IN ('queued', 'running', 'done', 'failed')),
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL DEFAULT 5,
+                run_after REAL NOT NULL,
+                created_at REAL NOT NULL,
+                started_at REAL,
+                finished_at REAL,
+                last_error TEXT
+            )
+            """
+        )
+        self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status_run_after ON jobs (status, run_after)")
+        self.conn.commit()
+
+    def _create_change_feed(self):
+        """Fortlaufendes Änderungsprotokoll der Tickets für Live‑Clients, per Trigger geschrieben.
+
+        Massen‑Schreiber (Import, Neubewertung) pausieren die Trigger über
+        ``_bulk_changes`` und hinterlassen stattdessen einen ``reset``‑Eintrag.
+        """
+        active = "WHEN NOT EXISTS (SELECT 1 FROM store_meta WHERE key = 'change_feed_paused')"
+        self.cursor.executescript(
+            f"""
+            CREATE TABLE IF NOT EXISTS ticket_changes (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                ticket_id INTEGER NOT NULL,
+                op TEXT NOT NULL CHECK(op IN ('insert', 'update', 'delete', 'reset')),
+                old_status TEXT,
+                new_status TEXT,
+                changed_at REAL NOT NULL DEFAULT ((julianday('now') - 2440587.5) * 86400.0)
+            );
+            CREATE TRIGGER IF NOT EXISTS ticket_changes_ai AFTER INSERT ON tickets {active} BEGIN
+                INSERT INTO ticket_changes (ticket_id, op, new_status) VALUES (new.id, 'insert', new.status);
+            END;
+            CREATE TRIGGER IF NOT EXISTS ticket_changes_au AFTER UPDATE ON tickets {active} BEGIN
+                INSERT INTO ticket_changes (ticket_id, op, old_status, new_status)
+                VALUES (new.id, 'update', old.status, new.status);
+            END;
+            CREATE TRIGGER IF NOT EXISTS ticket_changes_ad AFTER DELETE ON tickets {active} BEGIN
+                INSERT INTO ticket_changes (ticket_id, op, old_status) VALUES (old.id, 'delete', old.status);
+            END;
+            """
+        )
+        self.conn.commit()
+
+    def _create_events(self):
+        """Append‑only Status‑Historie, per Trigger in der Transaktion jeder Änderung geschrieben.
+
+        Ein Ereignis heißt "Ticket betritt ``to_status`` zum Zeitpunkt ``at``"
+        (Unix‑Sekunden der lokalen Ticket‑Zeitstempel). ``status_seconds`` ist
+        die Zeit, die das Ticket zuvor in ``from_status`` verbracht hat – so
+        brauchen Auswertungen nur einen Bereichs‑Scan über ``at``. Geänderte
+        Rückmeldungen/Notizen werden mitgeschrieben, unveränderte bleiben NULL.
+        """
+        self.cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'ticket_events'"
+        )
+        exists = self.cursor.fetchone() is not None
+        # Zeit seit dem letzten Statuswechsel dieses Tickets (Index‑Seek rückwärts)
+        entered = (
+            "(SELECT e.at FROM ticket_events e WHERE e.ticket_id = new.id "
+            "AND e.from_status IS NOT e.to_status ORDER BY e.id DESC LIMIT 1)"
+        )
+        self.cursor.executescript(
+            f"""
+            CREATE TABLE IF NOT EXISTS ticket_events (
+                id INTEGER PRIMARY KEY,
+                ticket_id INTEGER NOT NULL,
+                from_status TEXT,
+                to_status TEXT,
+                actor TEXT,
+                at INTEGER NOT NULL,
+                status_seconds INTEGER,
+                support_feedback TEXT,
+                internal_notes TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_ticket_events_ticket ON ticket_events (ticket_id, id);
+            CREATE INDEX IF NOT EXISTS idx_ticket_events_at
+                ON ticket_events (at, from_status, to_status, status_seconds);
+            CREATE TRIGGER IF NOT EXISTS ticket_events_ai AFTER INSERT ON tickets BEGIN
+                {self._creation_events("new")}
+            END;
+            CREATE TRIGGER IF NOT EXISTS ticket_events_au
+            AFTER UPDATE OF status, support_feedback, internal_notes ON tickets
+            WHEN old.status IS NOT new.status
+                OR old.support_feedback IS NOT new.support_feedback
+                OR old.internal_notes IS NOT new.internal_notes
+            BEGIN
+                INSERT INTO ticket_events
+                    (ticket_id, from_status, to_status, actor, at, status_seconds, support_feedback, internal_notes)
+                VALUES (
+                    new.id, old.status, new.status, new.last_updated_by,
+                    CAST(strftime('%s', new.updated_at) AS INTEGER),
+                    CASE WHEN old.status IS NOT new.status
+                        THEN CAST(strftime('%s', new.updated_at) AS INTEGER) - {entered} END,
+                    CASE WHEN old.support_feedback IS NOT new.support_feedback THEN new.support_feedback END,
+                    CASE WHEN old.internal_notes IS NOT new.internal_notes THEN new.internal_notes END
+                );
+            END;
+            """
+        )
+        if not exists:
+            # Bestehende Tickets: Anlage und ggf. aktueller Status als Ereignisse
+            self.cursor.execute("SELECT 1 FROM tickets LIMIT 1")
+            if self.cursor.fetchone() is not None:
+                self.cursor.executescript(
+                    "BEGIN;" + self._creation_events("tickets", from_table=True) + "COMMIT;"
+                )
+        self.conn.commit()
+
+    @staticmethod
+    def _creation_events(row: str, from_table: bool = False) -> str:
+        """Ereignisse einer Ticket‑Anlage: Neu ab ``created_at``; wurde das Ticket mit
+        anderem Status angelegt (Import), zusätzlich der Wechsel dorthin bei ``updated_at``."""
+        created = f"CAST(strftime('%s', {row}.created_at) AS INTEGER)"
+        updated = f"CAST(strftime('%s', {row}.updated_at) AS INTEGER)"
+        source = " FROM tickets" if from_table else ""
+        return f"""
+                INSERT INTO ticket_events (ticket_id, from_status, to_status, actor, at)
+                SELECT {row}.id, NULL, 'Neu', {row}.created_by, {created}{source};
+                INSERT INTO ticket_events
+                    (ticket_id, from_status, to_status, actor, at, status_seconds, support_feedback, internal_notes)
+                SELECT {row}.id, 'Neu', {row}.status, COALESCE({row}.last_updated_by, {row}.created_by),
+                       {updated}, {updated} - {created}, {row}.support_feedback, {row}.internal_notes{source}
+                WHERE {row}.status != 'Neu';"""
+
+    def _create_report_cache(self):
+        """Gespeicherte Auswertungen je Zeit‑Bucket (siehe ``reporting.Reports``)."""
+        self.cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS report_cache (
+                report TEXT NOT NULL,
+                bucket INTEGER NOT NULL,
+                value TEXT NOT NULL,
+                computed_at REAL NOT NULL,
+                PRIMARY KEY (report, bucket)
+            )
+            """
+        )
+        self.conn.commit()
+
+    def _create_skills(self):
+        """Kategorien je Support‑Nutzer für die automatische Zuweisung (leer = alle)."""
+        self.cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS support_skills (
+                username TEXT NOT NULL REFERENCES users(username) ON DELETE CASCADE,
+                category TEXT NOT NULL CHECK(category IN ('Bug', 'Feature', 'Support')),
+                PRIMARY KEY (username, category)
+            ) WITHOUT ROWID
+            """
+        )
+        self.conn.commit()
+
+    @classmethod
+    def _bulk_changes(cls, cur: sqlite3.Cursor, write) -> None:
+        """``write(cur)`` ohne Feed‑Eintrag pro Zeile; Clients laden danach einmal neu.
+
+        Auch gespeicherte Auswertungen verfallen – ein Import kann vergangene Tage ändern.
+        """
+        cls._set_meta(cur, "change_feed_paused", "1")
+        write(cur)
+        cur.execute("DELETE FROM store_meta WHERE key = 'change_feed_paused'")
+        cur.execute("INSERT INTO ticket_changes (ticket_id, op) VALUES (0, 'reset')")
+        cur.execute("DELETE FROM report_cache")
+
+    @staticmethod
+    def _enqueue_job(
+        cur: sqlite3.Cursor,
+        kind: str,
+        payload: dict | None = None,
+        key: str | None = None,
+        delay: float = 0.0,
+        max_attempts: int = 5,
+    ) -> int | None:
+        """Job in der laufenden Transaktion einreihen; mit schon bekanntem ``key`` ein No‑Op."""
+        now = time.time()
+        cur.execute(
+            """
+            INSERT INTO jobs (kind, payload, idempotency_key, max_attempts, run_after, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(idempotency_key) DO NOTHING
+            """,
+            (kind, json.dumps(payload or {}), key, max_attempts, now + delay, now),
+        )
+        return cur.lastrowid if cur.rowcount else None
+
+    def _get_meta(self, key: str) -> str | None:
+        self.cursor.execute("SELECT value FROM store_meta WHERE key = ?", (key,))
+        row = self.cursor.fetchone()
+        return row["value"] if row else None
+
+    @staticmethod
+    def _set_meta(cur: sqlite3.Cursor, key: str, value: str) -> None:
+        cur.execute(
+            "INSERT INTO store_meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    @timed
+    def rebuild_aggregates(self) -> None:
+        """Zusammenfassung neu berechnen (Reparatur, z. B. nach manuellen SQL‑Eingriffen)."""
+        self._write_transaction(lambda cur: self._fill_aggregates())
+
+    # ---- CRUD ----
+    @timed
+    def add_user(self, username: str, password: str, role: str) -> bool:
+        if not username.strip() or not password.strip():
+            raise ValidationError("Benutzername und Passwort dürfen nicht leer sein.")
+        pwd_hash = hashlib.sha256(password.encode()).hexdigest()
+        try:
+            self._write(
+                "INSERT INTO users (username, password_hash, role) VALUES (?, ?, ?)",
+                (username, pwd_hash, role),
+            )
+            return True
+        except sqlite3.IntegrityError:
+            raise ValidationError("Benutzer existiert bereits.") from None
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Benutzer anlegen): {e}") from e
+
+    @timed
+    def check_user(self, username: str, password: str) -> str | None:
+        if not username.strip() or not password.strip():
+            return None
+        pwd_hash = hashlib.sha256(password.encode()).hexdigest()
+        try:
+            self.cursor.execute(
+                "SELECT role FROM users WHERE username = ? AND password_hash = ?",
+                (username, pwd_hash),
+            )
+            row = self.cursor.fetchone()
+            return row["role"] if row else None
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Benutzer prüfen): {e}") from e
+
+    @timed
+    def remove_user(self, username: str) -> bool:
+        """Löschen nur, wenn die Person nicht mehr in Tickets vorkommt. """
+        self.cursor.execute(
+            """
+            SELECT COUNT(*) FROM tickets 
+            WHERE created_by = ? 
+               OR last_updated_by = ? 
+               OR assigned_to = ?
+            """,
+            (username, username, username),
+        )
+        if self.cursor.fetchone()[0] > 0:
+            raise ValidationError("Benutzer ist an einem Ticket gebunden und kann nicht gelöscht werden.")
+        try:
+            self._write("DELETE FROM users WHERE username = ?", (username,))
+            return True
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Benutzer löschen): {e}") from e
+
+    @timed
+    def add_ticket(
+        self,
+        title: str,
+        description: str,
+        priority: str,
+        category: str,
+        created_by: str,
+    ) -> int:
+        if not title.strip():
+            raise ValidationError("Titel darf nicht leer sein.")
+        full_text = f"{title} {description}".strip()
+        sentiment = None if self.defer_enrichment else self.sentiment.score(full_text)
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        def work(cur: sqlite3.Cursor) -> int:
+            cur.execute(
+                """
+                INSERT INTO tickets (
+                    title, description, priority, category, status,
+                    created_at, updated_at, created_by,
+                    support_feedback, internal_notes, sentiment
+                ) VALUES (?, ?, ?, ?, 'Neu', ?, ?, ?, ?, NULL, ?)
+                """,
+                (
+                    title,
+                    description,
+                    priority,
+                    category,
+                    now,
+                    now,
+                    created_by,
+                    None,
+                    sentiment,
+                ),
+            )
+            ticket_id = cur.lastrowid
+            if sentiment is None:
+                # In derselben Transaktion – ohne Ticket kein Job und umgekehrt
+                self._enqueue_job(cur, "sentiment", {"ticket_id": ticket_id}, key=f"sentiment:{ticket_id}")
+                if self.auto_dispatch:
+                    self._enqueue_job(cur, "dispatch", {"ticket_id": ticket_id}, key=f"dispatch:{ticket_id}")
+            return ticket_id
+
+        try:
+            return self._write_transaction(work)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Ticket anlegen): {e}") from e
+
+    # ---- Bulk Import / Export ----
+    @timed
+    def import_tickets(
+        self,
+        rows,
+        batch_size: int = 5_000,
+        create_users: bool = False,
+        progress=None,
+    ) -> dict:
+        """Tickets aus einem Iterable von Dicts in Batches einspielen.
+
+        Pro Batch: Sentiment berechnen, ein ``executemany`` in einer Transaktion.
+        Fehlende Felder bekommen die Defaults von ``add_ticket``. Mit
+        ``create_users`` werden unbekannte Benutzer als gesperrte Anwender angelegt.
+        ``progress(report)`` wird nach jedem Batch aufgerufen. Fehler kommen als
+        ``ValidationError``/``DatabaseError``; bereits committete Batches bleiben.
+        """
+        started = time.perf_counter()
+        report = {"rows": 0, "batches": 0, "seconds": 0.0, "rows_per_sec": 0.0}
+        columns = ", ".join(IMPORT_COLUMNS + ("sentiment",))
+        placeholders = ", ".join(["?"] * (len(IMPORT_COLUMNS) + 1))
+        insert = f"INSERT INTO tickets ({columns}) VALUES ({placeholders})"
+
+        def write_batch(batch: list[dict]) -> None:
+            now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            values = []
+            for row in batch:
+                if not (row.get("title") or "").strip():
+                    raise ValidationError(f"Ticket ohne Titel in Batch {report['batches'] + 1}")
+                record = {col: row.get(col) or None for col in IMPORT_COLUMNS}
+                record["description"] = row.get("description") or ""
+                record["status"] = record["status"] or "Neu"
+                record["created_at"] = record["created_at"] or now
+                record["updated_at"] = record["updated_at"] or record["created_at"]
+                values.append(record)
+            sentiments = self.sentiment.score_many(
+                f"{r['title']} {r['description']}".strip() for r in values
+            )
+            params = [
+                tuple(r[col] for col in IMPORT_COLUMNS) + (sentiment,)
+                for r, sentiment in zip(values, sentiments)
+            ]
+
+            def work(cur: sqlite3.Cursor) -> None:
+                if create_users:
+                    names = {
+                        r[col]
+                        for r in values
+                        for col in ("created_by", "last_updated_by", "assigned_to")
+                        if r[col]
+                    }
+                    # "!" ist kein gültiger SHA‑256 – Login mit diesen Konten nicht möglich
+                    cur.executemany(
+                        "INSERT OR IGNORE INTO users (username, password_hash, role) VALUES (?, '!', 'Anwender')",
+                        [(n,) for n in names],
+                    )
+                self._bulk_changes(cur, lambda c: c.executemany(insert, params))
+
+            try:
+                self._write_transaction(work)
+            except sqlite3.Error as e:
+                raise DatabaseError(
+                    f"Datenbankfehler (Import, Batch {report['batches'] + 1}): {e}"
+                ) from e
+            report["rows"] += len(batch)
+            report["batches"] += 1
+            report["seconds"] = time.perf_counter() - started
+            report["rows_per_sec"] = report["rows"] / report["seconds"] if report["seconds"] else 0.0
+            if progress:
+                progress(report)
+
+        batch: list[dict] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                write_batch(batch)
+                batch = []
+        if batch:
+            write_batch(batch)
+        report["seconds"] = time.perf_counter() - started
+        return report
+
+    @timed
+    def rescore_sentiment(self, batch_size: int = 5_000, progress=None) -> dict:
+        """Sentiment aller Tickets mit dem aktuellen Lexikon neu berechnen.
+
+        Liest die Tickets per Keyset über ``id`` in Batches, bewertet jeden Batch
+        mit ``score_many`` und schreibt nur geänderte Werte zurück – eine kurze
+        Transaktion pro Batch, das Board bleibt bedienbar. Am Ende wird die
+        Lexikon‑Version vermerkt (siehe ``sentiment_outdated``).
+        """
+        started = time.perf_counter()
+        report = {"rows": 0, "changed": 0, "batches": 0, "seconds": 0.0, "rows_per_sec": 0.0}
+        last_id = 0
+        try:
+            while True:
+                self.cursor.execute(
+                    "SELECT id, title, description, sentiment FROM tickets WHERE id > ? ORDER BY id LIMIT ?",
+                    (last_id, batch_size),
+                )
+                rows = self.cursor.fetchall()
+                if not rows:
+                    break
+                last_id = rows[-1]["id"]
+                scores = self.sentiment.score_many(
+                    f"{r['title']} {r['description'] or ''}".strip() for r in rows
+                )
+                changed = [(s, r["id"]) for r, s in zip(rows, scores) if s != r["sentiment"]]
+                if changed:
+                    self._write_transaction(
+                        lambda cur: self._bulk_changes(
+                            cur, lambda c: c.executemany("UPDATE tickets SET sentiment = ? WHERE id = ?", changed)
+                        )
+                    )
+                report["rows"] += len(rows)
+                report["changed"] += len(changed)
+                report["batches"] += 1
+                report["seconds"] = time.perf_counter() - started
+                report["rows_per_sec"] = report["rows"] / report["seconds"] if report["seconds"] else 0.0
+                if progress:
+                    progress(report)
+            version = self.sentiment.version
+            self._write_transaction(lambda cur: self._set_meta(cur, "sentiment_version", version))
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Sentiment neu berechnen): {e}") from e
+        report["seconds"] = time.perf_counter() - started
+        return report
+
+    def sentiment_outdated(self) -> bool:
+        """``True``, wenn Tickets mit einem anderen Lexikon bewertet wurden als dem aktuellen."""
+        try:
+            return self._get_meta("sentiment_version") != self.sentiment.version
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Lexikon‑Version): {e}") from e
+
+    def export_tickets(self, batch_size: int = 5_000):
+        """Alle Tickets als Dicts streamen – Keyset über ``id``, nie die ganze Tabelle im Speicher."""
+        last_id = 0
+        while True:
+            cur = self.conn.execute(
+                "SELECT * FROM tickets WHERE id > ? ORDER BY id LIMIT ?", (last_id, batch_size)
+            )
+            rows = cur.fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield dict(row)
+            last_id = rows[-1]["id"]
+
+    # ---- Abfragen ----
+    def _ticket_filters(
+        self,
+        search: str | None,
+        priorities: list[str] | None,
+        statuses: list[str] | None,
+        created_by: str | None,
+        assigned_to: str | None,
+    ) -> tuple[str, str, list, str | None]:
+        """FROM‑Quelle, WHERE‑Teil, Parameter und ggf. bm25‑Ausdruck für die Filter."""
+        source = "tickets"
+        conditions = []
+        params: list = []
+        rank = None
+
+        if search and search.strip():
+            match = fts_match_expression(search) if self.pool.fts_available else None
+            if match:
+                source += " JOIN tickets_fts ON tickets_fts.rowid = tickets.id"
+                conditions.append("tickets_fts MATCH ?")
+                params.append(match)
+                weights = ", ".join(str(w) for w in FTS_WEIGHTS)
+                rank = f"bm25(tickets_fts, {weights})"
+            else:
+                # Ohne FTS oder ohne Tokens (z. B. nur "#"): LIKE‑Suche, nie ungefiltert
+                term = f"%{search.strip().lower()}%"
+                conditions.append("(LOWER(title) LIKE ? OR LOWER(description) LIKE ?)")
+                params.extend([term, term])
+
+        if priorities:
+            placeholders = ", ".join(["?"] * len(priorities))
+            conditions.append(f"priority IN ({placeholders})")
+            params.extend(priorities)
+
+        if statuses:
+            placeholders = ", ".join(["?"] * len(statuses))
+            conditions.append(f"status IN ({placeholders})")
+            params.extend(statuses)
+
+        if created_by:
+            conditions.append("created_by = ?")
+            params.append(created_by)
+
+        if assigned_to:
+            conditions.append("assigned_to = ?")
+            params.append(assigned_to)
+
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        return source, where, params, rank
+
+    def _build_ticket_query(
+        self,
+        search: str | None,
+        priorities: list[str] | None,
+        statuses: list[str] | None,
+        created_by: str | None,
+        assigned_to: str | None,
+    ) -> tuple[str, list]:
+        source, where, params, rank = self._ticket_filters(
+            search, priorities, statuses, created_by, assigned_to
+        )
+        order = f"{rank}, updated_at DESC" if rank else "updated_at DESC"
+        return f"SELECT tickets.* FROM {source}{where} ORDER BY {order}", params
+
+    @timed
+    def get_tickets(
+        self,
+        search: str | None = None,
+        priorities: list[str] | None = None,
+        statuses: list[str] | None = None,
+        created_by: str | None = None,
+        assigned_to: str | None = None,
+    ) -> list[dict]:
+        query, params = self._build_ticket_query(search, priorities, statuses, created_by, assigned_to)
+
+        def load() -> list[dict]:
+            self.cursor.execute(query, tuple(params))
+            return [dict(row) for row in self.cursor.fetchall()]
+
+        try:
+            return self._cached(
+                "get_tickets", (search, priorities, statuses, created_by, assigned_to), load
+            )
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Ticket‑Abfrage): {e}") from e
+
+    @timed
+    def get_tickets_page(
+        self,
+        status: str,
+        search: str | None = None,
+        priorities: list[str] | None = None,
+        created_by: str | None = None,
+        assigned_to: str | None = None,
+        after: tuple | None = None,
+        limit: int = BOARD_PAGE_SIZE,
+    ) -> tuple[list[dict], tuple | None]:
+        """Eine Seite einer Kanban‑Spalte per Keyset statt OFFSET.
+
+        Sortiert wird nach ``(updated_at, id)`` absteigend, bei einer Suche nach
+        bm25‑Rang. ``after`` ist der Cursor der vorherigen Seite; zurück kommt
+        ``(tickets, next_cursor)`` – ``next_cursor`` ist ``None`` auf der letzten Seite.
+        """
+        source, where, params, rank = self._ticket_filters(
+            search, priorities, [status], created_by, assigned_to
+        )
+        if rank:
+            # bm25 ist aufsteigend (kleiner = besser); Treffermengen sind klein
+            query = f"SELECT * FROM (SELECT tickets.*, {rank} AS sort_key FROM {source}{where})"
+            if after:
+                query += " WHERE (sort_key, id) > (?, ?)"
+                params.extend(after)
+            query += " ORDER BY sort_key, id LIMIT ?"
+        else:
+            query = f"SELECT tickets.*, updated_at AS sort_key FROM {source}{where}"
+            if after:
+                query += (" AND" if where else " WHERE") + " (updated_at, id) < (?, ?)"
+                params.extend(after)
+            query += " ORDER BY updated_at DESC, id DESC LIMIT ?"
+        # Eine Zeile mehr holen, um zu wissen, ob es weitergeht
+        params.append(limit + 1)
+
+        def load() -> tuple[list[dict], tuple | None]:
+            self.cursor.execute(query, tuple(params))
+            rows = [dict(row) for row in self.cursor.fetchall()]
+            next_cursor = None
+            if len(rows) > limit:
+                rows = rows[:limit]
+                next_cursor = (rows[-1]["sort_key"], rows[-1]["id"])
+            for row in rows:
+                del row["sort_key"]
+            return rows, next_cursor
+
+        try:
+            return self._cached(
+                "get_tickets_page",
+                (status, search, priorities, created_by, assigned_to, after, limit),
+                load,
+            )
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Ticket‑Seite): {e}") from e
+
+    @timed
+    def count_tickets_by_status(
+        self,
+        search: str | None = None,
+        priorities: list[str] | None = None,
+        statuses: list[str] | None = None,
+        created_by: str | None = None,
+        assigned_to: str | None = None,
+    ) -> dict[str, int]:
+        """Anzahl je Status für die aktuellen Filter – ein einziges COUNT über den Index."""
+        source, where, params, _ = self._ticket_filters(
+            search, priorities, statuses, created_by, assigned_to
+        )
+
+        def load() -> dict[str, int]:
+            self.cursor.execute(
+                f"SELECT status, COUNT(*) AS n FROM {source}{where} GROUP BY status", tuple(params)
+            )
+            return {row["status"]: row["n"] for row in self.cursor.fetchall()}
+
+        try:
+            return self._cached(
+                "count_tickets_by_status",
+                (search, priorities, statuses, created_by, assigned_to),
+                load,
+            )
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Tickets zählen): {e}") from e
+
+    # ---- Meine Tickets ----
+    @staticmethod
+    def _my_ticket_sources(perms: PermissionEvaluator) -> list[tuple[str, list]]:
+        """Teilmengen der persönlichen Sicht, je eine über einen Index in Board‑Reihenfolge.
+
+        Anwender: eigene Tickets. Support/Administrator: offene Tickets, die ihnen
+        zugewiesen oder noch niemandem zugewiesen sind.
+        """
+        if perms.role == "Anwender":
+            return [("created_by = ?", [perms.username])]
+        return [
+            (f"{assignee} AND status = ?", [*params, status])
+            for assignee, params in (("assigned_to = ?", [perms.username]), ("assigned_to IS NULL", []))
+            for status in ("Neu", "In Bearbeitung")
+        ]
+
+    @timed
+    def get_my_tickets_page(
+        self,
+        perms: PermissionEvaluator,
+        after: tuple | None = None,
+        limit: int = BOARD_PAGE_SIZE,
+    ) -> tuple[list[dict], tuple | None]:
+        """Eine Seite der persönlichen Sicht per Keyset, neueste Änderung zuerst.
+
+        Jede Teilmenge liefert über ihren Index höchstens ``limit + 1`` Zeilen,
+        ``UNION ALL`` mischt sie – die Kosten hängen nur von der Seitengröße ab,
+        nicht von der Größe der Ticket‑Tabelle.
+        """
+        branches, params = [], []
+        for condition, values in self._my_ticket_sources(perms):
+            keyset = " AND (updated_at, id) < (?, ?)" if after else ""
+            branches.append(
+                f"SELECT * FROM (SELECT * FROM tickets WHERE {condition}{keyset} "
+                "ORDER BY updated_at DESC, id DESC LIMIT ?)"
+            )
+            params.extend([*values, *(after or ()), limit + 1])
+        query = " UNION ALL ".join(branches) + " ORDER BY updated_at DESC, id DESC LIMIT ?"
+        params.append(limit + 1)
+
+        def load() -> tuple[list[dict], tuple | None]:
+            self.cursor.execute(query, tuple(params))
+            rows = [dict(row) for row in self.cursor.fetchall()]
+            next_cursor = None
+            if len(rows) > limit:
+                rows = rows[:limit]
+                next_cursor = (rows[-1]["updated_at"], rows[-1]["id"])
+            return rows, next_cursor
+
+        try:
+            return self._cached("get_my_tickets_page", (perms.username, perms.role, after, limit), load)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Meine Tickets): {e}") from e
+
+    @timed
+    def count_my_tickets(self, perms: PermissionEvaluator) -> dict[str, int]:
+        """Umfang der persönlichen Sicht aus ticket_aggregates (ohne Zählen der Tickets).
+
+        Anwender: ``own``/``open``; Support/Administrator: ``assigned``/``unassigned`` (offen).
+        """
+
+        def load() -> dict[str, int]:
+            self.cursor.execute(
+                """
+                SELECT dimension, label, ticket_count, open_count FROM ticket_aggregates
+                WHERE (dimension = 'creator' AND label = ?) OR (dimension = 'assignee' AND label IN (?, ''))
+                """,
+                (perms.username, perms.username),
+            )
+            rows = {(row["dimension"], row["label"]): row for row in self.cursor.fetchall()}
+
+            def value(key: tuple, column: str) -> int:
+                return rows[key][column] if key in rows else 0
+
+            if perms.role == "Anwender":
+                key = ("creator", perms.username)
+                return {"own": value(key, "ticket_count"), "open": value(key, "open_count")}
+            return {
+                "assigned": value(("assignee", perms.username), "open_count"),
+                "unassigned": value(("assignee", ""), "open_count"),
+            }
+
+        try:
+            return self._cached("count_my_tickets", (perms.username, perms.role), load)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Meine Tickets zählen): {e}") from e
+
+    @timed
+    def get_ticket_by_id(self, ticket_id: int) -> dict | None:
+        try:
+            self.cursor.execute("SELECT * FROM tickets WHERE id = ?", (ticket_id,))
+            row = self.cursor.fetchone()
+            return dict(row) if row else None
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Ticket‑Abfrage ID={ticket_id}): {e}") from e
+
+    @timed
+    def get_tickets_by_ids(self, ticket_ids) -> dict[int, dict]:
+        """Aktueller Stand mehrerer Tickets in einer Abfrage; gelöschte fehlen im Ergebnis."""
+        ids = sorted(set(ticket_ids))
+        if not ids:
+            return {}
+        try:
+            self.cursor.execute(
+                f"SELECT * FROM tickets WHERE id IN ({', '.join('?' * len(ids))})", ids
+            )
+            return {row["id"]: dict(row) for row in self.cursor.fetchall()}
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Ticket‑Abfrage): {e}") from e
+
+    # ---- Änderungs‑Feed ----
+    def latest_change_seq(self) -> int:
+        """Höchste je vergebene Sequenznummer (bleibt auch nach dem Aufräumen erhalten)."""
+        self.cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = 'ticket_changes'")
+        row = self.cursor.fetchone()
+        return row["seq"] if row else 0
+
+    @timed
+    def changes_since(self, seq: int, limit: int = CHANGE_FEED_LIMIT) -> dict:
+        """Änderungen nach ``seq``: ``{"seq", "reset", "changes"}``.
+
+        Ohne neue Änderungen kostet das eine Zeile aus ``sqlite_sequence``.
+        ``reset`` ist gesetzt, wenn der Client zu weit zurückliegt (aufgeräumt,
+        mehr als ``limit`` Änderungen, Massen‑Import) und besser komplett neu lädt.
+        """
+        try:
+            latest = self.latest_change_seq()
+            if latest > self.pool.change_seq:
+                # Neue Änderungen, evtl. aus anderen Prozessen: Cache dieses Prozesses verwerfen
+                self.pool.change_seq = latest
+                self.pool.cache.invalidate()
+            if seq >= latest:
+                return {"seq": latest, "reset": seq > latest, "changes": []}
+            self.cursor.execute(
+                "SELECT seq, ticket_id, op, old_status, new_status, changed_at FROM ticket_changes "
+                "WHERE seq > ? ORDER BY seq LIMIT ?",
+                (seq, limit + 1),
+            )
+            changes = [dict(row) for row in self.cursor.fetchall()]
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Änderungs‑Feed): {e}") from e
+        if (
+            len(changes) > limit
+            or not changes
+            or changes[0]["seq"] > seq + 1
+            or any(change["op"] == "reset" for change in changes)
+        ):
+            return {"seq": latest, "reset": True, "changes": []}
+        return {"seq": changes[-1]["seq"], "reset": False, "changes": changes}
+
+    @timed
+    def prune_changes(self, older_than: float = CHANGE_RETENTION) -> int:
+        """Alte Feed‑Einträge löschen; die Sequenz läuft trotzdem weiter."""
+        cur = self._write(
+            "DELETE FROM ticket_changes WHERE changed_at < ?", (time.time() - older_than,)
+        )
+        return cur.rowcount
+
+    # ---- Historie ----
+    @timed
+    def get_ticket_history(self, ticket_id: int) -> list[dict]:
+        """Alle Ereignisse eines Tickets in zeitlicher Reihenfolge (auch nach dem Löschen)."""
+        try:
+            self.cursor.execute(
+                """
+                SELECT from_status, to_status, actor,
+                       datetime(at, 'unixepoch') AS at, status_seconds, support_feedback, internal_notes
+                FROM ticket_events WHERE ticket_id = ? ORDER BY id
+                """,
+                (ticket_id,),
+            )
+            return [dict(row) for row in self.cursor.fetchall()]
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Historie ID={ticket_id}): {e}") from e
+
+    @staticmethod
+    def _event_range(since: str | None, until: str | None) -> tuple[str, list]:
+        """Bedingung auf ``at`` für ``[since, until)`` im Ticket‑Zeitformat."""
+        conditions, params = [], []
+        if since:
+            conditions.append("at >= CAST(strftime('%s', ?) AS INTEGER)")
+            params.append(since)
+        if until:
+            conditions.append("at < CAST(strftime('%s', ?) AS INTEGER)")
+            params.append(until)
+        return "".join(f" AND {c}" for c in conditions), params
+
+    @timed
+    def time_in_status(self, since: str | None = None, until: str | None = None) -> list[dict]:
+        """Verweildauer je Status (Anzahl, Mittel, p50/p90/p99 in Sekunden).
+
+        Gezählt werden Statuswechsel im Zeitraum; die Perzentile rechnet SQLite
+        per Fensterfunktion über den Index auf ``at`` – kein Scan der Tickets.
+        """
+        where, params = self._event_range(since, until)
+        query = f"""
+            SELECT status, COUNT(*) AS count, AVG(seconds) AS avg_seconds,
+                   {percentile_columns("seconds", "rn", "n")}
+            FROM (
+                SELECT from_status AS status, status_seconds AS seconds,
+                       ROW_NUMBER() OVER (PARTITION BY from_status ORDER BY status_seconds) AS rn,
+                       COUNT(*) OVER (PARTITION BY from_status) AS n
+                FROM ticket_events
+                WHERE status_seconds IS NOT NULL{where}
+            )
+            GROUP BY status
+            ORDER BY status
+        """
+
+        def load() -> list[dict]:
+            self.cursor.execute(query, tuple(params))
+            return [dict(row) for row in self.cursor.fetchall()]
+
+        try:
+            return self._cached("time_in_status", (since, until), load)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Verweildauer): {e}") from e
+
+    @timed
+    def throughput_per_day(self, since: str | None = None, until: str | None = None) -> list[dict]:
+        """Angelegte und erledigte Tickets je Tag aus der Historie."""
+        where, params = self._event_range(since, until)
+        query = f"""
+            SELECT date(at, 'unixepoch') AS day,
+                   SUM(from_status IS NULL) AS created,
+                   SUM(to_status = 'Erledigt') AS closed
+            FROM ticket_events
+            WHERE from_status IS NOT to_status{where}
+            GROUP BY day
+            ORDER BY day
+        """
+
+        def load() -> list[dict]:
+            self.cursor.execute(query, tuple(params))
+            return [dict(row) for row in self.cursor.fetchall()]
+
+        try:
+            return self._cached("throughput_per_day", (since, until), load)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Durchsatz je Tag): {e}") from e
+
+    def _get_user_role(self, username: str) -> str | None:
+        try:
+            self.cursor.execute("SELECT role FROM users WHERE username = ?", (username,))
+            row = self.cursor.fetchone()
+            return row["role"] if row else None
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Rollen‑Abfrage): {e}") from e
+
+    def permissions_for(self, username: str, role: str | None = None) -> PermissionEvaluator:
+        """Evaluator für ``username``; ``role`` spart die Rollen‑Abfrage, wenn schon bekannt."""
+        return PermissionEvaluator(username, role or self._get_user_role(username))
+
+    def _has_permission(self, ticket_id: int, username: str) -> bool:
+        """Erlaubt Administrator alles, Support alle offenen Tickets, Anwender nur Sicht‑Berechtigung."""
+        perms = self.permissions_for(username)
+        if not perms.may_edit_any:
+            return False
+        return perms.can_edit(self.get_ticket_by_id(ticket_id))
+
+    # ---- Update / Delete ----
+    @timed
+    def update_status(
+        self,
+        ticket_id: int,
+        new_status: str,
+        support_feedback: str | None,
+        internal_notes: str | None,
+        updated_by: str,
+        permissions: PermissionEvaluator | None = None,
+    ) -> bool:
+        perms = permissions or self.permissions_for(updated_by)
+        if not perms.may_edit_any:
+            raise PermissionDenied("Keine Berechtigung, den Status zu ändern.")
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        try:
+            # Rechte‑Prüfung auf den aktuellen Ticket‑Stand steckt in der WHERE‑Bedingung
+            cur = self._write(
+                f"""
+                UPDATE tickets
+                SET status = ?, updated_at = ?, last_updated_by = ?, support_feedback = ?, internal_notes = ?
+                WHERE id = ? AND {perms.sql_condition()}
+                """,
+                (
+                    new_status,
+                    now,
+                    updated_by,
+                    support_feedback,
+                    internal_notes,
+                    ticket_id,
+                ),
+            )
+            if cur.rowcount == 0:
+                raise PermissionDenied("Keine Berechtigung, den Status zu ändern.")
+            return True
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Status‑Update): {e}") from e
+
+    @timed
+    def delete_ticket(
+        self,
+        ticket_id: int,
+        deleted_by: str,
+        permissions: PermissionEvaluator | None = None,
+    ) -> bool:
+        perms = permissions or self.permissions_for(deleted_by)
+        if not perms.may_edit_any:
+            raise PermissionDenied("Keine Berechtigung, das Ticket zu löschen.")
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        condition = perms.sql_condition()
+
+        def work(cur: sqlite3.Cursor) -> int:
+            # Löschung in der Historie – mit Akteur, den ein Trigger nicht kennt
+            cur.execute(
+                f"""
+                INSERT INTO ticket_events (ticket_id, from_status, to_status, actor, at)
+                SELECT id, status, NULL, ?, CAST(strftime('%s', ?) AS INTEGER)
+                FROM tickets WHERE id = ? AND {condition}
+                """,
+                (deleted_by, now, ticket_id),
+            )
+            cur.execute(f"DELETE FROM tickets WHERE id = ? AND {condition}", (ticket_id,))
+            return cur.rowcount
+
+        try:
+            if self._write_transaction(work) == 0:
+                raise PermissionDenied("Keine Berechtigung, das Ticket zu löschen.")
+            return True
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Ticket‑Löschen): {e}") from e
+
+    @timed
+    def get_users(self) -> list[dict]:
+        try:
+            self.cursor.execute("SELECT username, role FROM users")
+            rows = self.cursor.fetchall()
+            return [{"username": r["username"], "role": r["role"]} for r in rows]
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Nutzerliste): {e}") from e
+
+    # ---- Reporting ----
+    @timed
+    def get_open_ticket_count(self) -> int:
+        def load() -> int:
+            self.cursor.execute(
+                "SELECT COALESCE(SUM(open_count), 0) FROM ticket_aggregates WHERE dimension = 'status'"
+            )
+            return self.cursor.fetchone()[0]
+
+        try:
+            return self._cached("get_open_ticket_count", (), load)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Offene Tickets zählen): {e}") from e
+
+    @timed
+    def get_average_processing_time(self) -> str:
+        try:
+            return self._cached("get_average_processing_time", (), self._load_average_processing_time)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Durchschnittliche Bearbeitungszeit): {e}") from e
+
+    def _load_average_processing_time(self) -> str:
+        self.cursor.execute(
+            """
+            SELECT done_count, done_seconds FROM ticket_aggregates
+            WHERE dimension = 'status' AND label = 'Erledigt'
+            """
+        )
+        row = self.cursor.fetchone()
+        if not row or not row["done_count"]:
+            return "Keine Daten"
+        avg_sec = row["done_seconds"] / row["done_count"]
+        h = int(avg_sec // 3600)
+        m = int((avg_sec % 3600) // 60)
+        s = int(avg_sec % 60)
+        return f"{h}h {m}m {s}s"
+
+    @timed
+    def get_ticket_breakdown(self, dimension: str) -> list[dict]:
+        """Kennzahlen je Priorität/Kategorie/Bearbeiter/Status aus ticket_aggregates."""
+        if dimension not in AGGREGATE_DIMENSIONS:
+            raise ValidationError(f"Unbekannte Dimension: {dimension}")
+
+        def load() -> list[dict]:
+            self.cursor.execute(
+                """
+                SELECT label, ticket_count, open_count, done_count,
+                       CASE WHEN done_count > 0 THEN done_seconds * 1.0 / done_count END AS avg_seconds
+                FROM ticket_aggregates
+                WHERE dimension = ? AND ticket_count > 0
+                ORDER BY label
+                """,
+                (dimension,),
+            )
+            return [dict(row) for row in self.cursor.fetchall()]
+
+        try:
+            return self._cached("get_ticket_breakdown", (dimension,), load)
+        except sqlite3.Error as e:
+            raise DatabaseError(f"Datenbankfehler (Kennzahlen je {dimension}): {e}") from e
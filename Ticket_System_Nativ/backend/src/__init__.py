@@ -1,27 +1,5 @@
 # src/__init__.py
-from flask import Flask
-from flask_login import LoginManager
-from .models import db, User
-from .routes import main
+# Einzige App‑Fabrik liegt in app_factory.py
+from .app_factory import create_app
 
-login_manager = LoginManager()
-login_manager.login_view = "main.login"
-
-@login_manager.user_loader
-def load_user(user_id):
-    return User.query.get(int(user_id))
-
-def create_app():
-    app = Flask(__name__)
-    app.config["SECRET_KEY"] = "dev"
-    app.config["SQLALCHEMY_DATABASE_URI"] = (
-        "postgresql://ticketuser:password@db:5432/ticketdb"
-    )
-    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
-
-    db.init_app(app)
-    login_manager.init_app(app)
-
-    app.register_blueprint(main)
-
-    return app
+__all__ = ["create_app"]
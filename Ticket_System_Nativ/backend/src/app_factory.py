@@ -1,24 +1,31 @@
+import os
+
 from flask import Flask
-from flask_sqlalchemy import SQLAlchemy
-from flask_login import LoginManager
-from .models import db, User
+from .auth import login_manager
+from .models import db
 from .routes import main  # dein Blueprint
+from .utils import engine_options, init_pool_stats, init_query_log, init_user_cache
 
-def create_app():
+def create_app(config=None):
     app = Flask(__name__)
-    app.config["SECRET_KEY"] = "dev"
-    app.config["SQLALCHEMY_DATABASE_URI"] = "postgresql://ticketuser:password@db:5432/ticketdb"
+    app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY", "dev")
+    app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get(
+        "DATABASE_URL", "postgresql://ticketuser:password@db:5432/ticketdb"
+    )
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    app.config["USER_CACHE_TTL"] = float(os.environ.get("USER_CACHE_TTL", 30))
+    # z. B. für Tests/Benchmarks: {"SQLALCHEMY_DATABASE_URI": "sqlite:///..."}
+    if config:
+        app.config.update(config)
+    # Pool‑Optionen passend zur endgültigen URI (DB_POOL_* aus der Umgebung)
+    app.config.setdefault("SQLALCHEMY_ENGINE_OPTIONS", engine_options(app.config["SQLALCHEMY_DATABASE_URI"]))
 
     db.init_app(app)
+    init_query_log(app, db)
+    init_pool_stats(app, db)
+    init_user_cache(app)
 
-    login_manager = LoginManager()
-    login_manager.login_view = "main.login"
     login_manager.init_app(app)
 
-    @login_manager.user_loader
-    def load_user(user_id):
-        return User.query.get(int(user_id))
-
     app.register_blueprint(main)
     return app
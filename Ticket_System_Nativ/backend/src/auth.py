@@ -1,9 +1,20 @@
+# src/auth.py
+from flask import current_app
 from flask_login import LoginManager
-from src.models import User
+from .models import db, User
 
 login_manager = LoginManager()
 login_manager.login_view = "main.login"
 
+
+def _load_detached(user_id):
+    # Losgelöst, damit ein späteres commit() der Request‑Session die gecachte Instanz nicht expiret
+    user = db.session.get(User, user_id)
+    if user is not None:
+        db.session.expunge(user)
+    return user
+
+
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    return current_app.extensions["user_cache"].get(int(user_id), _load_detached)
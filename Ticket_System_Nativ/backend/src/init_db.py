@@ -1,7 +1,7 @@
 # init_db.py
 from time import sleep
 from app import create_app
-from models import db, User
+from models import db, User, Ticket
 from sqlalchemy.exc import OperationalError
 
 app = create_app()
@@ -12,6 +12,10 @@ while True:
         with app.app_context():
             db.create_all()
             print("✅ Tables created")
+            # create_all legt Indizes nur mit neuen Tabellen an – bestehende Datenbanken nachziehen
+            for index in Ticket.__table__.indexes:
+                index.create(bind=db.engine, checkfirst=True)
+            print("✅ Indexes ensured")
             if not User.query.filter_by(username="admin").first():
                 admin = User(username="admin", password="password", role="admin")
                 db.session.add(admin)
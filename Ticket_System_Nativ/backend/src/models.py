@@ -13,9 +13,16 @@ class User(UserMixin, db.Model):
 
 class Ticket(db.Model):
     __tablename__ = "tickets"
+    # Board‑Spalten seitenweise nach id (Keyset) – ein Index je Status‑Spalte genügt
+    __table_args__ = (db.Index("ix_tickets_status_id", "status", "id"),)
+
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text, nullable=False)
     status = db.Column(db.String(20), default="open")
     created_by = db.Column(db.Integer, db.ForeignKey("users.id"))
     assigned_to = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=True)
+
+    # Nur mit joinedload/selectinload laden (routes.py) – sonst eine Abfrage pro Ticket
+    creator = db.relationship("User", foreign_keys=[created_by])
+    assignee = db.relationship("User", foreign_keys=[assigned_to])
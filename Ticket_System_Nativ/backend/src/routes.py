@@ -1,10 +1,17 @@
 # src/routes.py
-from flask import Blueprint, render_template, request, redirect, url_for
+from flask import Blueprint, render_template, request, redirect, url_for, current_app, jsonify, abort
 from flask_login import login_user, logout_user, login_required, current_user
-from .models import User, Ticket
+from sqlalchemy import func
+from sqlalchemy.orm import aliased, joinedload, load_only
+from .models import db, User, Ticket
 
 main = Blueprint("main", __name__, template_folder="templates")
 
+# Board‑Spalten (Status, Überschrift) und Seitengrößen
+STATUSES = (("open", "Open"), ("in_progress", "In Progress"), ("closed", "Closed"))
+BOARD_PAGE_SIZE = 25
+LIST_PAGE_SIZE = 50
+
 @main.route("/login", methods=["GET", "POST"])
 def login():
     if request.method == "POST":
@@ -28,5 +35,87 @@ def logout():
 @main.route("/")
 @login_required
 def dashboard():
-    tickets = Ticket.query.all()
-    return render_template("index.html", tickets=tickets, user=current_user)
+    # Je Spalte eine Keyset‑Seite (``<status>_after``) plus ein GROUP BY für die
+    # Zähler – die Anzahl der Abfragen hängt nicht von der Ticketzahl ab
+    counts = dict(db.session.execute(db.select(Ticket.status, func.count()).group_by(Ticket.status)).all())
+    columns = []
+    for status, label in STATUSES:
+        stmt = (
+            db.select(Ticket)
+            .options(
+                load_only(Ticket.id, Ticket.title, Ticket.description, Ticket.status),
+                joinedload(Ticket.creator).load_only(User.username),
+                joinedload(Ticket.assignee).load_only(User.username),
+            )
+            .where(Ticket.status == status)
+            .order_by(Ticket.id.desc())
+            .limit(BOARD_PAGE_SIZE + 1)
+        )
+        after = request.args.get(f"{status}_after", type=int)
+        if after is not None:
+            stmt = stmt.where(Ticket.id < after)
+        tickets = db.session.scalars(stmt).all()
+        next_after = tickets[BOARD_PAGE_SIZE - 1].id if len(tickets) > BOARD_PAGE_SIZE else None
+        columns.append(
+            {
+                "status": status,
+                "label": label,
+                "count": counts.get(status, 0),
+                "tickets": tickets[:BOARD_PAGE_SIZE],
+                "next_after": next_after,
+            }
+        )
+    return render_template("index.html", columns=columns, user=current_user)
+
+@main.route("/tickets")
+@login_required
+def tickets_view():
+    # Listenansicht als reine Spalten‑Projektion (keine ORM‑Objekte), seitenweise nach id
+    creator = aliased(User)
+    assignee = aliased(User)
+    stmt = (
+        db.select(
+            Ticket.id,
+            Ticket.title,
+            Ticket.status,
+            creator.username.label("created_by"),
+            assignee.username.label("assigned_to"),
+        )
+        .outerjoin(creator, Ticket.created_by == creator.id)
+        .outerjoin(assignee, Ticket.assigned_to == assignee.id)
+        .order_by(Ticket.id.desc())
+        .limit(LIST_PAGE_SIZE + 1)
+    )
+    status = request.args.get("status")
+    if status in dict(STATUSES):
+        stmt = stmt.where(Ticket.status == status)
+    else:
+        status = None
+    after = request.args.get("after", type=int)
+    if after is not None:
+        stmt = stmt.where(Ticket.id < after)
+    rows = db.session.execute(stmt).all()
+    next_after = rows[LIST_PAGE_SIZE - 1].id if len(rows) > LIST_PAGE_SIZE else None
+    return render_template(
+        "tickets.html",
+        rows=rows[:LIST_PAGE_SIZE],
+        statuses=STATUSES,
+        status=status,
+        next_after=next_after,
+        user=current_user,
+    )
+
+@main.route("/admin/queries", methods=["GET", "POST"])
+@login_required
+def query_stats():
+    # Perzentile je Statement/Route, Slow‑Log und Pool‑Kennzahlen; POST mit reset=1 leert die Messwerte
+    if current_user.role != "admin":
+        abort(403)
+    log = current_app.extensions["query_log"]
+    pool_stats = current_app.extensions["pool_stats"]
+    snapshot = log.snapshot()
+    snapshot["pool"] = pool_stats.snapshot()
+    if request.method == "POST" and request.form.get("reset"):
+        log.reset()
+        pool_stats.reset()
+    return jsonify(snapshot)
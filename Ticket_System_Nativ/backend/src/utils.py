@@ -0,0 +1,260 @@
+# src/utils.py
+"""Laufzeit‑Messung für SQL‑Statements (SQLAlchemy‑Events) und Routen.
+
+``init_query_log(app, db)`` hängt sich an ``before/after_cursor_execute`` der
+Engine und an ``before/after_request``. Statements über
+``QUERY_LOG_SLOW_MS`` landen mit ``EXPLAIN`` im Slow‑Log; die Kennzahlen
+zeigt ``/admin/queries``.
+
+Dazu kommen die Engine‑Optionen aus der Umgebung (``engine_options``), die
+Pool‑Kennzahlen (``init_pool_stats``) und ein kurzlebiger Benutzer‑Cache für
+``load_user`` (``init_user_cache``).
+"""
+
+import os
+import sys
+import threading
+import time
+
+from flask import current_app, g, has_app_context, request
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import QueuePool
+
+from .models import User
+
+# Gemeinsames Paket ticket_common: im Container neben src/, lokal in der Repo‑Wurzel
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+if os.path.isdir(os.path.join(_ROOT, "ticket_common")) and _ROOT not in sys.path:
+    sys.path.append(_ROOT)
+
+from ticket_common.query_log import QueryLog, normalize_sql  # noqa: E402
+
+
+# -------------------------------------------------
+# Flask/SQLAlchemy‑Anbindung
+# -------------------------------------------------
+_EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE", "INSERT")
+
+
+def _explain(cursor, dialect: str, statement: str, parameters) -> list[str]:
+    """Plan über einen rohen DBAPI‑Cursor holen (löst keine Events erneut aus)."""
+    if not statement.lstrip().upper().startswith(_EXPLAINABLE):
+        return []
+    prefix = "EXPLAIN QUERY PLAN " if dialect == "sqlite" else "EXPLAIN "
+    raw = cursor.connection.cursor()
+    try:
+        raw.execute(prefix + statement, parameters)
+        return [str(row[-1]) for row in raw.fetchall()]
+    except Exception as e:
+        return [f"(kein Plan: {e})"]
+    finally:
+        raw.close()
+
+
+def init_query_log(app, db) -> QueryLog:
+    """Messung für ``app`` einschalten; das Log liegt in ``app.extensions["query_log"]``."""
+    log = QueryLog(slow_ms=float(app.config.get("QUERY_LOG_SLOW_MS", 100)))
+    app.extensions["query_log"] = log
+
+    with app.app_context():
+        engine = db.engine
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        seconds = time.perf_counter() - conn.info["query_started"].pop()
+        rows = cursor.rowcount if cursor.rowcount is not None else 0
+        name = normalize_sql(statement)
+        log.record("sql", name, seconds, rows)
+        if seconds * 1000 >= log.slow_ms:
+            plan = [] if executemany else _explain(cursor, conn.dialect.name, statement, parameters)
+            log.record_slow(name, parameters, seconds, rows, plan)
+
+    @app.before_request
+    def _start_timer():
+        g.request_started = time.perf_counter()
+
+    @app.after_request
+    def _record_route(response):
+        if request.url_rule is not None and "request_started" in g:
+            elapsed = time.perf_counter() - g.request_started
+            log.record("route", f"{request.method} {request.url_rule.rule}", elapsed)
+        return response
+
+    return log
+
+
+# -------------------------------------------------
+# Engine‑Optionen und Pool‑Kennzahlen
+# -------------------------------------------------
+class TimedQueuePool(QueuePool):
+    """QueuePool, der die Wartezeit je Checkout am Pool‑Eintrag vermerkt.
+
+    Gemessen wird ``_do_get`` – also Warten auf eine freie Verbindung bzw.
+    der Aufbau einer neuen. ``PoolStats`` liest den Wert im ``checkout``‑Event.
+    """
+
+    def _do_get(self):
+        started = time.perf_counter()
+        record = super()._do_get()
+        record.info["checkout_wait"] = time.perf_counter() - started
+        return record
+
+
+def engine_options(uri: str) -> dict:
+    """``SQLALCHEMY_ENGINE_OPTIONS`` aus ``DB_POOL_*`` (Pool‑Größen nur für Server‑Datenbanken)."""
+    options = {"pool_pre_ping": os.environ.get("DB_POOL_PRE_PING", "1") == "1"}
+    if uri.startswith("sqlite"):
+        return options
+    options.update(
+        poolclass=TimedQueuePool,
+        pool_size=int(os.environ.get("DB_POOL_SIZE", 10)),
+        max_overflow=int(os.environ.get("DB_MAX_OVERFLOW", 20)),
+        pool_timeout=float(os.environ.get("DB_POOL_TIMEOUT", 10)),
+        # Unter typischen Idle‑Timeouts von Postgres/Proxies bleiben
+        pool_recycle=int(os.environ.get("DB_POOL_RECYCLE", 1800)),
+    )
+    return options
+
+
+class PoolStats:
+    """Zähler aus den Pool‑Events; Füllstand und Overflow liest ``snapshot`` live."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self._lock = threading.Lock()
+        self.checked_out = 0
+        self.reset()
+
+    def reset(self) -> None:
+        # checked_out ist ein Füllstand, kein Zähler – er bleibt beim Zurücksetzen erhalten
+        with self._lock:
+            self.checkouts = 0
+            self.connects = 0
+            self.invalidations = 0
+            self.peak_checked_out = self.checked_out
+            self.wait_total = 0.0
+            self.wait_max = 0.0
+
+    def on_connect(self, dbapi_conn, record) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def on_checkout(self, dbapi_conn, record, proxy) -> None:
+        wait = record.info.pop("checkout_wait", 0.0)
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+
+    def on_checkin(self, dbapi_conn, record) -> None:
+        with self._lock:
+            self.checked_out = max(self.checked_out - 1, 0)
+
+    def on_invalidate(self, dbapi_conn, record, exception) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def snapshot(self) -> dict:
+        pool = self.engine.pool
+        with self._lock:
+            data = {
+                "pool": type(pool).__name__,
+                "checked_out": self.checked_out,
+                "peak_checked_out": self.peak_checked_out,
+                "checkouts": self.checkouts,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "wait_avg_ms": round(self.wait_total / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                "wait_max_ms": round(self.wait_max * 1000, 3),
+            }
+        if isinstance(pool, QueuePool):
+            data.update(size=pool.size(), overflow=pool.overflow(), idle=pool.checkedin())
+        return data
+
+
+def init_pool_stats(app, db) -> PoolStats:
+    """Pool‑Events der Engine abonnieren; die Zähler liegen in ``app.extensions["pool_stats"]``."""
+    with app.app_context():
+        engine = db.engine
+    stats = PoolStats(engine)
+    app.extensions["pool_stats"] = stats
+    # Listener hängen am Engine‑Pool und überleben dispose()/recreate()
+    event.listen(engine, "connect", stats.on_connect)
+    event.listen(engine, "checkout", stats.on_checkout)
+    event.listen(engine, "checkin", stats.on_checkin)
+    event.listen(engine, "invalidate", stats.on_invalidate)
+    return stats
+
+
+# -------------------------------------------------
+# Benutzer‑Cache für load_user
+# -------------------------------------------------
+class UserCache:
+    """Kurzlebiger In‑Process‑Cache ``id → User`` (losgelöste Instanzen).
+
+    Änderungen über das ORM invalidieren sofort (Mapper‑/Session‑Events unten),
+    andere Prozesse sehen sie spätestens nach ``ttl`` Sekunden. ``ttl=0``
+    schaltet den Cache ab.
+    """
+
+    def __init__(self, ttl: float = 30.0):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: dict[int, tuple[float, User]] = {}
+
+    def get(self, user_id: int, load):
+        if self.ttl <= 0:
+            return load(user_id)
+        now = time.monotonic()
+        with self._lock:
+            hit = self._entries.get(user_id)
+        if hit is not None and hit[0] > now:
+            return hit[1]
+        user = load(user_id)
+        if user is not None:
+            with self._lock:
+                self._entries[user_id] = (now + self.ttl, user)
+        return user
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def init_user_cache(app) -> UserCache:
+    """Cache mit ``USER_CACHE_TTL`` (Sekunden) in ``app.extensions["user_cache"]`` anlegen."""
+    cache = UserCache(ttl=float(app.config.get("USER_CACHE_TTL", 30)))
+    app.extensions["user_cache"] = cache
+    return cache
+
+
+def _current_user_cache() -> UserCache | None:
+    return current_app.extensions.get("user_cache") if has_app_context() else None
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user(mapper, connection, target):
+    cache = _current_user_cache()
+    if cache is not None:
+        cache.invalidate(target.id)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_bulk(state):
+    # db.update(User)/db.delete(User) umgehen die Mapper‑Events
+    if (state.is_update or state.is_delete) and state.bind_mapper is User.__mapper__:
+        cache = _current_user_cache()
+        if cache is not None:
+            cache.clear()
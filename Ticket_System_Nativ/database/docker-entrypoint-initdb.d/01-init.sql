@@ -23,3 +23,6 @@ CREATE TABLE IF NOT EXISTS tickets (
     priority VARCHAR(20),
     assigned_to INT REFERENCES users(id)
 );
+
+-- Board‑Spalten seitenweise nach id (Keyset, siehe backend/src/routes.py)
+CREATE INDEX IF NOT EXISTS ix_tickets_status_id ON tickets (status, id);
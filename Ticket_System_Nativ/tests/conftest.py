@@ -0,0 +1,6 @@
+# tests/conftest.py
+# Backend‑Paket ``src`` importierbar machen (Tests laufen aus dem Repo heraus, nicht im Container)
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend"))
@@ -0,0 +1,76 @@
+# tests/test_engine.py
+"""Engine‑Optionen aus der Umgebung, Benutzer‑Cache und Pool‑Kennzahlen."""
+
+from sqlalchemy import event
+
+from src.models import User, db
+from src.utils import TimedQueuePool, engine_options
+from test_queries import _make_app
+
+
+def _logged_in(app):
+    client = app.test_client()
+    client.post("/login", data={"username": "admin", "password": "password"})
+    return client
+
+
+def _user_selects(app, call) -> int:
+    with app.app_context():
+        engine = db.engine
+    seen = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        if "FROM users" in statement:
+            seen.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        call()
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+    return len(seen)
+
+
+def test_engine_options_from_env(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "3")
+    monkeypatch.setenv("DB_POOL_RECYCLE", "60")
+    options = engine_options("postgresql://u:p@db/ticketdb")
+    assert options["poolclass"] is TimedQueuePool
+    assert options["pool_size"] == 3 and options["pool_recycle"] == 60
+    assert options["pool_pre_ping"] is True
+    # SQLite: keine Pool‑Größen
+    assert set(engine_options("sqlite:///x.db")) == {"pool_pre_ping"}
+
+
+def test_user_cache_and_invalidation(tmp_path):
+    app = _make_app(tmp_path, 3)
+    client = _logged_in(app)
+
+    assert _user_selects(app, lambda: client.get("/tickets")) == 1
+    assert _user_selects(app, lambda: client.get("/tickets")) == 0
+
+    with app.app_context():
+        admin = db.session.scalars(db.select(User).filter_by(username="admin")).one()
+        admin.role = "support"
+        db.session.commit()
+    # Geänderte Rolle wirkt sofort: /admin/queries ist nur für Admins
+    assert client.get("/admin/queries").status_code == 403
+
+    with app.app_context():
+        db.session.execute(db.update(User).where(User.username == "admin").values(role="admin"))
+        db.session.commit()
+    assert client.get("/admin/queries").status_code == 200
+
+
+def test_pool_stats_exposed(tmp_path):
+    app = _make_app(tmp_path, 3)
+    client = _logged_in(app)
+    client.get("/")
+
+    pool = client.get("/admin/queries").get_json()["pool"]
+    assert pool["checkouts"] >= 2
+    assert pool["checked_out"] <= 1
+    assert {"size", "overflow", "wait_avg_ms", "wait_max_ms"} <= set(pool)
+
+    client.post("/admin/queries", data={"reset": "1"})
+    assert app.extensions["pool_stats"].checkouts <= 1
@@ -0,0 +1,87 @@
+# tests/test_queries.py
+"""Board und Ticketliste dürfen pro Seite nur eine feste Zahl Abfragen absetzen.
+
+Läuft gegen eine temporäre SQLite‑Datei: ``pytest Ticket_System_Nativ/tests``.
+"""
+
+import pytest
+from sqlalchemy import event
+
+from src.app_factory import create_app
+from src.models import Ticket, User, db
+
+STATUSES = ("open", "in_progress", "closed")
+
+
+def _make_app(tmp_path, tickets: int):
+    uri = f"sqlite:///{tmp_path / f'nativ_{tickets}.db'}"
+    app = create_app({"SQLALCHEMY_DATABASE_URI": uri, "TESTING": True})
+    with app.app_context():
+        db.create_all()
+        db.session.execute(
+            db.insert(User),
+            [
+                {"username": "admin", "password": "password", "role": "admin"},
+                {"username": "anna", "password": "x", "role": "user"},
+                {"username": "lisa", "password": "x", "role": "support"},
+            ],
+        )
+        ids = [u.id for u in db.session.scalars(db.select(User).order_by(User.id))]
+        db.session.execute(
+            db.insert(Ticket),
+            [
+                {
+                    "title": f"Ticket {i}",
+                    "description": "…",
+                    "status": STATUSES[i % 3],
+                    "created_by": ids[i % 3],
+                    "assigned_to": ids[(i + 1) % 3] if i % 2 else None,
+                }
+                for i in range(tickets)
+            ],
+        )
+        db.session.commit()
+    return app
+
+
+def _count_queries(app, path: str) -> int:
+    client = app.test_client()
+    assert client.post("/login", data={"username": "admin", "password": "password"}).status_code == 302
+
+    statements = []
+    with app.app_context():
+        engine = db.engine
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        response = client.get(path)
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+    assert response.status_code == 200
+    return len(statements)
+
+
+@pytest.mark.parametrize("path", ["/", "/?open_after=1000", "/tickets", "/tickets?status=closed&after=1000"])
+def test_query_count_is_constant(tmp_path, path):
+    small = _count_queries(_make_app(tmp_path, 12), path)
+    large = _count_queries(_make_app(tmp_path, 1200), path)
+    assert small == large
+    # Benutzer laden + Zähler + je Spalte eine Seite
+    assert large <= 5
+
+
+def test_board_shows_users_and_next_page(tmp_path):
+    app = _make_app(tmp_path, 200)
+    client = app.test_client()
+    client.post("/login", data={"username": "admin", "password": "password"})
+
+    html = client.get("/").get_data(as_text=True)
+    assert "Erstellt von: anna" in html
+    assert "open_after=" in html
+
+    html = client.get("/tickets?status=open").get_data(as_text=True)
+    assert html.count('class="ticket-item open"') == 50
+    assert "after=" in html
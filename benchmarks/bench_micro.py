@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""Benchmark der Micro‑Version (Flask + sqlite3) über den Flask‑Testclient."""
+
+import importlib.util
+import itertools
+import os
+import sqlite3
+import sys
+import tempfile
+
+from datagen import generate_tickets, generate_users
+from harness import MICRO_DIR, checked, measure, measure_concurrent, result
+
+
+# Threads für die Durchsatz‑Messung der Schreib‑Routen
+CONCURRENCY = 8
+# Konten für die Dashboard‑Messung: Name -> Rolle
+DASHBOARD_USERS = {"user": "user", "support": "support", "admin": "admin"}
+
+
+def load_app():
+    """``Ticket_System_Micro/app.py`` laden, ohne mit anderen ``app``‑Modulen zu kollidieren."""
+    spec = importlib.util.spec_from_file_location("micro_app", os.path.join(MICRO_DIR, "app.py"))
+    module = importlib.util.module_from_spec(spec)
+    # Flask bestimmt den Template‑Ordner über sys.modules
+    sys.modules["micro_app"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load(micro, size: int, mix, seed: int) -> None:
+    conn = sqlite3.connect(micro.DB_PATH)
+    # Anwender/Support aus datagen (ohne Passwort‑Hash), dazu die Konten der Dashboards
+    users = [(name, "user" if role == "Anwender" else "support") for name, role in generate_users()]
+    conn.executemany("INSERT INTO users (username, password, role) VALUES (?, 'x', ?)", users)
+    user_ids = {name: user_id for user_id, name in conn.execute("SELECT id, username FROM users")}
+    for username, role in DASHBOARD_USERS.items():
+        micro.add_user(conn, f"bench_{username}", "bench", role)
+    conn.executemany(
+        """
+        INSERT INTO tickets (title, description, category, priority, status, comment, user_id)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            (
+                t["title"], t["description"], t["category"], t["priority"], t["status"],
+                t["support_feedback"], user_ids[t["created_by"]],
+            )
+            for t in generate_tickets(size, mix, seed=seed)
+        ),
+    )
+    # Dem Anwender‑Konto einen Teil der Tickets geben
+    conn.execute(
+        "UPDATE tickets SET user_id = (SELECT id FROM users WHERE username = 'bench_user') WHERE id % 200 = 0"
+    )
+    conn.commit()
+    conn.close()
+
+
+def login(micro, role: str):
+    client = micro.app.test_client()
+    checked(lambda: client.post("/login", data={"username": f"bench_{role}", "password": "bench"}))()
+    return client
+
+
+def run(size: int, repeat: int, mix, seed: int = 42) -> list[dict]:
+    micro = load_app()
+    results = []
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        # Die App arbeitet mit relativen Pfaden (data/tickets.db)
+        os.chdir(tmp)
+        try:
+            micro.DB_PATH = os.path.join(tmp, "data", "tickets.db")
+            micro.init_db()
+            load(micro, size, mix, seed)
+            client = micro.app.test_client()
+
+            ids = itertools.cycle(range(1, min(size, 1_000) + 1))
+            form = {"title": "Bench", "category": "Bug", "priority": "Hoch"}
+            etag = client.get("/api/tickets").headers["ETag"]
+            dashboards = {role: login(micro, role) for role in DASHBOARD_USERS}
+            ops = {
+                "dashboard_user": checked(lambda: dashboards["user"].get("/dashboard")),
+                "dashboard_support": checked(lambda: dashboards["support"].get("/dashboard")),
+                "dashboard_admin": checked(lambda: dashboards["admin"].get("/dashboard")),
+                "index": checked(lambda: client.get("/")),
+                "api_page": checked(lambda: client.get("/api/tickets?status=Neu,In Bearbeitung")),
+                "api_not_modified": checked(lambda: client.get("/api/tickets", headers={"If-None-Match": etag})),
+                "create": checked(lambda: client.post("/create", data=form)),
+                "update": checked(lambda: client.get(f"/update/{next(ids)}")),
+            }
+            for name, fn in ops.items():
+                # Die Startseite rendert alle Tickets – bei großen Tabellen wenige Läufe
+                n = repeat if name == "index" else repeat * 10
+                results.append(result("micro", name, size, measure(fn, n)))
+
+            # Gleichzeitige Schreiber (je Thread ein Testclient): Durchsatz in req/s
+            def concurrent(path, data=None):
+                def make_call():
+                    own = micro.app.test_client()
+                    if data is None:
+                        return checked(lambda: own.get(path()))
+                    return checked(lambda: own.post(path(), data=data))
+
+                return make_call
+
+            writers = {
+                "create_concurrent": concurrent(lambda: "/create", form),
+                "update_concurrent": concurrent(lambda: f"/update/{next(ids)}"),
+            }
+            for name, make_call in writers.items():
+                results.append(result("micro", name, size, measure_concurrent(make_call, CONCURRENCY, repeat * 10)))
+        finally:
+            os.chdir(cwd)
+    return results
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""Benchmark der Nano‑Datenschicht (``ticket_store.TicketDatabase``)."""
+
+import itertools
+import os
+import tempfile
+
+from datagen import PRIORITIES, generate_tickets, generate_users
+from harness import NANO_SRC, add_path, measure, result
+
+add_path(NANO_SRC)
+
+import ticket_store as store  # noqa: E402
+
+
+def open_db(path: str) -> "store.TicketDatabase":
+    """Datenbank ohne Lese‑Cache, damit SQL und Dict‑Aufbau gemessen werden."""
+    pool = store.ConnectionPool(path, profile=store.StorageProfile(cache_entries=0))
+    return store.TicketDatabase(path, pool=pool)
+
+
+def load(db: "store.TicketDatabase", size: int, mix, seed: int) -> None:
+    db.cursor.executemany(
+        "INSERT OR IGNORE INTO users (username, password_hash, role) VALUES (?, 'x', ?)",
+        generate_users(),
+    )
+    db.conn.commit()
+    db.import_tickets(generate_tickets(size, mix, seed=seed), batch_size=10_000)
+
+
+def run(size: int, repeat: int, mix, seed: int = 42) -> list[dict]:
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        db = open_db(os.path.join(tmp, "nano.db"))
+        load(db, size, mix, seed)
+        db.cursor.execute("ANALYZE")
+
+        priorities = list(PRIORITIES)
+        anwender = store.PermissionEvaluator("user1", "Anwender")
+        support = store.PermissionEvaluator("support1", "Support")
+        ops = {
+            "get_tickets_all": lambda: db.get_tickets(priorities=priorities),
+            "get_tickets_support": lambda: db.get_tickets(
+                priorities=priorities, statuses=["Neu", "In Bearbeitung"]
+            ),
+            "board_first_pages": lambda: [
+                db.get_tickets_page(s, priorities=priorities) for s in ("Neu", "In Bearbeitung", "Erledigt")
+            ],
+            "board_counts": lambda: db.count_tickets_by_status(priorities=priorities),
+            "my_tickets_anwender": lambda: db.get_my_tickets_page(anwender),
+            "my_tickets_support": lambda: db.get_my_tickets_page(support),
+            "search_page": lambda: db.get_tickets_page("Erledigt", search="drucker"),
+            "report_open_count": db.get_open_ticket_count,
+            "report_avg_processing": db.get_average_processing_time,
+            "report_breakdown": lambda: [
+                db.get_ticket_breakdown(d) for d in ("priority", "category", "assignee")
+            ],
+        }
+        for name, fn in ops.items():
+            results.append(result("nano", name, size, measure(fn, repeat)))
+
+        # Schreiben: reihum Tickets zwischen zwei offenen Status hin‑ und herschieben
+        perms = db.permissions_for("admin", "Administrator")
+        ids = itertools.cycle(range(1, min(size, 1_000) + 1))
+        statuses = itertools.cycle(["In Bearbeitung", "Neu"])
+        results.append(
+            result(
+                "nano",
+                "update_status",
+                size,
+                measure(
+                    lambda: db.update_status(next(ids), next(statuses), "bench", None, "admin", perms),
+                    repeat * 10,
+                ),
+            )
+        )
+        results.append(
+            result(
+                "nano",
+                "add_ticket",
+                size,
+                measure(lambda: db.add_ticket("Bench", "Drucker Problem", "Hoch", "Bug", "admin"), repeat * 10),
+            )
+        )
+        db.pool.close_all()
+    return results
+
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""Misst die Kanban‑ und Report‑Abfragen der Nano‑Version mit und ohne Sekundär‑Indizes.
+
+Aufruf (aus dem Repo‑Root):
+
+    python benchmarks/bench_nano_indexes.py               # 10k, 100k, 1M Tickets
+    python benchmarks/bench_nano_indexes.py 10000 50000   # eigene Größen
+
+Ausgabe: Tabelle auf stdout, zusätzlich JSON mit ``--json <datei>``.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_nano import load, open_db, store  # noqa: E402
+from datagen import PRIORITIES, Mix  # noqa: E402
+from harness import measure  # noqa: E402
+
+
+def workload(db: store.TicketDatabase) -> dict:
+    """Die Abfragen, die Board und Admin‑Dashboard pro Rerun ausführen."""
+    priorities = list(PRIORITIES)
+    return {
+        "board_support": lambda: db.get_tickets(priorities=priorities, statuses=["Neu", "In Bearbeitung"]),
+        "board_hoch_neu": lambda: db.get_tickets(priorities=["Hoch"], statuses=["Neu"]),
+        "created_by": lambda: db.get_tickets(created_by="user7"),
+        "assigned_to_open": lambda: db.get_tickets(statuses=["Neu"], assigned_to="support3"),
+        "open_count": db.get_open_ticket_count,
+        "avg_processing": db.get_average_processing_time,
+    }
+
+
+def drop_indexes(db: store.TicketDatabase) -> None:
+    for name in store.TICKET_INDEXES:
+        db.cursor.execute(f"DROP INDEX IF EXISTS {name}")
+    db.cursor.execute("DROP TABLE IF EXISTS sqlite_stat1")
+    db.conn.commit()
+
+
+def median_ms(ops: dict, repeat: int) -> dict:
+    return {name: measure(fn, repeat)["median_ms"] for name, fn in ops.items()}
+
+
+def run(size: int, repeat: int, seed: int = 42) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        db = open_db(os.path.join(tmp, "bench.db"))
+        load(db, size, Mix(), seed)
+
+        drop_indexes(db)
+        before = median_ms(workload(db), repeat)
+
+        db._create_indexes()
+        db.cursor.execute("ANALYZE")
+        after = median_ms(workload(db), repeat)
+
+        db.pool.close_all()
+    return {"size": size, "before_ms": before, "after_ms": after}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("sizes", nargs="*", type=int, default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", dest="json_path")
+    args = parser.parse_args()
+
+    results = []
+    for size in args.sizes:
+        res = run(size, args.repeat)
+        results.append(res)
+        print(f"\n{size:,} Tickets (Median ms)")
+        print(f"  {'Abfrage':<18}{'ohne Index':>12}{'mit Index':>12}")
+        for name, before in res["before_ms"].items():
+            print(f"  {name:<18}{before:>12.2f}{res['after_ms'][name]:>12.2f}")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Misst die Board‑Suche der Nano‑Version: FTS5 (bm25) gegen LOWER(...) LIKE '%term%'.
+
+Aufruf (aus dem Repo‑Root):
+
+    python benchmarks/bench_nano_search.py            # 500k Tickets
+    python benchmarks/bench_nano_search.py 100000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_nano import load, open_db, store  # noqa: E402
+from datagen import Mix  # noqa: E402
+from harness import measure  # noqa: E402
+
+QUERIES = ["drucker", "vpn zertifikat", "absturz outlook", "lizenz", "passw"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("size", nargs="?", type=int, default=500_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=50, help="Treffer pro Seite (wie im Board)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = open_db(os.path.join(tmp, "search.db"))
+        # Fachbegriffe nur in ~1 % der Texte – wie bei echten Tickets
+        load(db, args.size, Mix(domain_share=0.01), args.seed)
+        weights = ", ".join(str(w) for w in store.FTS_WEIGHTS)
+
+        print(f"{args.size:,} Tickets, erste {args.limit} Treffer (Median ms)")
+        print(f"  {'Suche':<20}{'LIKE':>10}{'FTS5':>10}")
+        for q in QUERIES:
+            like = f"%{q}%"
+
+            def run_like():
+                db.cursor.execute(
+                    "SELECT * FROM tickets WHERE LOWER(title) LIKE ? OR LOWER(description) LIKE ? "
+                    "ORDER BY updated_at DESC LIMIT ?",
+                    (like, like, args.limit),
+                ).fetchall()
+
+            def run_fts():
+                db.cursor.execute(
+                    "SELECT tickets.* FROM tickets JOIN tickets_fts ON tickets_fts.rowid = tickets.id "
+                    f"WHERE tickets_fts MATCH ? ORDER BY bm25(tickets_fts, {weights}) LIMIT ?",
+                    (store.fts_match_expression(q), args.limit),
+                ).fetchall()
+
+            like_ms = measure(run_like, args.repeat)["median_ms"]
+            fts_ms = measure(run_fts, args.repeat)["median_ms"]
+            print(f"  {q:<20}{like_ms:>10.2f}{fts_ms:>10.2f}")
+
+        db.pool.close_all()
+
+
+if __name__ == "__main__":
+    main()
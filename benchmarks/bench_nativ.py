@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Benchmark der Nativ‑Version (Flask‑SQLAlchemy) gegen eine SQLite‑Datei.
+
+Produktiv läuft Nativ auf Postgres; für reproduzierbare Läufe ohne Docker wird
+die Datenbank‑URI über ``create_app(config)`` auf eine temporäre SQLite‑Datei
+umgebogen.
+"""
+
+import os
+import tempfile
+
+from datagen import generate_tickets, generate_users
+from harness import NATIV_BACKEND, add_path, checked, measure, result
+
+add_path(NATIV_BACKEND)
+
+STATUS_MAP = {"Neu": "open", "In Bearbeitung": "in_progress", "Erledigt": "closed"}
+
+
+def load(db, size: int, mix, seed: int) -> None:
+    from src.models import Ticket, User
+
+    users = [{"username": "admin", "password": "password", "role": "admin"}] + [
+        {"username": name, "password": "x", "role": role} for name, role in generate_users()
+    ]
+    db.session.execute(db.insert(User), users)
+    ids = {u.username: u.id for u in db.session.execute(db.select(User.username, User.id))}
+
+    batch = []
+    for t in generate_tickets(size, mix, seed=seed):
+        batch.append(
+            {
+                "title": t["title"][:100],
+                "description": t["description"],
+                "status": STATUS_MAP[t["status"]],
+                "created_by": ids[t["created_by"]],
+                "assigned_to": ids.get(t["assigned_to"]),
+            }
+        )
+        if len(batch) >= 10_000:
+            db.session.execute(db.insert(Ticket), batch)
+            batch = []
+    if batch:
+        db.session.execute(db.insert(Ticket), batch)
+    db.session.commit()
+
+
+def run(size: int, repeat: int, mix, seed: int = 42) -> list[dict]:
+    from src.app_factory import create_app
+    from src.models import db
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        uri = f"sqlite:///{os.path.join(tmp, 'nativ.db')}"
+        app = create_app({"SQLALCHEMY_DATABASE_URI": uri, "TESTING": True})
+        with app.app_context():
+            db.create_all()
+            load(db, size, mix, seed)
+
+            client = app.test_client()
+            client.post("/login", data={"username": "admin", "password": "password"})
+
+            results.append(result("nativ", "dashboard", size, measure(checked(lambda: client.get("/")), repeat)))
+            results.append(result("nativ", "ticket_list", size, measure(checked(lambda: client.get("/tickets")), repeat)))
+            login = {"username": "admin", "password": "password"}
+            results.append(
+                result("nativ", "login", size, measure(checked(lambda: client.post("/login", data=login)), repeat * 10))
+            )
+            db.session.remove()
+            db.engine.dispose()
+    return results
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""Render‑Zeit des Nano‑Kanban‑Boards über ``streamlit.testing.v1.AppTest``.
+
+Gemessen wird mit dem Render‑Profil der App selbst (``render_profiler``): Zeit
+des Board‑Reruns ohne AppTest‑Overhead, dazu Widget‑Anzahl und Payload. Die
+Varianten laden 1 bzw. 4 Seiten je Spalte, damit sichtbar wird, wie die Kosten
+mit der Kartenzahl wachsen.
+"""
+
+import os
+import tempfile
+
+from datagen import generate_tickets
+from harness import NANO_SRC, add_path, result, summarize
+
+add_path(NANO_SRC)
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+import ticket_store as store  # noqa: E402
+
+APP = os.path.join(NANO_SRC, "app.py")
+
+
+def _profiles(at: AppTest, repeat: int) -> list[dict]:
+    at.session_state["render_profiles"] = []
+    for _ in range(repeat):
+        at.run()
+        if at.exception:
+            raise RuntimeError("\n".join([at.exception[0].message, *at.exception[0].stack_trace]))
+    return at.session_state["render_profiles"]
+
+
+def run(size: int, repeat: int, mix, seed: int = 42) -> list[dict]:
+    results = []
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        # Die App öffnet data/tickets.db relativ zum Arbeitsverzeichnis
+        os.chdir(tmp)
+        try:
+            db = store.TicketDatabase(store.DB_PATH, pool=store.ConnectionPool(store.DB_PATH))
+            db.import_tickets(generate_tickets(size, mix, seed=seed), create_users=True)
+            db.pool.close_all()
+
+            at = AppTest.from_file(APP, default_timeout=120)
+            at.session_state["username"] = "admin"
+            at.session_state["role"] = "Administrator"
+            at.session_state["render_profile"] = True
+            at.run()  # Warmup, setzt Filter und lädt die erste Seite je Spalte
+
+            for pages in (1, 4):
+                # Weitere Seiten wie per "Mehr laden" anfordern
+                for _ in range(pages - 1):
+                    at.session_state["board_more"] = {"Neu", "In Bearbeitung", "Erledigt"}
+                    at.run()
+                profiles = _profiles(at, repeat)
+                last = profiles[-1]
+                results.append(
+                    result(
+                        "render",
+                        f"board_{pages}_pages",
+                        size,
+                        summarize([p["Gesamt ms"] for p in profiles]),
+                        cards=last["Karten"],
+                        card_ms=last.get("card ms"),
+                        query_ms=last.get("query ms"),
+                        widgets=last["Widgets"],
+                        payload_kb=last["Payload KB"],
+                    )
+                )
+        finally:
+            os.chdir(cwd)
+    return results
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""Synthetische, reproduzierbare Ticket‑ und Benutzer‑Daten für die Benchmarks.
+
+Die Tickets haben realistische Texte (großer Füll‑Wortschatz, IT‑Fachbegriffe nur
+in einem kleinen Teil der Tickets), zeitlich gestreute Zeitstempel und eine
+konfigurierbare Verteilung von Status, Priorität und Kategorie.
+
+Als Skript erzeugt es JSONL, das ``Ticket_System_Nano/src/bulk.py`` importieren kann:
+
+    python benchmarks/datagen.py 100000 tickets.jsonl --status-mix "Neu=2,In Bearbeitung=1,Erledigt=7"
+"""
+
+import argparse
+import datetime
+import json
+import random
+import sys
+from dataclasses import dataclass, field
+
+STATUSES = ("Neu", "In Bearbeitung", "Erledigt")
+PRIORITIES = ("Niedrig", "Mittel", "Hoch")
+CATEGORIES = ("Bug", "Feature", "Support")
+
+DOMAIN_WORDS = (
+    "drucker netzwerk vpn passwort laptop monitor outlook teams server backup "
+    "fehler absturz langsam zugriff lizenz update installation tastatur maus "
+    "telefon headset freigabe ordner excel word browser zertifikat problem super"
+).split()
+
+
+def parse_mix(text: str, allowed: tuple[str, ...]) -> dict[str, float]:
+    """``"Neu=2,Erledigt=7"`` → Gewichte; nicht genannte Werte bekommen 0."""
+    weights = dict.fromkeys(allowed, 0.0)
+    for part in text.split(","):
+        name, _, value = part.partition("=")
+        name = name.strip()
+        if name not in weights:
+            raise ValueError(f"Unbekannter Wert '{name}' (erlaubt: {', '.join(allowed)})")
+        weights[name] = float(value)
+    if not any(weights.values()):
+        raise ValueError("Mindestens ein Gewicht muss > 0 sein")
+    return weights
+
+
+@dataclass
+class Mix:
+    """Verteilung der Tickets auf Status/Priorität/Kategorie (relative Gewichte)."""
+
+    status: dict = field(default_factory=lambda: {"Neu": 2, "In Bearbeitung": 1, "Erledigt": 7})
+    priority: dict = field(default_factory=lambda: {"Niedrig": 3, "Mittel": 5, "Hoch": 2})
+    category: dict = field(default_factory=lambda: {"Bug": 4, "Feature": 2, "Support": 4})
+    assigned_share: float = 0.8  # Anteil zugewiesener Tickets
+    domain_share: float = 0.05  # Anteil Tickets mit IT‑Fachbegriffen im Text
+
+    def to_dict(self) -> dict:
+        return {
+            "status": self.status,
+            "priority": self.priority,
+            "category": self.category,
+            "assigned_share": self.assigned_share,
+            "domain_share": self.domain_share,
+        }
+
+
+def generate_users(n_users: int = 200, n_support: int = 20) -> list[tuple[str, str]]:
+    """``(username, rolle)`` für Anwender und Support."""
+    return [(f"user{i}", "Anwender") for i in range(n_users)] + [
+        (f"support{i}", "Support") for i in range(n_support)
+    ]
+
+
+def generate_tickets(
+    n: int,
+    mix: Mix | None = None,
+    seed: int = 42,
+    n_users: int = 200,
+    n_support: int = 20,
+    start: datetime.datetime = datetime.datetime(2022, 1, 1),
+    span_days: int = 1_000,
+):
+    """``n`` Tickets als Dicts (Spalten wie ``ticket_store.IMPORT_COLUMNS``) streamen."""
+    mix = mix or Mix()
+    rnd = random.Random(seed)
+    filler = [
+        "".join(rnd.choices("abcdefghijklmnopqrstuvwxyz", k=rnd.randint(4, 10)))
+        for _ in range(20_000)
+    ]
+    statuses, status_w = zip(*mix.status.items())
+    priorities, priority_w = zip(*mix.priority.items())
+    categories, category_w = zip(*mix.category.items())
+    span = span_days * 86_400
+
+    for i in range(n):
+        words = rnd.choices(filler, k=25)
+        if rnd.random() < mix.domain_share:
+            words[rnd.randrange(len(words))] = rnd.choice(DOMAIN_WORDS)
+        status = rnd.choices(statuses, status_w)[0]
+        created = start + datetime.timedelta(seconds=rnd.randrange(span))
+        # Bearbeitungsdauer grob log‑verteilt: Minuten bis Wochen
+        updated = created + datetime.timedelta(seconds=int(rnd.lognormvariate(10, 1.5)))
+        assigned = f"support{rnd.randrange(n_support)}" if rnd.random() < mix.assigned_share else None
+        yield {
+            "title": " ".join(words[:3]) + f" #{i}",
+            "description": " ".join(words[3:]),
+            "priority": rnd.choices(priorities, priority_w)[0],
+            "category": rnd.choices(categories, category_w)[0],
+            "status": status,
+            "created_at": created.strftime("%Y-%m-%d %H:%M:%S"),
+            "updated_at": updated.strftime("%Y-%m-%d %H:%M:%S"),
+            "created_by": f"user{rnd.randrange(n_users)}",
+            "assigned_to": assigned,
+            "support_feedback": " ".join(rnd.choices(filler, k=8)) if status == "Erledigt" else None,
+        }
+
+
+def add_mix_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--status-mix", help='z. B. "Neu=2,In Bearbeitung=1,Erledigt=7"')
+    parser.add_argument("--priority-mix", help='z. B. "Niedrig=3,Mittel=5,Hoch=2"')
+    parser.add_argument("--category-mix", help='z. B. "Bug=4,Feature=2,Support=4"')
+    parser.add_argument("--seed", type=int, default=42)
+
+
+def mix_from_args(args: argparse.Namespace) -> Mix:
+    mix = Mix()
+    if args.status_mix:
+        mix.status = parse_mix(args.status_mix, STATUSES)
+    if args.priority_mix:
+        mix.priority = parse_mix(args.priority_mix, PRIORITIES)
+    if args.category_mix:
+        mix.category = parse_mix(args.category_mix, CATEGORIES)
+    return mix
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("count", type=int)
+    parser.add_argument("out", help="JSONL‑Datei oder '-' für stdout")
+    add_mix_arguments(parser)
+    args = parser.parse_args()
+
+    out = sys.stdout if args.out == "-" else open(args.out, "w", encoding="utf-8")
+    with out:
+        for ticket in generate_tickets(args.count, mix_from_args(args), seed=args.seed):
+            out.write(json.dumps(ticket, ensure_ascii=False) + "\n")
+
+
+if __name__ == "__main__":
+    main()
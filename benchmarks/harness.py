@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""Gemeinsame Messhilfen der Benchmark‑Suite."""
+
+import os
+import statistics
+import sys
+import threading
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+NANO_SRC = os.path.join(ROOT, "Ticket_System_Nano", "src")
+MICRO_DIR = os.path.join(ROOT, "Ticket_System_Micro")
+NATIV_BACKEND = os.path.join(ROOT, "Ticket_System_Nativ", "backend")
+
+
+def add_path(path: str) -> None:
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+def measure(fn, repeat: int = 5, warmup: int = 1) -> dict:
+    """``fn`` wiederholt ausführen; Kennzahlen in Millisekunden."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return summarize(samples)
+
+
+def measure_concurrent(make_call, threads: int = 8, requests: int = 100) -> dict:
+    """Je Thread ``requests`` Aufrufe gleichzeitig; Latenz‑Kennzahlen plus Durchsatz (``rps``).
+
+    ``make_call()`` liefert pro Thread die aufzurufende Funktion (z. B. mit eigenem Testclient).
+    """
+    calls = [make_call() for _ in range(threads)]
+    samples: list[float] = []
+    errors: list[BaseException] = []
+    start = threading.Barrier(threads + 1)
+
+    def worker(call) -> None:
+        local = []
+        start.wait()
+        try:
+            for _ in range(requests):
+                t0 = time.perf_counter()
+                call()
+                local.append((time.perf_counter() - t0) * 1000)
+        except BaseException as e:  # im Hauptthread erneut werfen
+            errors.append(e)
+        samples.extend(local)
+
+    workers = [threading.Thread(target=worker, args=(call,)) for call in calls]
+    for t in workers:
+        t.start()
+    start.wait()
+    t0 = time.perf_counter()
+    for t in workers:
+        t.join()
+    elapsed = time.perf_counter() - t0
+    if errors:
+        raise errors[0]
+    return {**summarize(samples), "threads": threads, "rps": round(len(samples) / elapsed, 1)}
+
+
+def summarize(samples: list[float]) -> dict:
+    """Median/p95/Min/Max einer Liste von Millisekunden‑Werten."""
+    samples = sorted(samples)
+    return {
+        "runs": len(samples),
+        "median_ms": round(statistics.median(samples), 4),
+        "min_ms": round(samples[0], 4),
+        "p95_ms": round(samples[min(len(samples) - 1, int(round(0.95 * (len(samples) - 1))))], 4),
+        "max_ms": round(samples[-1], 4),
+    }
+
+
+def checked(call):
+    """HTTP‑Aufruf des Testclients, der bei Fehlerstatus abbricht statt Fehlerseiten zu messen."""
+
+    def run():
+        response = call()
+        if response.status_code >= 400:
+            raise RuntimeError(f"HTTP {response.status_code}: {response.request.path}")
+        return response
+
+    return run
+
+
+def result(backend: str, operation: str, size: int, stats: dict, **extra) -> dict:
+    return {"backend": backend, "operation": operation, "size": size, **stats, **extra}
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""Reproduzierbare Benchmark‑Suite über Nano, Micro, Nativ und das Streamlit‑Board.
+
+Aufruf (aus dem Repo‑Root):
+
+    python benchmarks/run_all.py                              # 10k und 100k Tickets
+    python benchmarks/run_all.py --sizes 10000 100000 1000000 --out results.json
+    python benchmarks/run_all.py --backends nano --status-mix "Neu=5,Erledigt=5"
+    python benchmarks/run_all.py --backends render            # Streamlit‑Board
+    python benchmarks/run_all.py --out neu.json --compare baseline.json --threshold 0.2
+
+Alle Läufe nutzen denselben Datengenerator (``datagen.py``) mit festem Seed.
+Das Ergebnis‑JSON enthält Metadaten (Python/SQLite‑Version, Git‑Commit, Mix)
+und je Backend/Operation/Größe Median und p95 in Millisekunden. Mit
+``--compare`` endet das Skript mit Exit‑Code 1, wenn eine Operation um mehr
+als ``--threshold`` (relativ) langsamer geworden ist.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import sqlite3
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from datagen import add_mix_arguments, mix_from_args  # noqa: E402
+from harness import ROOT  # noqa: E402
+
+BACKENDS = ("nano", "micro", "nativ", "render")
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _runner(backend: str):
+    if backend == "nano":
+        import bench_nano as module
+    elif backend == "micro":
+        import bench_micro as module
+    elif backend == "render":
+        import bench_render as module
+    else:
+        import bench_nativ as module
+    return module.run
+
+
+def compare(results: list[dict], baseline: list[dict], threshold: float) -> list[str]:
+    """Regressionen gegenüber ``baseline`` als lesbare Zeilen."""
+    base = {(r["backend"], r["operation"], r["size"]): r["median_ms"] for r in baseline}
+    regressions = []
+    for r in results:
+        old = base.get((r["backend"], r["operation"], r["size"]))
+        if old and r["median_ms"] > old * (1 + threshold):
+            regressions.append(
+                f"{r['backend']}/{r['operation']}@{r['size']:,}: "
+                f"{old:.2f} → {r['median_ms']:.2f} ms (+{(r['median_ms'] / old - 1) * 100:.0f} %)"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", nargs="+", type=int, default=[10_000, 100_000])
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--out", help="Ergebnis als JSON speichern")
+    parser.add_argument("--compare", help="Baseline‑JSON für den Regressions‑Check")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    add_mix_arguments(parser)
+    args = parser.parse_args()
+    mix = mix_from_args(args)
+
+    results = []
+    for backend in args.backends:
+        run = _runner(backend)
+        for size in args.sizes:
+            print(f"{backend}: {size:,} Tickets …", file=sys.stderr)
+            results.extend(run(size, args.repeat, mix, seed=args.seed))
+
+    print(f"\n{'Backend':<8}{'Operation':<24}{'Tickets':>10}{'Median ms':>12}{'p95 ms':>10}{'req/s':>10}")
+    for r in results:
+        rps = f"{r['rps']:>10,.0f}" if "rps" in r else ""
+        print(f"{r['backend']:<8}{r['operation']:<24}{r['size']:>10,}{r['median_ms']:>12.2f}{r['p95_ms']:>10.2f}{rps}")
+
+    report = {
+        "meta": {
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "mix": mix.to_dict(),
+        },
+        "results": results,
+    }
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2, ensure_ascii=False)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            baseline = json.load(fh)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("\nRegressionen:", *regressions, sep="\n  ", file=sys.stderr)
+            sys.exit(1)
+        print("\nKeine Regressionen gegenüber der Baseline.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
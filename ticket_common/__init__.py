@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+"""Gemeinsamer Code der drei Ticket‑Systeme (liegt in der Repo‑Wurzel)."""
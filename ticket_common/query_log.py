@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""Laufzeit‑Messung der SQL‑Statements, gemeinsam für Nano, Micro und Nativ.
+
+``QueryLog`` sammelt Laufzeiten je Statement, Methode oder Route samt
+Perzentilen und Slow‑Log. Für sqlite3 misst ``ProfiledConnection`` jedes
+Statement (Ausführen + Abholen der Zeilen); Statements über der Schwelle
+``slow_ms`` landen zusätzlich mit ``EXPLAIN QUERY PLAN`` im Slow‑Log. Nativ
+speist dasselbe Log über SQLAlchemy‑Events (``src/utils.py``).
+"""
+
+import datetime
+import json
+import sqlite3
+import threading
+import time
+from collections import deque
+
+# Statements, für die EXPLAIN QUERY PLAN sinnvoll ist
+_EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE", "INSERT", "REPLACE")
+
+
+def normalize_sql(sql: str) -> str:
+    """Whitespace zusammenfassen, damit gleiche Statements zusammen gezählt werden."""
+    return " ".join(sql.split())
+
+
+def _percentile(sorted_samples: list[float], pct: float) -> float:
+    """Nearest‑Rank‑Perzentil einer aufsteigend sortierten Liste."""
+    if not sorted_samples:
+        return 0.0
+    index = max(0, min(len(sorted_samples) - 1, round(pct / 100 * len(sorted_samples)) - 1))
+    return sorted_samples[index]
+
+
+class _Entry:
+    __slots__ = ("kind", "calls", "rows", "total", "max", "samples")
+
+    def __init__(self, kind: str, max_samples: int):
+        self.kind = kind
+        self.calls = 0
+        self.rows = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: deque[float] = deque(maxlen=max_samples)
+
+
+class QueryLog:
+    """Sammelt Laufzeiten je Statement/Methode und die langsamsten Statements.
+
+    Perzentile werden über die letzten ``samples`` Messwerte je Eintrag
+    gebildet; ``samples=0`` schaltet die Messung ab.
+    """
+
+    def __init__(self, slow_ms: float = 100.0, samples: int = 1024, slow_entries: int = 200):
+        self.slow_ms = slow_ms
+        self.max_samples = samples
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, str], _Entry] = {}
+        self._slow: deque[dict] = deque(maxlen=slow_entries)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_samples > 0
+
+    def record(self, kind: str, name: str, seconds: float, rows: int = 0) -> None:
+        with self._lock:
+            entry = self._entries.get((kind, name))
+            if entry is None:
+                entry = self._entries[(kind, name)] = _Entry(kind, self.max_samples)
+            entry.calls += 1
+            entry.rows += max(rows, 0)
+            entry.total += seconds
+            entry.max = max(entry.max, seconds)
+            entry.samples.append(seconds)
+
+    def record_slow(self, sql: str, params, seconds: float, rows: int, plan: list[str]) -> None:
+        with self._lock:
+            self._slow.append(
+                {
+                    "at": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    "ms": round(seconds * 1000, 2),
+                    "rows": rows,
+                    "sql": sql,
+                    "params": "(executemany)" if params is None else repr(params)[:200],
+                    "plan": plan,
+                }
+            )
+
+    def stats(self) -> list[dict]:
+        """Kennzahlen je Eintrag, teuerste (Gesamtzeit) zuerst."""
+        with self._lock:
+            items = [(key, e, sorted(e.samples)) for key, e in self._entries.items()]
+        rows = []
+        for (kind, name), e, samples in items:
+            rows.append(
+                {
+                    "kind": kind,
+                    "name": name,
+                    "calls": e.calls,
+                    "rows": e.rows,
+                    "total_ms": round(e.total * 1000, 2),
+                    "p50_ms": round(_percentile(samples, 50) * 1000, 3),
+                    "p90_ms": round(_percentile(samples, 90) * 1000, 3),
+                    "p99_ms": round(_percentile(samples, 99) * 1000, 3),
+                    "max_ms": round(e.max * 1000, 3),
+                }
+            )
+        rows.sort(key=lambda r: r["total_ms"], reverse=True)
+        return rows
+
+    def slow(self) -> list[dict]:
+        """Slow‑Log, neueste zuerst."""
+        with self._lock:
+            return list(reversed(self._slow))
+
+    def snapshot(self) -> dict:
+        return {
+            "generated_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            "slow_ms": self.slow_ms,
+            "stats": self.stats(),
+            "slow": self.slow(),
+        }
+
+    def dump(self, path: str) -> None:
+        """Kennzahlen und Slow‑Log als JSON in ``path`` schreiben."""
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(self.snapshot(), fh, indent=2, ensure_ascii=False)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._slow.clear()
+
+
+# -------------------------------------------------
+# SQLite‑Anbindung
+# -------------------------------------------------
+def explain(conn: sqlite3.Connection, sql: str, params=()) -> list[str]:
+    """``EXPLAIN QUERY PLAN`` als eingerückte Textzeilen (leer, wenn nicht erklärbar)."""
+    if not sql.lstrip().upper().startswith(_EXPLAINABLE):
+        return []
+    try:
+        # Eigener, ungemessener Cursor – der Ergebnis‑Cursor des Aufrufers bleibt intakt
+        rows = sqlite3.Cursor(conn).execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    except sqlite3.Error as e:
+        return [f"(kein Plan: {e})"]
+    depth = {0: -1}
+    lines = []
+    for node_id, parent, _, detail in rows:
+        depth[node_id] = depth.get(parent, -1) + 1
+        lines.append("  " * depth[node_id] + detail)
+    return lines
+
+
+class ProfiledCursor(sqlite3.Cursor):
+    """Cursor, der Ausführen und Abholen eines Statements zusammen misst.
+
+    Ein SELECT gilt als abgeschlossen, sobald alle Zeilen geholt wurden, der
+    Cursor neu ausgeführt oder geschlossen wird; Schreib‑Statements sofort.
+    """
+
+    _pending = None  # [sql, params, seconds, rows]
+
+    def _finish(self) -> None:
+        pending, self._pending = self._pending, None
+        if pending is None:
+            return
+        sql, params, seconds, rows = pending
+        log: QueryLog = self.connection.query_log
+        name = normalize_sql(sql)
+        log.record("sql", name, seconds, rows)
+        if seconds * 1000 >= log.slow_ms:
+            # executemany: kein einzelner Parametersatz für den Plan
+            plan = explain(self.connection, sql, params) if params is not None else []
+            log.record_slow(name, params, seconds, rows, plan)
+
+    def execute(self, sql, parameters=()):
+        self._finish()
+        started = time.perf_counter()
+        super().execute(sql, parameters)
+        self._pending = [sql, parameters, time.perf_counter() - started, 0]
+        if self.description is None:
+            self._pending[3] = max(self.rowcount, 0)
+            self._finish()
+        return self
+
+    def executemany(self, sql, seq_of_parameters):
+        self._finish()
+        started = time.perf_counter()
+        super().executemany(sql, seq_of_parameters)
+        self._pending = [sql, None, time.perf_counter() - started, max(self.rowcount, 0)]
+        self._finish()
+        return self
+
+    def _fetched(self, started: float, rows: int, done: bool) -> None:
+        if self._pending is None:
+            return
+        self._pending[2] += time.perf_counter() - started
+        self._pending[3] += rows
+        if done:
+            self._finish()
+
+    def fetchone(self):
+        started = time.perf_counter()
+        row = super().fetchone()
+        self._fetched(started, row is not None, row is None)
+        return row
+
+    def fetchmany(self, size=None):
+        size = self.arraysize if size is None else size
+        started = time.perf_counter()
+        rows = super().fetchmany(size)
+        self._fetched(started, len(rows), len(rows) < size)
+        return rows
+
+    def fetchall(self):
+        started = time.perf_counter()
+        rows = super().fetchall()
+        self._fetched(started, len(rows), True)
+        return rows
+
+    def close(self):
+        self._finish()
+        super().close()
+
+
+class ProfiledConnection(sqlite3.Connection):
+    """``sqlite3.connect(..., factory=ProfiledConnection)``; danach ``query_log`` setzen."""
+
+    query_log: QueryLog
+
+    def cursor(self, factory=ProfiledCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+